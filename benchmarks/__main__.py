@@ -0,0 +1,88 @@
+import argparse
+import json
+import os
+import sys
+from benchmarks.suite import Benchmark, compare
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main() -> int:
+    """
+    Ejecuta las mediciones desde la línea de comandos: `python -m benchmarks`.
+
+    Returns:
+        int: Código de salida (1 si alguna medición empeoró más que el umbral).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Mide el motor de combate, la búsqueda de la IA y el arranque de la "
+        "pantalla de selección, sin ventana ni red.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="repeticiones de cada medición"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="menos iteraciones por repetición, para una prueba rápida",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        help="prefijos de las mediciones a ejecutar (por ejemplo, enemy.choose_attack)",
+    )
+    parser.add_argument("--output", help="archivo JSON donde se guardan los resultados")
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE,
+        help="resultados de referencia con los que se compara (por defecto, benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="empeoramiento máximo tolerado, como fracción (0.10 es un 10 %%)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="guarda los resultados como nueva referencia en lugar de compararlos",
+    )
+    args = parser.parse_args()
+
+    results = Benchmark(repeat=args.repeat, quick=args.quick).run(only=args.only)
+
+    for name, result in results["results"].items():
+        print(f"{name:36} {result['value']:14.3f} {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+        print(f"Referencia guardada en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No hay resultados de referencia en {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    regressions = compare(results=results, baseline=baseline, threshold=args.threshold)
+    if regressions:
+        print(f"Regresiones de más del {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"Sin regresiones de más del {args.threshold:.0%} respecto de la referencia")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,462 @@
+import gc
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable
+from src.combat.combat import Combat, CombatState
+from src.combat.damage_table import DamageTable
+from src.dataset.dataset import Dataset
+from src.pokemon.pokemon import Pokemon
+from src.trainers.enemy.ia import Enemy
+from src.trainers.trainers import Player
+
+# Equipos fijos de la Pokédex (jugador, IA), para que todas las ejecuciones midan lo mismo
+TEAMS = (
+    (
+        ("Venusaur", "Pikachu", "Machamp", "Gengar", "Snorlax"),
+        ("Charizard", "Blastoise", "Alakazam", "Golem", "Dragonite"),
+    ),
+    (
+        ("Gyarados", "Arcanine", "Exeggutor", "Hitmonlee", "Jolteon"),
+        ("Lapras", "Nidoking", "Clefable", "Rhydon", "Flareon"),
+    ),
+    (
+        ("Raichu", "Ninetales", "Hitmonchan", "Vaporeon", "Golem"),
+        ("Dragonite", "Gengar", "Snorlax", "Venusaur", "Pikachu"),
+    ),
+)
+
+SEED = 1234
+SEARCH_DEPTHS = range(1, 7)
+# Límite de ataques por combate: algunos emparejamientos no se hacen daño y no terminarían nunca
+MAX_TURNS = 500
+# Programa que abre la pantalla de selección en un proceso nuevo (sin ventana real y sin cargar
+# imágenes) y escribe los milisegundos hasta el primer cuadro, contando las importaciones
+FIRST_FRAME_SCRIPT = """
+import time
+started = time.perf_counter()
+from src.ui.select_pokemon_ui import PokemonSelectionScreen
+screen = PokemonSelectionScreen()
+screen.image_loader.download_image = lambda name: None
+screen.run(max_frames=1)
+print((screen.started + screen.first_frame_time - started) * 1000)
+"""
+
+
+class Benchmark:
+    """
+    Ejecuta las mediciones del motor de combate, de la búsqueda de la IA y del arranque de la
+    pantalla de selección, sin ventana ni red.
+
+    Cada medición se repite varias veces y se reporta la mediana, que es menos sensible a las
+    interrupciones del sistema que el promedio. Los generadores aleatorios se reinician con una
+    semilla fija antes de cada medición.
+
+    Atributos:
+        repeat (int): Repeticiones de cada medición.
+        quick (bool): Si es True, se hacen menos iteraciones por repetición (para pruebas rápidas).
+        teams (list[tuple[list[Pokemon], list[Pokemon]]]): Equipos fijos (jugador, IA).
+        damage_table (DamageTable): Tablas de daño de toda la Pokédex, como en el juego.
+    """
+
+    def __init__(self, repeat: int = 5, quick: bool = False):
+        """
+        Carga la Pokédex y prepara los equipos fijos.
+
+        Args:
+            repeat (int): Repeticiones de cada medición.
+            quick (bool): Si es True, se hacen menos iteraciones por repetición.
+        """
+        self.repeat = repeat
+        self.quick = quick
+        # Tiempo acumulado por las mediciones que solo cuentan una parte de su trabajo
+        self.__timed = 0.0
+
+        dataset = Dataset()
+        self.teams = [
+            (
+                [Pokemon(dataset.get_pokemon_by_name(name)) for name in player],
+                [Pokemon(dataset.get_pokemon_by_name(name)) for name in enemy],
+            )
+            for player, enemy in TEAMS
+        ]
+        self.damage_table = DamageTable(
+            roster=[Pokemon(data) for data in dataset.get_all_pokemon()],
+            level=Combat.DEFAULT_POKEMON_LEVEL,
+        )
+
+    def run(self, only: list[str] | None = None) -> dict:
+        """
+        Ejecuta todas las mediciones (o solo las indicadas).
+
+        Args:
+            only (list[str] | None): Prefijos de los nombres de las mediciones a ejecutar.
+
+        Returns:
+            dict: Información del entorno y resultado de cada medición, por nombre.
+        """
+        cases: list[tuple[str, Callable[[], dict]]] = [
+            ("combat.calculate_damage", self.bench_calculate_damage),
+            ("combat.set_attack", self.bench_set_attack),
+            *(
+                (f"enemy.choose_attack.depth_{depth}", self.__latency_case(depth))
+                for depth in SEARCH_DEPTHS
+            ),
+            ("battle.full", self.bench_full_battle),
+            ("startup.first_frame", self.bench_first_frame),
+        ]
+
+        results = {}
+        for name, case in cases:
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+
+            # Como en timeit, el recolector de basura se desactiva para que sus pausas no se
+            # sumen a una medición cualquiera
+            gc.collect()
+            gc.disable()
+            try:
+                results[name] = case()
+            finally:
+                gc.enable()
+
+        return {"meta": self.get_environment(), "results": results}
+
+    def get_environment(self) -> dict:
+        """
+        Obtiene los datos del entorno de la ejecución, para saber si dos resultados son comparables.
+
+        Returns:
+            dict: Versión de Python, plataforma, procesador y parámetros de la ejecución.
+        """
+        return {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": self.repeat,
+            "quick": self.quick,
+            "seed": SEED,
+        }
+
+    def bench_calculate_damage(self) -> dict:
+        """
+        Mide cuántos cálculos de daño por segundo hace `Combat.calculate_damage`.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        calls = 2_000 if self.quick else 20_000
+        combats = [self.__new_combat(player, enemy) for player, enemy in self.teams]
+        jobs = []
+        for combat in combats:
+            player, enemy = combat.get_players()
+            attacker = player.get_current_pokemon()
+            for attack in (
+                attacker.get_move_1_name(),
+                attacker.get_move_2_name(),
+                attacker.get_super_move_name(),
+            ):
+                jobs.append((combat, player, enemy, attack))
+
+        def case() -> int:
+            for i in range(calls):
+                combat, player, enemy, attack = jobs[i % len(jobs)]
+                combat.calculate_damage(
+                    current_trainer=player, next_trainer=enemy, attack=attack
+                )
+            return calls
+
+        return self.__throughput(case, unit="calls/s")
+
+    def bench_set_attack(self) -> dict:
+        """
+        Mide cuántos ataques por segundo aplica `Combat.set_attack`, jugando combates completos
+        con ataques elegidos al azar por ambos entrenadores.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        battles = 5 if self.quick else 50
+
+        def case() -> int:
+            attacks = 0
+            rng = random.Random(SEED)
+            for i in range(battles):
+                combat = self.__new_combat(*self.teams[i % len(self.teams)])
+                started = time.perf_counter()
+                attacks += self.__play(combat, rng)
+                self.__timed += time.perf_counter() - started
+            return attacks
+
+        # Solo se cuenta el tiempo de los ataques, no el de crear los combates
+        return self.__throughput(case, unit="attacks/s", timed_inside=True)
+
+    def bench_choose_attack(self, depth: int) -> dict:
+        """
+        Mide cuánto tarda `Enemy.choose_attack` en elegir el primer ataque de cada combate fijo.
+
+        Cada llamada usa un enemigo nuevo, con la tabla de transposición vacía, y sin la tabla
+        de finales, para medir solo la búsqueda. Como cada búsqueda tarda muy poco, cada posición
+        se mide varias veces por repetición, después de una pasada sin medir.
+
+        Args:
+            depth (int): Profundidad de búsqueda.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        calls = 2 if self.quick else 10
+        samples = []
+        nodes = []
+        attacks = []
+        for repetition in range(self.repeat + 1):
+            for player, enemy in self.teams:
+                for _ in range(calls):
+                    self.__seed()
+                    combat = self.__new_combat(
+                        player, enemy, depth=depth, tablebase_size=0
+                    )
+                    ai = combat.get_players()[1]
+                    started = time.perf_counter()
+                    attack, stats = ai.choose_attack_with_stats(combat=combat)
+                    elapsed = time.perf_counter() - started
+
+                    # La primera repetición solo calienta las cachés
+                    if repetition == 0:
+                        nodes.append(stats.nodes)
+                        attacks.append(attack)
+                        break
+                    samples.append(elapsed)
+
+        return {
+            "value": statistics.median(samples) * 1000,
+            "unit": "ms",
+            "higher_is_better": False,
+            "p95": self.__percentile(samples, 0.95) * 1000,
+            "samples": len(samples),
+            # El recorrido del árbol es determinista: si cambian los nodos o los ataques, cambió la IA
+            "nodes": nodes,
+            "attacks": attacks,
+        }
+
+    def bench_full_battle(self) -> dict:
+        """
+        Mide cuánto tarda un combate completo entre la IA (con sus opciones por defecto) y un
+        jugador que elige sus ataques al azar con una semilla fija.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        samples = []
+        outcomes = []
+        for _ in range(self.repeat):
+            for player, enemy in self.teams:
+                self.__seed()
+                rng = random.Random(SEED)
+                started = time.perf_counter()
+                combat = self.__new_combat(player, enemy)
+                turns = self.__play(combat, rng, enemy_ai=True)
+                samples.append(time.perf_counter() - started)
+                outcomes.append((combat.get_winner(), turns))
+
+        return {
+            "value": statistics.median(samples) * 1000,
+            "unit": "ms",
+            "higher_is_better": False,
+            "p95": self.__percentile(samples, 0.95) * 1000,
+            "samples": len(samples),
+            "outcomes": outcomes[: len(self.teams)],
+        }
+
+    def bench_first_frame(self) -> dict:
+        """
+        Mide cuánto tarda en aparecer el primer cuadro de la pantalla de selección en un proceso
+        nuevo, contando la importación de los módulos. Se usa el controlador de video de SDL que
+        no abre ventanas y no se descargan las imágenes de los Pokémon.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        environment = {
+            **os.environ,
+            "SDL_VIDEODRIVER": "dummy",
+            "SDL_AUDIODRIVER": "dummy",
+        }
+        samples = []
+        for repetition in range(self.repeat + 1):
+            process = subprocess.run(
+                [sys.executable, "-c", FIRST_FRAME_SCRIPT],
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                env=environment,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            # La primera ejecución solo calienta las cachés del sistema y del juego
+            if repetition > 0:
+                samples.append(float(process.stdout.split()[-1]))
+
+        return {
+            "value": statistics.median(samples),
+            "unit": "ms",
+            "higher_is_better": False,
+            "p95": self.__percentile(samples, 0.95),
+            "samples": len(samples),
+        }
+
+    def __latency_case(self, depth: int) -> Callable[[], dict]:
+        """
+        Crea la medición de latencia de la IA para una profundidad.
+
+        Args:
+            depth (int): Profundidad de búsqueda.
+
+        Returns:
+            Callable[[], dict]: Función que ejecuta la medición.
+        """
+        return lambda: self.bench_choose_attack(depth)
+
+    def __new_combat(
+        self, player: list[Pokemon], enemy: list[Pokemon], **options
+    ) -> Combat:
+        """
+        Crea un combate nuevo entre dos equipos, con las tablas de daño de toda la Pokédex.
+
+        Args:
+            player (list[Pokemon]): Pokémon del jugador.
+            enemy (list[Pokemon]): Pokémon de la IA.
+            **options: Opciones de búsqueda de la IA.
+
+        Returns:
+            Combat: Combate listo para empezar.
+        """
+        return Combat(
+            Player(player), Enemy(enemy, **options), damage_table=self.damage_table
+        )
+
+    def __play(self, combat: Combat, rng: random.Random, enemy_ai: bool = False) -> int:
+        """
+        Juega un combate hasta que haya un ganador o se alcance `MAX_TURNS`.
+
+        Args:
+            combat (Combat): Combate a jugar.
+            rng (random.Random): Generador con el que se eligen los ataques al azar.
+            enemy_ai (bool): Si es True, la IA elige sus ataques con su búsqueda; si no, al azar.
+
+        Returns:
+            int: Cantidad de ataques realizados.
+        """
+        turns = 0
+        while combat.get_state() != CombatState.WINNER and turns < MAX_TURNS:
+            if enemy_ai and combat.get_state() == CombatState.ENEMY_TURN:
+                combat.enemy_set_attack()
+            else:
+                trainer = combat.get_players()[
+                    0 if combat.get_state() == CombatState.PLAYER_TURN else 1
+                ]
+                pokemon = trainer.get_current_pokemon()
+                combat.set_attack(
+                    attack=rng.choice(
+                        [
+                            pokemon.get_move_1_name(),
+                            pokemon.get_move_2_name(),
+                            pokemon.get_super_move_name(),
+                        ]
+                    )
+                )
+            turns += 1
+
+        return turns
+
+    def __throughput(
+        self, case: Callable[[], int], unit: str, timed_inside: bool = False
+    ) -> dict:
+        """
+        Mide las operaciones por segundo de una función, repitiéndola `repeat` veces.
+
+        Args:
+            case (Callable[[], int]): Función que realiza el trabajo y retorna cuántas operaciones hizo.
+            unit (str): Unidad del resultado.
+            timed_inside (bool): Si es True, la función acumula en `__timed` el tiempo que
+                debe contarse, en lugar de medir la llamada completa.
+
+        Returns:
+            dict: Resultado de la medición.
+        """
+        rates = []
+        for _ in range(self.repeat):
+            self.__seed()
+            self.__timed = 0.0
+            started = time.perf_counter()
+            operations = case()
+            elapsed = self.__timed if timed_inside else time.perf_counter() - started
+            rates.append(operations / elapsed)
+
+        return {
+            "value": statistics.median(rates),
+            "unit": unit,
+            "higher_is_better": True,
+            "min": min(rates),
+            "max": max(rates),
+            "operations": operations,
+        }
+
+    def __seed(self) -> None:
+        """
+        Reinicia el generador aleatorio global, que usa el combate para desempatar velocidades.
+        """
+        random.seed(SEED)
+
+    @staticmethod
+    def __percentile(samples: list[float], fraction: float) -> float:
+        """
+        Calcula un percentil de las muestras (el valor más cercano, sin interpolar).
+
+        Args:
+            samples (list[float]): Muestras medidas.
+            fraction (float): Percentil entre 0 y 1.
+
+        Returns:
+            float: Valor del percentil.
+        """
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compara los resultados con una ejecución de referencia y reporta las regresiones.
+
+    Una medición tiene una regresión si empeora más que `threshold` (una fracción: 0.1 es un
+    10 %) respecto de la referencia, según si para ella es mejor un valor alto o uno bajo.
+
+    Args:
+        results (dict): Resultados de la ejecución actual, con el formato de `Benchmark.run`.
+        baseline (dict): Resultados de referencia, con el mismo formato.
+        threshold (float): Empeoramiento máximo tolerado.
+
+    Returns:
+        list[str]: Descripción de cada regresión (vacía si no hay ninguna).
+    """
+    regressions = []
+    for name, current in results["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+
+        if current["higher_is_better"]:
+            change = (reference["value"] - current["value"]) / reference["value"]
+        else:
+            change = (current["value"] - reference["value"]) / reference["value"]
+
+        if change > threshold:
+            regressions.append(
+                f"{name}: {current['value']:.3f} {current['unit']} "
+                f"(referencia {reference['value']:.3f}, {change:.1%} peor)"
+            )
+
+    return regressions
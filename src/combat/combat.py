@@ -1,8 +1,10 @@
 from enum import Enum
 import random
 from typing import TYPE_CHECKING
+from src.combat.damage_table import DamageTable
+from src.pokemon.pokemon import Pokemon
 from src.trainers.trainers import Player, Trainer
-from src.utils.effectiveness import effectiveness
+from src.utils.effectiveness import TYPE_CHART
 
 if TYPE_CHECKING:
     from src.trainers.enemy.ia import Enemy
@@ -28,23 +30,36 @@ class Combat:
         __players (tuple[Player, Enemy]): Tupla con el jugador y el enemigo.
         __current_attack (str): Nombre del ataque actual.
         __winner (str | None): Nombre del ganador, si existe.
+        __damage_table (DamageTable): Daño y efectividad precalculados de los Pokémon del combate.
         DEFAULT_POKEMON_LEVEL (int): Nivel por defecto de los Pokémon en combate.
     """
 
-    def __init__(self, player: Player, enemy: "Enemy"):
+    DEFAULT_POKEMON_LEVEL = 20
+
+    def __init__(
+        self,
+        player: Player,
+        enemy: "Enemy",
+        damage_table: DamageTable | None = None,
+    ):
         """
         Inicializa el combate entre el jugador y el enemigo.
 
         Args:
             player (Player): Instancia del jugador.
             enemy (Enemy): Instancia del enemigo.
+            damage_table (DamageTable | None): Tablas precalculadas (por ejemplo, de toda la Pokédex).
+                Si es None, se construyen solo para los Pokémon de ambos equipos.
         """
         self.__state = CombatState.START
         self.__players = (player, enemy)
         self.__current_attack = ""
         self.__winner = None
         self.__next_turn()
-        self.DEFAULT_POKEMON_LEVEL = 20
+        self.__damage_table = damage_table or DamageTable(
+            roster=[*player.get_pokemon(), *enemy.get_pokemon()],
+            level=self.DEFAULT_POKEMON_LEVEL,
+        )
 
     def __next_turn(self) -> None:
         """
@@ -145,6 +160,15 @@ class Combat:
         self.__turn = 0
         self.__state = CombatState.PLAYER_TURN
 
+    def get_damage_table(self) -> DamageTable:
+        """
+        Obtiene las tablas precalculadas de daño y efectividad del combate.
+
+        Returns:
+            DamageTable: Tablas de daño y efectividad.
+        """
+        return self.__damage_table
+
     def get_winner(self) -> str | None:
         """
         Devuelve el nombre del ganador si existe.
@@ -196,41 +220,62 @@ class Combat:
         Returns:
             float: Multiplicador de efectividad.
         """
-        # Inicializa la efectividad en 0
-        efectivity = 0
-        # Obtiene los tipos del Pokémon actual y del siguiente (pueden ser uno o dos tipos)
-        current_type_1 = current_trainer.get_current_pokemon().get_type_1()
-        current_type_2 = current_trainer.get_current_pokemon().get_type_2()
-        next_type_1 = next_trainer.get_current_pokemon().get_type_1()
-        next_type_2 = next_trainer.get_current_pokemon().get_type_2()
+        return self.calculate_pokemon_effectiveness(
+            attacker=current_trainer.get_current_pokemon(),
+            defender=next_trainer.get_current_pokemon(),
+            attack=attack,
+        )
+
+    def calculate_pokemon_effectiveness(
+        self, attacker: Pokemon, defender: Pokemon, attack: str
+    ) -> float:
+        """
+        Calcula la efectividad del ataque entre dos Pokémon concretos, sin depender de los entrenadores.
+
+        Args:
+            attacker (Pokemon): Pokémon que realiza el ataque.
+            defender (Pokemon): Pokémon que recibe el ataque.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            float: Multiplicador de efectividad.
+        """
+        # Si la combinación está precalculada, se usa el valor de la tabla
+        precalculated = self.__damage_table.get_effectiveness(
+            attacker=attacker, defender=defender, attack=attack
+        )
+        if precalculated is not None:
+            return precalculated
+
+        # Se obtienen los identificadores de los tipos del Pokémon atacante y del defensor (pueden
+        # ser uno o dos tipos), ya resueltos en cada Pokémon para usar la tabla compilada
+        current_type_1 = attacker.get_type_1_id()
+        current_type_2 = attacker.get_type_2_id()
+        next_type_1 = defender.get_type_1_id()
+        next_type_2 = defender.get_type_2_id()
 
         # Caso 1: ambos Pokémon tienen solo un tipo
         if current_type_2 is None and next_type_2 is None:
-            efectivity = effectiveness.get(current_type_1, {}).get(next_type_1, 1.0)
+            return TYPE_CHART.item(current_type_1, next_type_1)
 
         # Caso 2: el atacante tiene dos tipos y el defensor uno
         if current_type_2 is not None and next_type_2 is None:
-            efectivity = effectiveness.get(current_type_1, {}).get(
-                next_type_1, 1.0
-            ) * effectiveness.get(current_type_2, {}).get(next_type_1, 1.0)
+            return TYPE_CHART.item(current_type_1, next_type_1) * TYPE_CHART.item(
+                current_type_2, next_type_1
+            )
 
         # Caso 3: el atacante tiene un tipo y el defensor dos
         if current_type_2 is None and next_type_2 is not None:
-            efectivity = effectiveness.get(current_type_1, {}).get(
-                next_type_1, 1.0
-            ) * effectiveness.get(current_type_1, {}).get(next_type_2, 1.0)
-
-        # Caso 4: ambos tienen dos tipos, se usa el tipo del movimiento para calcular la efectividad
-        if current_type_2 is not None and next_type_2 is not None:
-            type_attack = current_trainer.get_current_pokemon().get_move_type(
-                move_name=attack
+            return TYPE_CHART.item(current_type_1, next_type_1) * TYPE_CHART.item(
+                current_type_1, next_type_2
             )
-            efectivity = effectiveness.get(type_attack, {}).get(
-                next_type_1, 1.0
-            ) * effectiveness.get(type_attack, {}).get(next_type_2, 1.0)
 
-        # Se retorna el valor final de la efectividad (puede ser 0.5, 1, 2, etc. según las tablas de tipos)
-        return efectivity
+        # Caso 4: ambos tienen dos tipos, se usa el tipo del movimiento para calcular la efectividad
+        # (el valor puede ser 0.5, 1, 2, etc. según las tablas de tipos)
+        type_attack = attacker.get_move_type_id(move_name=attack)
+        return TYPE_CHART.item(type_attack, next_type_1) * TYPE_CHART.item(
+            type_attack, next_type_2
+        )
 
     def calculate_damage(
         self, current_trainer: Trainer, next_trainer: Trainer, attack: str
@@ -246,6 +291,33 @@ class Combat:
         Returns:
             int: Daño calculado.
         """
+        return self.calculate_pokemon_damage(
+            attacker=current_trainer.get_current_pokemon(),
+            defender=next_trainer.get_current_pokemon(),
+            attack=attack,
+        )
+
+    def calculate_pokemon_damage(
+        self, attacker: Pokemon, defender: Pokemon, attack: str
+    ) -> int:
+        """
+        Calcula el daño que un Pokémon concreto inflige a otro con el ataque indicado.
+
+        Args:
+            attacker (Pokemon): Pokémon que ataca.
+            defender (Pokemon): Pokémon que recibe el ataque.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            int: Daño calculado.
+        """
+        # Si la combinación está precalculada, se usa el valor de la tabla
+        precalculated = self.__damage_table.get_damage(
+            attacker=attacker, defender=defender, attack=attack
+        )
+        if precalculated is not None:
+            return precalculated
+
         # Se establece el nivel del Pokémon atacante (por defecto)
         level = self.DEFAULT_POKEMON_LEVEL
 
@@ -258,16 +330,13 @@ class Combat:
         damage = (
             (
                 (((2 * level) // 5) + 2)
-                * (
-                    current_trainer.get_current_pokemon().get_damage(move_name=attack)
-                    // next_trainer.get_current_pokemon().get_defense()
-                )
+                * (attacker.get_damage(move_name=attack) // defender.get_defense())
                 // 50
             )
             + 2
-        ) * self.calculate_effectiveness(
-            current_trainer=current_trainer,
-            next_trainer=next_trainer,
+        ) * self.calculate_pokemon_effectiveness(
+            attacker=attacker,
+            defender=defender,
             attack=attack,
         )
 
@@ -326,12 +395,17 @@ class Combat:
             trainer.set_pokemon()
             self.__next_turn()
 
-    def enemy_set_attack(self) -> tuple[str, int]:
+    def enemy_set_attack(self, attack: str | None = None) -> tuple[str, int]:
         """
         Permite que el enemigo elija y realice un ataque.
 
+        Args:
+            attack (str | None): Ataque ya elegido por el enemigo (por ejemplo, en segundo plano).
+                Si es None, el enemigo lo elige en este momento.
+
         Returns:
             tuple[str, int]: Nombre del ataque y daño infligido.
         """
-        attack = self.__players[1].choose_attack(combat=self)
+        if attack is None:
+            attack = self.__players[1].choose_attack(combat=self)
         return attack, self.set_attack(attack=attack)
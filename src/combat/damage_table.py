@@ -0,0 +1,210 @@
+import numpy as np
+from src.pokemon.pokemon import Pokemon
+from src.utils.effectiveness import TYPE_CHART
+
+
+class DamageTable:
+    """
+    Tablas precalculadas de daño y efectividad para un conjunto fijo de Pokémon (por ejemplo, la Pokédex).
+
+    Las tablas se construyen una sola vez, con operaciones vectorizadas de NumPy, siguiendo
+    exactamente las reglas de `Combat`: el daño entero coincide con el de
+    `Combat.calculate_pokemon_damage` y la efectividad con la de `Combat.calculate_pokemon_effectiveness`.
+    Cada Pokémon se identifica por su nombre y recibe un identificador entero según su posición.
+
+    Atributos:
+        SLOTS (int): Cantidad de movimientos de cada Pokémon (movimiento 1, movimiento 2 y super movimiento).
+        ids (dict[str, int]): Identificador entero de cada Pokémon, por nombre.
+        move_names (list[tuple[str, str, str]]): Nombres de los movimientos de cada Pokémon.
+        effectiveness (np.ndarray): Efectividad por [atacante][movimiento][defensor].
+        damage (np.ndarray): Daño entero por [atacante][movimiento][defensor].
+    """
+
+    SLOTS = 3
+
+    def __init__(self, roster: list[Pokemon], level: int):
+        """
+        Construye las tablas para todos los pares atacante-defensor del conjunto de Pokémon.
+
+        Args:
+            roster (list[Pokemon]): Pokémon incluidos en las tablas.
+            level (int): Nivel de los Pokémon usado en la fórmula de daño.
+        """
+        self.ids = {pokemon.get_name(): i for i, pokemon in enumerate(roster)}
+        self.move_names = [
+            (
+                pokemon.get_move_1_name(),
+                pokemon.get_move_2_name(),
+                pokemon.get_super_move_name(),
+            )
+            for pokemon in roster
+        ]
+        self.effectiveness = self.__build_effectiveness(roster)
+
+        # Se usan los métodos de Pokemon para obtener el ataque de cada movimiento y la defensa,
+        # de modo que las tablas respeten exactamente los mismos datos que el combate
+        power = np.array(
+            [
+                [pokemon.get_damage(move_name=move) for move in moves]
+                for pokemon, moves in zip(roster, self.move_names)
+            ],
+            dtype=np.int64,
+        ).reshape(len(roster), self.SLOTS)
+        defense = np.array(
+            [pokemon.get_defense() for pokemon in roster], dtype=np.int64
+        )
+
+        # Misma fórmula que Combat.calculate_pokemon_damage, aplicada a todos los pares a la vez
+        base = ((2 * level) // 5) + 2
+        damage = (base * (power[:, :, None] // defense[None, None, :]) // 50) + 2
+        self.damage = (damage * self.effectiveness).astype(np.int64)
+
+    def __build_effectiveness(self, roster: list[Pokemon]) -> np.ndarray:
+        """
+        Calcula la efectividad de cada movimiento de cada Pokémon contra cada Pokémon.
+
+        Se aplican los mismos cuatro casos que en `Combat.calculate_pokemon_effectiveness`, según
+        si el atacante y el defensor tienen uno o dos tipos.
+
+        Args:
+            roster (list[Pokemon]): Pokémon incluidos en las tablas.
+
+        Returns:
+            np.ndarray: Efectividad por [atacante][movimiento][defensor].
+        """
+        # Identificadores de los tipos en la tabla compilada, ya resueltos en cada Pokémon
+        first = np.array(
+            [pokemon.get_type_1_id() for pokemon in roster], dtype=np.int64
+        )
+        type_2 = [pokemon.get_type_2_id() for pokemon in roster]
+        has_second = np.array([type_id is not None for type_id in type_2], dtype=bool)
+        second = np.array(
+            [type_id if type_id is not None else 0 for type_id in type_2],
+            dtype=np.int64,
+        )
+        move = np.array(
+            [
+                [pokemon.get_move_type_id(move_name=name) for name in moves]
+                for pokemon, moves in zip(roster, self.move_names)
+            ],
+            dtype=np.int64,
+        ).reshape(len(roster), self.SLOTS)
+
+        # Casos 1 a 3: solo dependen de los tipos de los Pokémon, no del movimiento
+        single = TYPE_CHART[first[:, None], first[None, :]]
+        attacker_dual = single * TYPE_CHART[second[:, None], first[None, :]]
+        defender_dual = single * TYPE_CHART[first[:, None], second[None, :]]
+        attacker_has_second = has_second[:, None]
+        defender_has_second = has_second[None, :]
+        by_pokemon = np.where(
+            attacker_has_second & ~defender_has_second,
+            attacker_dual,
+            np.where(~attacker_has_second & defender_has_second, defender_dual, single),
+        )
+
+        # Caso 4: ambos tienen dos tipos, se usa el tipo del movimiento
+        by_move = (
+            TYPE_CHART[move[:, :, None], first[None, None, :]]
+            * TYPE_CHART[move[:, :, None], second[None, None, :]]
+        )
+        both_dual = (attacker_has_second & defender_has_second)[:, None, :]
+
+        return np.where(both_dual, by_move, by_pokemon[:, None, :])
+
+    def get_id(self, pokemon: Pokemon) -> int | None:
+        """
+        Obtiene el identificador entero de un Pokémon en las tablas.
+
+        Args:
+            pokemon (Pokemon): Pokémon a buscar.
+
+        Returns:
+            int | None: Identificador del Pokémon, o None si no está en las tablas.
+        """
+        return self.ids.get(pokemon.get_name())
+
+    def get_slot(self, pokemon_id: int, attack: str) -> int | None:
+        """
+        Obtiene la posición de un ataque entre los movimientos de un Pokémon.
+
+        Args:
+            pokemon_id (int): Identificador del Pokémon.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            int | None: Posición del ataque (0, 1 o 2), o None si el Pokémon no lo conoce.
+        """
+        moves = self.move_names[pokemon_id]
+        return moves.index(attack) if attack in moves else None
+
+    def get_damage(
+        self, attacker: Pokemon, defender: Pokemon, attack: str
+    ) -> int | None:
+        """
+        Obtiene el daño precalculado de un ataque.
+
+        Args:
+            attacker (Pokemon): Pokémon que ataca.
+            defender (Pokemon): Pokémon que recibe el ataque.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            int | None: Daño del ataque, o None si la combinación no está en las tablas.
+        """
+        index = self.__get_index(attacker, defender, attack)
+        return None if index is None else int(self.damage[index])
+
+    def get_effectiveness(
+        self, attacker: Pokemon, defender: Pokemon, attack: str
+    ) -> float | None:
+        """
+        Obtiene la efectividad precalculada de un ataque.
+
+        Args:
+            attacker (Pokemon): Pokémon que ataca.
+            defender (Pokemon): Pokémon que recibe el ataque.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            float | None: Multiplicador de efectividad, o None si la combinación no está en las tablas.
+        """
+        index = self.__get_index(attacker, defender, attack)
+        return None if index is None else float(self.effectiveness[index])
+
+    def get_team_ids(self, team: list[Pokemon]) -> list[int] | None:
+        """
+        Obtiene los identificadores de todos los Pokémon de un equipo.
+
+        Args:
+            team (list[Pokemon]): Pokémon del equipo.
+
+        Returns:
+            list[int] | None: Identificadores en el mismo orden, o None si alguno no está en las tablas.
+        """
+        ids = [self.get_id(pokemon) for pokemon in team]
+        return None if None in ids else ids
+
+    def __get_index(
+        self, attacker: Pokemon, defender: Pokemon, attack: str
+    ) -> tuple[int, int, int] | None:
+        """
+        Obtiene la posición en las tablas de un ataque entre dos Pokémon.
+
+        Args:
+            attacker (Pokemon): Pokémon que ataca.
+            defender (Pokemon): Pokémon que recibe el ataque.
+            attack (str): Nombre del ataque.
+
+        Returns:
+            tuple[int, int, int] | None: Índices (atacante, movimiento, defensor), o None si no están en las tablas.
+        """
+        attacker_id = self.get_id(attacker)
+        defender_id = self.get_id(defender)
+        if attacker_id is None or defender_id is None:
+            return None
+
+        slot = self.get_slot(attacker_id, attack)
+        if slot is None:
+            return None
+
+        return attacker_id, slot, defender_id
@@ -0,0 +1,222 @@
+import os
+import zipfile
+import numpy as np
+from src.combat.damage_table import DamageTable
+from src.pokemon.pokemon import Pokemon
+from src.utils.cache import fingerprint, get_cache_dir
+from src.utils.effectiveness import effectiveness
+from src.utils.moves import get_moves
+
+
+class MatchupMatrix:
+    """
+    Resultado esperado del combate uno contra uno entre cada par de Pokémon de un conjunto.
+
+    En un combate uno contra uno, sin otros efectos que el daño, lo mejor que puede hacer cada
+    Pokémon es usar siempre su ataque de mayor daño, así que el resultado se calcula sin
+    simular: con los golpes que necesita cada uno para derrotar al otro y quién ataca primero
+    según la velocidad (los empates de velocidad se promedian, porque se deciden al azar).
+
+    El resultado de `outcomes[i][j]` es la fracción de vida que le queda a `i` si gana, o menos
+    la fracción que le queda a `j` si pierde: está entre -1 y 1, es positivo si `i` gana y su
+    valor absoluto indica por cuánto. Si ninguno puede dañar al otro, es 0.
+
+    Atributos:
+        VERSION (int): Versión del cálculo; al cambiarla se invalidan las matrices guardadas.
+        names (list[str]): Nombres de los Pokémon, en el orden de las filas y columnas.
+        outcomes (np.ndarray): Resultado esperado por [Pokémon][rival].
+    """
+
+    VERSION = 1
+
+    def __init__(self, roster: list[Pokemon], damage_table: DamageTable):
+        """
+        Calcula la matriz para todos los pares de Pokémon a partir de sus tablas de daño.
+
+        Args:
+            roster (list[Pokemon]): Pokémon incluidos, en el mismo orden que en `damage_table`.
+            damage_table (DamageTable): Daño precalculado de cada par de Pokémon.
+        """
+        self.names = [pokemon.get_name() for pokemon in roster]
+
+        health = np.array([pokemon.get_hp() for pokemon in roster], dtype=np.float64)
+        speed = np.array([pokemon.get_speed() for pokemon in roster], dtype=np.int64)
+
+        # Daño del mejor ataque de cada Pokémon contra cada rival y golpes necesarios para derrotarlo
+        best = damage_table.damage.max(axis=1).astype(np.float64)
+        with np.errstate(divide="ignore"):
+            hits = np.where(best > 0, np.ceil(health[None, :] / best), np.inf)
+
+        first = self.__outcome(health, best, hits, attacker_first=True)
+        second = self.__outcome(health, best, hits, attacker_first=False)
+        faster = speed[:, None] > speed[None, :]
+        slower = speed[:, None] < speed[None, :]
+        self.outcomes = np.where(
+            faster, first, np.where(slower, second, (first + second) / 2)
+        )
+
+    @staticmethod
+    def __outcome(
+        health: np.ndarray, best: np.ndarray, hits: np.ndarray, attacker_first: bool
+    ) -> np.ndarray:
+        """
+        Calcula el resultado de cada par cuando el Pokémon de la fila ataca primero (o segundo).
+
+        Args:
+            health (np.ndarray): Vida máxima de cada Pokémon.
+            best (np.ndarray): Daño del mejor ataque por [atacante][defensor].
+            hits (np.ndarray): Golpes necesarios por [atacante][defensor] (infinito si no hace daño).
+            attacker_first (bool): Indica si el Pokémon de la fila ataca primero.
+
+        Returns:
+            np.ndarray: Resultado por [Pokémon][rival], entre -1 y 1.
+        """
+        own_hits = hits
+        rival_hits = hits.T
+        rival_best = best.T
+
+        # Quien ataca primero gana si necesita a lo sumo los mismos golpes que el rival
+        wins = own_hits <= rival_hits if attacker_first else own_hits < rival_hits
+        # Golpes que alcanza a dar el perdedor antes de ser derrotado
+        rival_attacks = own_hits - 1 if attacker_first else own_hits
+        own_attacks = rival_hits if attacker_first else rival_hits - 1
+
+        with np.errstate(invalid="ignore"):
+            own_left = 1 - rival_attacks * rival_best / health[:, None]
+            rival_left = 1 - own_attacks * best / health[None, :]
+
+        outcome = np.where(wins, own_left, -rival_left)
+        # Si ninguno hace daño, el combate no termina
+        return np.where(np.isinf(own_hits) & np.isinf(rival_hits), 0.0, outcome)
+
+    @staticmethod
+    def get_key(roster: list[Pokemon], level: int) -> str:
+        """
+        Calcula la huella de los datos de los que depende la matriz: los Pokémon (y por lo tanto
+        la Pokédex), los movimientos, la tabla de efectividad, el nivel y la versión del cálculo.
+
+        Args:
+            roster (list[Pokemon]): Pokémon incluidos.
+            level (int): Nivel de los Pokémon.
+
+        Returns:
+            str: Huella de la matriz.
+        """
+        pokemon = [
+            [
+                pokemon.get_name(),
+                pokemon.get_type_1(),
+                pokemon.get_type_2(),
+                pokemon.get_hp(),
+                pokemon.get_defense(),
+                pokemon.get_speed(),
+                [
+                    pokemon.get_damage(move_name=move)
+                    for move in (
+                        pokemon.get_move_1_name(),
+                        pokemon.get_move_2_name(),
+                        pokemon.get_super_move_name(),
+                    )
+                ],
+                pokemon.get_move_1_name(),
+                pokemon.get_move_2_name(),
+                pokemon.get_super_move_name(),
+            ]
+            for pokemon in roster
+        ]
+        return fingerprint(
+            MatchupMatrix.VERSION, level, pokemon, get_moves(), effectiveness
+        )
+
+    @classmethod
+    def load_or_build(
+        cls,
+        roster: list[Pokemon],
+        level: int,
+        damage_table: DamageTable | None = None,
+        cache_dir: str | None = None,
+    ) -> "MatchupMatrix":
+        """
+        Carga la matriz de la caché o, si no existe, está dañada o cambiaron los datos, la calcula
+        y la guarda. Si la caché no se puede escribir, se retorna la matriz calculada sin guardarla.
+
+        Args:
+            roster (list[Pokemon]): Pokémon incluidos.
+            level (int): Nivel de los Pokémon.
+            damage_table (DamageTable | None): Daño precalculado de `roster`, en el mismo orden. Si
+                es None y la matriz no está en la caché, se construye (con la caché no hace falta).
+            cache_dir (str | None): Carpeta de la caché. Si es None, se usa la del juego.
+
+        Returns:
+            MatchupMatrix: Matriz de resultados.
+        """
+        path = os.path.join(
+            cache_dir or get_cache_dir("matchups", create=False),
+            f"{cls.get_key(roster, level)}.npz",
+        )
+
+        matrix = cls.__new__(cls)
+        if matrix.load(path):
+            return matrix
+
+        matrix = cls(
+            roster=roster,
+            damage_table=damage_table or DamageTable(roster=roster, level=level),
+        )
+        try:
+            matrix.save(path)
+        except OSError:
+            pass
+        return matrix
+
+    def save(self, path: str) -> None:
+        """
+        Guarda la matriz en un archivo comprimido de NumPy.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Raises:
+            OSError: Si el archivo no se puede escribir. El archivo temporal se borra.
+        """
+        # Se escribe en un archivo temporal y se renombra, para no dejar archivos a medio escribir
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            np.savez_compressed(
+                temporary, outcomes=self.outcomes, names=np.array(self.names)
+            )
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+
+    def load(self, path: str) -> bool:
+        """
+        Carga la matriz de un archivo guardado con `save`.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si se cargó, False si el archivo no existe o no es válido.
+        """
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                outcomes = data["outcomes"]
+                names = data["names"].tolist()
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return False
+
+        if outcomes.shape != (len(names), len(names)):
+            return False
+
+        self.names = names
+        self.outcomes = outcomes
+        return True
@@ -1,11 +1,34 @@
-import pandas as pd
+import bisect
+import csv
+import hashlib
+import json
 import os
+import numpy as np
+from src.utils.cache import get_cache_dir
+
+# Carpeta con los archivos de datos del juego (Pokédex y movimientos)
+DATA_DIR = os.path.dirname(__file__)
 
 
 class Dataset:
     """
     Clase para manejar el dataset de Pokémon a partir de un archivo CSV.
 
+    Los datos se guardan por columnas (enteros o textos) junto con un índice de la fila de cada
+    nombre, así que buscar un Pokémon no recorre el dataset. Como leer el CSV es lo más lento del
+    arranque, las columnas ya convertidas se guardan en un archivo binario en la carpeta de caché
+    del juego; el archivo se vuelve a generar si cambia el contenido del CSV.
+
+    Las celdas vacías se representan con NaN (un float), igual que antes con pandas. Los índices
+    de las búsquedas por prefijo, tipo y estadística se construyen la primera vez que se usan.
+
+    Atributos:
+        VERSION (int): Versión del formato de la caché; las cachés de otra versión no se cargan.
+        MISSING (int): Valor que representa una celda vacía de una columna de enteros en la caché.
+        TYPE_COLUMNS (tuple[str, str]): Columnas con los tipos de cada Pokémon.
+        path (str): Ruta del archivo CSV.
+        columns (dict[str, list]): Valores de cada columna, en el orden del archivo.
+
     Métodos:
         get_pokemon_by_name(name: str) -> dict[str, int | str]:
             Devuelve un diccionario con los datos del Pokémon cuyo nombre coincide con el proporcionado.
@@ -13,14 +36,198 @@ class Dataset:
 
         get_all_pokemon_names() -> list[str]:
             Devuelve una lista con todos los nombres de Pokémon en el dataset.
+
+        get_all_pokemon() -> list[dict[str, int | str]]:
+            Devuelve los datos de todos los Pokémon del dataset, en el mismo orden.
+
+        search_by_prefix(prefix: str) -> list[str]:
+            Devuelve los nombres que empiezan con el prefijo, sin distinguir mayúsculas.
+
+        get_pokemon_by_type(type_name: str) -> list[str]:
+            Devuelve los nombres de los Pokémon que tienen el tipo como primer o segundo tipo.
+
+        get_pokemon_by_stat(stat: str, minimum: int | None, maximum: int | None) -> list[str]:
+            Devuelve los nombres de los Pokémon con la estadística dentro del rango.
     """
 
-    def __init__(self) -> None:
+    VERSION = 2
+    MISSING = -(1 << 63)
+    TYPE_COLUMNS = ("Tipo1", "Tipo2")
+
+    def __init__(self, path: str | None = None, cache_dir: str | None = None) -> None:
+        """
+        Inicializa la clase Dataset cargando el archivo 'pokedex.csv' ubicado en el mismo directorio
+        (o el indicado), desde la caché binaria si está al día.
+
+        Args:
+            path (str | None): Ruta del archivo CSV. Si es None, se usa 'pokedex.csv'.
+            cache_dir (str | None): Carpeta de la caché. Si es None, se usa la del juego.
+        """
+        self.path = path or os.path.join(DATA_DIR, "pokedex.csv")
+
+        with open(self.path, "rb") as file:
+            content = file.read()
+        source = hashlib.sha256(content).hexdigest()
+
+        name = os.path.splitext(os.path.basename(self.path))[0]
+        # La carpeta se crea recién al guardar la caché; si no se puede, se sigue sin caché
+        cache = os.path.join(
+            cache_dir or get_cache_dir("dataset", create=False), f"{name}.bin"
+        )
+
+        columns = self.__load_cache(cache, source)
+        if columns is None:
+            columns = self.__parse(content.decode("utf-8-sig"))
+            self.__save_cache(cache, source, columns)
+
+        self.columns: dict[str, list] = columns
+        # Se indexa la fila de cada nombre (si se repite, cuenta la primera, como antes)
+        self.__index: dict[str, int] = {}
+        for row, pokemon_name in enumerate(columns["Nombre"]):
+            self.__index.setdefault(pokemon_name, row)
+
+        # Índices de las búsquedas, construidos la primera vez que se necesitan
+        self.__prefix_index: tuple[list[str], list[int]] | None = None
+        self.__type_index: dict[str, list[int]] | None = None
+        self.__stat_index: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    @staticmethod
+    def __parse(text: str) -> dict[str, list]:
+        """
+        Convierte el contenido del CSV en columnas. Las columnas con solo números enteros (y
+        celdas vacías) se convierten a enteros; las demás se dejan como textos. En ambos casos las
+        celdas vacías quedan como NaN.
+
+        Args:
+            text (str): Contenido del archivo CSV.
+
+        Returns:
+            dict[str, list]: Valores de cada columna.
+        """
+        reader = csv.reader(text.splitlines())
+        header = next(reader)
+        rows = [row for row in reader if row]
+
+        columns = {}
+        for position, column in enumerate(header):
+            values = [row[position] if position < len(row) else "" for row in rows]
+            try:
+                numbers = [int(value) if value else None for value in values]
+            except ValueError:
+                numbers = None
+
+            if numbers is not None and any(number is not None for number in numbers):
+                columns[column] = [
+                    float("nan") if number is None else number for number in numbers
+                ]
+            else:
+                columns[column] = [value if value else float("nan") for value in values]
+        return columns
+
+    def __load_cache(self, path: str, source: str) -> dict[str, list] | None:
+        """
+        Carga las columnas de la caché binaria, si corresponde al contenido actual del CSV.
+
+        Args:
+            path (str): Ruta de la caché.
+            source (str): Huella SHA-256 del CSV.
+
+        Returns:
+            dict[str, list] | None: Valores de cada columna, o None si la caché no existe, es de
+            otro CSV o no es válida.
+        """
+        try:
+            with open(path, "rb") as file:
+                header = json.loads(file.readline())
+                body = file.read()
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(header, dict)
+            or header.get("version") != self.VERSION
+            or header.get("source") != source
+        ):
+            return None
+
+        columns = {}
+        offset = 0
+        try:
+            for column, kind, size in header["columns"]:
+                chunk = body[offset : offset + size]
+                offset += size
+                if kind == "int":
+                    columns[column] = [
+                        float("nan") if value == self.MISSING else value
+                        for value in np.frombuffer(chunk, dtype="<i8").tolist()
+                    ]
+                else:
+                    columns[column] = [
+                        value if value else float("nan")
+                        for value in chunk.decode("utf-8").split("\0")
+                    ]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if offset != len(body) or any(
+            len(values) != header["rows"] for values in columns.values()
+        ):
+            return None
+        return columns
+
+    def __save_cache(self, path: str, source: str, columns: dict[str, list]) -> None:
         """
-        Inicializa la clase Dataset cargando el archivo 'pokedex.csv' ubicado en el mismo directorio.
+        Guarda las columnas en la caché binaria: una línea JSON con la descripción de las columnas
+        y, a continuación, los enteros de 64 bits (con `MISSING` en las celdas vacías) o los textos
+        (separados por el carácter nulo) de cada columna. Si no se puede escribir, el juego sigue
+        leyendo el CSV.
+
+        Args:
+            path (str): Ruta de la caché.
+            source (str): Huella SHA-256 del CSV.
+            columns (dict[str, list]): Valores de cada columna.
         """
-        ruta = os.path.join(os.path.dirname(__file__), "pokedex.csv")
-        self.data = pd.read_csv(ruta)
+        description = []
+        chunks = []
+        for column, values in columns.items():
+            if any(isinstance(value, int) for value in values) and not any(
+                isinstance(value, str) for value in values
+            ):
+                kind = "int"
+                chunk = np.array(
+                    [
+                        value if isinstance(value, int) else self.MISSING
+                        for value in values
+                    ],
+                    dtype="<i8",
+                ).tobytes()
+            else:
+                kind = "str"
+                chunk = "\0".join(
+                    value if isinstance(value, str) else "" for value in values
+                ).encode("utf-8")
+            description.append([column, kind, len(chunk)])
+            chunks.append(chunk)
+
+        header = {
+            "version": self.VERSION,
+            "source": source,
+            "rows": len(next(iter(columns.values()), [])),
+            "columns": description,
+        }
+        # Se escribe en un archivo temporal y se renombra, para no dejar archivos a medio escribir
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(json.dumps(header).encode("utf-8") + b"\n")
+                file.writelines(chunks)
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
 
     def get_pokemon_by_name(self, name: str) -> dict[str, int | str]:
         """
@@ -35,12 +242,24 @@ class Dataset:
         Raises:
             ValueError: Si el Pokémon no se encuentra en el dataset.
         """
-        result = self.data[self.data["Nombre"] == name]
-        if not result.empty:
-            return result.iloc[0].to_dict()
+        row = self.__index.get(name)
+        if row is not None:
+            return self.__get_row(row)
 
         raise ValueError(f"Pokemon with name '{name}' not found in the dataset.")
 
+    def __get_row(self, row: int) -> dict[str, int | str]:
+        """
+        Arma el diccionario con los datos de una fila.
+
+        Args:
+            row (int): Posición de la fila.
+
+        Returns:
+            dict[str, int | str]: Valor de cada columna en la fila.
+        """
+        return {column: values[row] for column, values in self.columns.items()}
+
     def get_all_pokemon_names(self) -> list[str]:
         """
         Obtiene una lista con todos los nombres de Pokémon en el dataset.
@@ -48,4 +267,115 @@ class Dataset:
         Returns:
             list[str]: Lista de nombres de Pokémon.
         """
-        return self.data["Nombre"].tolist()
+        return list(self.columns["Nombre"])
+
+    def get_all_pokemon(self) -> list[dict[str, int | str]]:
+        """
+        Obtiene los datos de todos los Pokémon del dataset, en el orden del archivo.
+
+        Returns:
+            list[dict[str, int | str]]: Lista de diccionarios con los datos de cada Pokémon.
+        """
+        return [self.__get_row(row) for row in range(len(self.columns["Nombre"]))]
+
+    def search_by_prefix(self, prefix: str) -> list[str]:
+        """
+        Busca los Pokémon cuyo nombre empieza con el prefijo, sin distinguir mayúsculas.
+
+        Args:
+            prefix (str): Comienzo del nombre.
+
+        Returns:
+            list[str]: Nombres encontrados, en el orden del archivo.
+        """
+        if self.__prefix_index is None:
+            # Nombres en minúsculas ordenados, con su fila, para buscar el rango con bisección
+            ordered = sorted(
+                (str(name).casefold(), row)
+                for row, name in enumerate(self.columns["Nombre"])
+            )
+            self.__prefix_index = (
+                [name for name, _ in ordered],
+                [row for _, row in ordered],
+            )
+
+        keys, rows = self.__prefix_index
+        prefix = prefix.casefold()
+        found = []
+        for position in range(bisect.bisect_left(keys, prefix), len(keys)):
+            if not keys[position].startswith(prefix):
+                break
+            found.append(rows[position])
+        return self.__get_names(found)
+
+    def get_pokemon_by_type(self, type_name: str) -> list[str]:
+        """
+        Busca los Pokémon que tienen el tipo como primer o segundo tipo.
+
+        Args:
+            type_name (str): Nombre del tipo (por ejemplo, "Fuego").
+
+        Returns:
+            list[str]: Nombres encontrados, en el orden del archivo.
+        """
+        if self.__type_index is None:
+            self.__type_index = {}
+            for column in self.TYPE_COLUMNS:
+                for row, value in enumerate(self.columns.get(column, [])):
+                    if isinstance(value, str):
+                        self.__type_index.setdefault(value, []).append(row)
+
+        return self.__get_names(self.__type_index.get(type_name, []))
+
+    def get_pokemon_by_stat(
+        self, stat: str, minimum: int | None = None, maximum: int | None = None
+    ) -> list[str]:
+        """
+        Busca los Pokémon con una estadística dentro de un rango (con ambos extremos incluidos).
+
+        Args:
+            stat (str): Columna numérica (por ejemplo, "HP" o "Velocidad").
+            minimum (int | None): Valor mínimo. Si es None, no hay mínimo.
+            maximum (int | None): Valor máximo. Si es None, no hay máximo.
+
+        Returns:
+            list[str]: Nombres encontrados, en el orden del archivo.
+
+        Raises:
+            ValueError: Si la columna no existe o no es numérica.
+        """
+        index = self.__stat_index.get(stat)
+        if index is None:
+            values = self.columns.get(stat)
+            if values is None or any(isinstance(value, str) for value in values):
+                raise ValueError(
+                    f"Column '{stat}' is not a numeric column of the dataset."
+                )
+
+            # Valores ordenados con su fila; las celdas vacías (NaN) quedan al final
+            values = np.array(values, dtype=np.float64)
+            order = np.argsort(values, kind="stable")
+            index = (values[order], order)
+            self.__stat_index[stat] = index
+
+        values, order = index
+        first = 0 if minimum is None else np.searchsorted(values, minimum, side="left")
+        last = (
+            np.searchsorted(values, np.inf, side="right")
+            if maximum is None
+            else np.searchsorted(values, maximum, side="right")
+        )
+        return self.__get_names(order[first:last].tolist())
+
+    def __get_names(self, rows: list[int]) -> list[str]:
+        """
+        Obtiene los nombres de varias filas, en el orden del archivo.
+
+        Args:
+            rows (list[int]): Posiciones de las filas.
+
+        Returns:
+            list[str]: Nombres de las filas.
+        """
+        names = self.columns["Nombre"]
+        return [names[row] for row in sorted(rows)]
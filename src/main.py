@@ -1,6 +1,47 @@
-from src.ui.select_pokemon_ui import PokemonSelectionScreen
+import argparse
+import json
+import time
 
+# Inicio del programa, para medir el tiempo hasta el primer cuadro con --profile-startup
+STARTED = time.perf_counter()
+
+
+def main() -> None:
+    """
+    Abre el juego: `python -m src.main`. Con `--profile-startup` mide el arranque en lugar de jugar.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.main")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="muestra cuánto tarda cada paquete en importarse y el tiempo hasta el primer cuadro",
+    )
+    # Lo usa --profile-startup: cierra la ventana después del primer cuadro y escribe su tiempo
+    parser.add_argument("--first-frame", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from src.utils.startup import format_report, profile_startup
+
+        print(format_report(profile_startup()))
+        return
+
+    # La ventana se importa recién aquí para que --profile-startup no cargue pygame
+    from src.ui.select_pokemon_ui import PokemonSelectionScreen
 
-if __name__ == "__main__":
     select_pokemon_ui = PokemonSelectionScreen()
-    select_pokemon_ui.run()
+    select_pokemon_ui.run(max_frames=1 if args.first_frame else None)
+
+    if args.first_frame:
+        from src.utils.startup import FIRST_FRAME_PREFIX
+
+        first_frame = select_pokemon_ui.started + select_pokemon_ui.first_frame_time
+        frame = {
+            "first_frame_ms": (first_frame - STARTED) * 1000,
+            "screen_first_frame_ms": select_pokemon_ui.first_frame_time * 1000,
+        }
+        print(f"{FIRST_FRAME_PREFIX}{json.dumps(frame)}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
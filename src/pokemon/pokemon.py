@@ -1,55 +1,112 @@
-from src.utils.moves import moves # Importamos el diccionario con los movimientos
+from src.utils.moves import get_moves # Importamos el diccionario con los movimientos
+from src.utils.effectiveness import get_type_id
 import math
 
 # Creamos la clase Pokemon que representa un Pokémon con sus atributos y métodos para interactuar con ellos.
 # Se creó para encapsular la información especifica de un Pokémon y proporcionar métodos para acceder a sus atributos.
 # Se inicializa con un diccionario que contiene los datos del Pokémon y es retornada por el dataset.
+# Los datos se leen y se convierten una sola vez al crear el Pokémon (estadísticas, movimientos, daño
+# y tipos), y se guardan en atributos fijos (__slots__), porque la IA los consulta en cada nodo de la búsqueda.
 
 class Pokemon:
+    __slots__ = (
+        "_name",
+        "_type_1",
+        "_type_2",
+        "_hp",
+        "_attack",
+        "_defense",
+        "_speed",
+        "_move_names",
+        "_move_damage",
+        "_move_types",
+        "_type_ids",
+        "_move_type_ids",
+    )
+
     def __init__(self, data: dict[str, int | str]) -> None:
-        self._data = data
+        self._name = data["Nombre"]
+        self._type_1 = data["Tipo1"]
+        # El segundo tipo solo se considera si es un número válido (los tipos del dataset son textos)
+        tipo2 = data.get("Tipo2")
+        self._type_2 = tipo2 if isinstance(tipo2, int) and not math.isnan(tipo2) else None
+        self._hp = int(data["HP"])
+        self._attack = int(data["Ataque"])
+        self._defense = int(data["Defensa"])
+        self._speed = int(data["Velocidad"])
+        self._move_names = (data["Ataque1"], data["Ataque2"], data["SuperAtaque"])
+
+        # Daño y tipo de los movimientos del Pokémon, precalculados para no buscarlos en cada ataque
+        self._move_damage = {move: self.__calculate_damage(move) for move in self._move_names}
+        moves = get_moves()
+        self._move_types = {move: moves.get(move, {}).get("tipo", "") for move in self._move_names}
+
+        # Identificadores enteros de los tipos del Pokémon y de sus movimientos, resueltos una sola vez
+        # para calcular la efectividad con la tabla compilada (TYPE_CHART) sin buscar por nombre
+        self._type_ids = (
+            get_type_id(self._type_1),
+            get_type_id(self._type_2) if self._type_2 is not None else None,
+        )
+        self._move_type_ids = {move: get_type_id(name) for move, name in self._move_types.items()}
 
     def get_name(self) -> str:
-        return self._data["Nombre"]
+        return self._name
 
     def get_type_1(self) -> str:
-        return self._data["Tipo1"]
+        return self._type_1
 
     def get_type_2(self) -> str | None:
-        tipo2 = self._data.get("Tipo2")
-        return tipo2 if isinstance(tipo2, int) and not math.isnan(tipo2) else None
+        return self._type_2
+
+    def get_type_1_id(self) -> int:
+        return self._type_ids[0]
+
+    def get_type_2_id(self) -> int | None:
+        return self._type_ids[1]
 
     def get_hp(self) -> int:
-        return int(self._data["HP"])
+        return self._hp
 
     def get_defense(self) -> int:
-        return int(self._data["Defensa"])
+        return self._defense
 
     def get_move_1_name(self) -> str:
-        return self._data["Ataque1"]
+        return self._move_names[0]
 
     def get_move_2_name(self) -> str:
-        return self._data["Ataque2"]
+        return self._move_names[1]
 
     def get_super_move_name(self) -> str:
-        return self._data["SuperAtaque"]
+        return self._move_names[2]
 
     def get_speed(self) -> int:
-        return int(self._data["Velocidad"])
+        return self._speed
 
     def get_damage(self, move_name: str) -> int:
-        power = moves.get(move_name, {}).get("poder")
-        if power is not None:
-            return int(self._data["Ataque"]) * power
-        return 0
+        damage = self._move_damage.get(move_name)
+        return damage if damage is not None else self.__calculate_damage(move_name)
         """
         Calcula y devuelve la multiplicación del ataque del Pokémon por el poder del movimiento.
         que se usará en el calculo del daño en los combates.
         """
 
+    def __calculate_damage(self, move_name: str) -> int:
+        power = get_moves().get(move_name, {}).get("poder")
+        if power is not None:
+            return self._attack * power
+        return 0
+
     def get_move_type(self, move_name: str) -> str:
-        return moves.get(move_name, {}).get("tipo", "")        
+        move_type = self._move_types.get(move_name)
+        return move_type if move_type is not None else get_moves().get(move_name, {}).get("tipo", "")
         """
         Devuelve el tipo del movimiento especificado. Pues es necesario en el calculo de la efectividad del ataque
         en el caso de que el Pokémon rival y aliado tengan dos tipos.
         """
+
+    def get_move_type_id(self, move_name: str) -> int:
+        type_id = self._move_type_ids.get(move_name)
+        return type_id if type_id is not None else get_type_id(self.get_move_type(move_name))
+        """
+        Devuelve el identificador entero del tipo del movimiento en la tabla de efectividad compilada.
+        """
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+from src.simulation.simulator import BattleSimulator
+
+
+def main() -> None:
+    """
+    Juega combates sin interfaz desde la línea de comandos: `python -m src.simulation`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulation",
+        description="Juega combates completos entre políticas automáticas, sin interfaz.",
+    )
+    parser.add_argument(
+        "--battles", type=int, default=1000, help="cantidad de combates"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="procesos trabajadores (por defecto, uno por núcleo)",
+    )
+    parser.add_argument(
+        "--player",
+        choices=BattleSimulator.POLICIES,
+        default="random",
+        help="política del jugador",
+    )
+    parser.add_argument(
+        "--enemy",
+        choices=BattleSimulator.POLICIES,
+        default="ai",
+        help="política de la IA",
+    )
+    parser.add_argument(
+        "--player-options",
+        type=json.loads,
+        default={},
+        help="opciones de Enemy para el jugador, en JSON (por ejemplo, '{\"depth\": 4}')",
+    )
+    parser.add_argument(
+        "--enemy-options",
+        type=json.loads,
+        default={},
+        help="opciones de Enemy para la IA, en JSON",
+    )
+    parser.add_argument("--team-size", type=int, default=5, help="Pokémon por equipo")
+    parser.add_argument(
+        "--max-turns", type=int, default=500, help="ataques máximos por combate"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los sorteos")
+    parser.add_argument(
+        "--engine",
+        choices=BattleSimulator.ENGINES,
+        default="scalar",
+        help="motor de combate: uno por combate o todos a la vez con NumPy (solo random y greedy)",
+    )
+    parser.add_argument(
+        "--verify",
+        type=int,
+        default=100,
+        help="combates del motor por lotes que se repiten con el motor escalar para compararlos",
+    )
+    parser.add_argument("--output", help="archivo JSON donde se guarda el resumen")
+    args = parser.parse_args()
+
+    simulator = BattleSimulator(
+        player_policy=args.player,
+        enemy_policy=args.enemy,
+        player_options=args.player_options,
+        enemy_options=args.enemy_options,
+        team_size=args.team_size,
+        max_turns=args.max_turns,
+        workers=args.workers,
+        seed=args.seed,
+        engine=args.engine,
+        verify=args.verify,
+    )
+    report = simulator.run(battles=args.battles).to_dict()
+
+    print(f"Combates: {report['battles']}")
+    for name, wins in report["wins"].items():
+        print(f"  {name:7} {wins:8} ({report['win_rate'][name]:.1%})")
+    print(
+        f"Ataques por combate: media {report['turns']['mean']:.1f}, "
+        f"mediana {report['turns']['median']}, máximo {report['turns']['max']}"
+    )
+    print(
+        f"Tiempo: {report['elapsed']:.2f} s ({report['battles_per_second']:.1f} combates/s)"
+    )
+    if report["verified"]:
+        print(
+            f"Verificados con el motor escalar: {report['verified']}, "
+            f"distintos: {len(report['mismatches'])}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {"config": simulator.get_config(), "report": report},
+                file,
+                indent=2,
+                ensure_ascii=False,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+import random
+import numpy as np
+from src.combat.combat import Combat, CombatState
+from src.combat.damage_table import DamageTable
+from src.pokemon.pokemon import Pokemon
+from src.trainers.enemy.ia import Enemy
+from src.trainers.trainers import Player
+
+
+def random_teams(
+    battles: int, roster_size: int, team_size: int, seed: int = 0
+) -> np.ndarray:
+    """
+    Sortea los equipos de muchos combates a la vez, sin Pokémon repetidos dentro de un combate.
+
+    Args:
+        battles (int): Cantidad de combates.
+        roster_size (int): Cantidad de Pokémon disponibles.
+        team_size (int): Pokémon por equipo.
+        seed (int): Semilla del sorteo.
+
+    Returns:
+        np.ndarray: Identificadores de los Pokémon por [combate][entrenador][posición].
+
+    Raises:
+        ValueError: Si no hay suficientes Pokémon para ambos equipos.
+    """
+    if 2 * team_size > roster_size:
+        raise ValueError("Not enough Pokémon for two teams without repetitions")
+
+    generator = np.random.default_rng(seed)
+    order = np.argsort(generator.random((battles, roster_size)), axis=1)
+    return order[:, : 2 * team_size].reshape(battles, 2, team_size)
+
+
+class BatchCombat:
+    """
+    Motor de combate por lotes: avanza miles de combates a la vez, un ataque por paso, con
+    operaciones vectorizadas de NumPy.
+
+    Aplica las mismas reglas que `Combat`: el daño de `Combat.calculate_damage` (tomado de
+    `DamageTable`, que lo reproduce exactamente), la vida que no baja de 0, la entrada del
+    siguiente Pokémon al ser derrotado el activo y el orden de turnos por velocidad de
+    `Combat.__next_turn`. Los empates de velocidad se deciden con un generador `random.Random`
+    propio de cada combate, igual que `Combat` con el generador global, de modo que cada
+    combate puede repetirse con el motor escalar y comparar los resultados (`verify`).
+
+    Las políticas se aplican por lotes: `random` (ataque al azar), `greedy` (primer ataque de
+    mayor daño inmediato) o una tabla de NumPy con el movimiento elegido por [atacante][defensor].
+
+    Atributos:
+        PLAYER (int): Índice del jugador.
+        ENEMY (int): Índice de la IA.
+        DRAW (int): Valor de `winner` de los combates sin ganador.
+        POLICIES (tuple[str, ...]): Políticas disponibles por nombre.
+        roster (list[Pokemon]): Pokémon que pueden aparecer en los combates.
+        damage_table (DamageTable): Daño y efectividad de todos los Pokémon del conjunto.
+        teams (np.ndarray): Identificadores de los Pokémon por [combate][entrenador][posición].
+        active (np.ndarray): Posición del Pokémon activo por [combate][entrenador].
+        health (np.ndarray): Vida del Pokémon activo por [combate][entrenador].
+        turn (np.ndarray): Entrenador al que le toca atacar en cada combate.
+        winner (np.ndarray): Ganador de cada combate (DRAW si aún no terminó).
+        turns (np.ndarray): Ataques realizados en cada combate.
+        seed (int): Semilla de los desempates de velocidad y de la política `random`.
+        logs (dict[int, list[tuple[int, int]]]): Ataques (entrenador, movimiento) de los combates registrados.
+    """
+
+    PLAYER = 0
+    ENEMY = 1
+    DRAW = -1
+    POLICIES = ("random", "greedy")
+
+    def __init__(
+        self,
+        roster: list[Pokemon],
+        teams: np.ndarray,
+        damage_table: DamageTable | None = None,
+        seed: int = 0,
+        log_battles: list[int] | None = None,
+    ):
+        """
+        Prepara los combates con el primer Pokémon de cada equipo y decide quién empieza.
+
+        Args:
+            roster (list[Pokemon]): Pokémon que pueden aparecer en los combates.
+            teams (np.ndarray): Identificadores (posiciones en `roster`) por [combate][entrenador][posición].
+            damage_table (DamageTable | None): Tablas de daño de `roster`, en el mismo orden. Si es
+                None, se construyen con el nivel por defecto del combate.
+            seed (int): Semilla de los desempates de velocidad y de la política `random`.
+            log_battles (list[int] | None): Combates cuyos ataques se registran para `verify`.
+        """
+        self.roster = roster
+        self.damage_table = damage_table or DamageTable(
+            roster=roster, level=Combat.DEFAULT_POKEMON_LEVEL
+        )
+        self.seed = seed
+        self.teams = np.asarray(teams, dtype=np.int64)
+
+        battles = len(self.teams)
+        self.__damage = self.damage_table.damage
+        self.__max_health = np.array(
+            [pokemon.get_hp() for pokemon in roster], dtype=np.int64
+        )
+        self.__speed = np.array(
+            [pokemon.get_speed() for pokemon in roster], dtype=np.int64
+        )
+        self.__generator = np.random.default_rng(seed)
+        self.__tie_generators: dict[int, random.Random] = {}
+
+        self.active = np.zeros((battles, 2), dtype=np.int64)
+        self.health = self.__max_health[self.teams[:, :, 0]]
+        self.winner = np.full(battles, self.DRAW, dtype=np.int64)
+        self.turns = np.zeros(battles, dtype=np.int64)
+        self.turn = self.__speed_order(np.arange(battles))
+        self.logs: dict[int, list[tuple[int, int]]] = {
+            battle: [] for battle in (log_battles or [])
+        }
+        self.__logged = np.array(sorted(self.logs), dtype=np.int64)
+
+    def run(
+        self,
+        player_policy: str | np.ndarray = "random",
+        enemy_policy: str | np.ndarray = "greedy",
+        max_turns: int = 500,
+    ) -> None:
+        """
+        Avanza todos los combates hasta que terminen o alcancen el límite de ataques.
+
+        Args:
+            player_policy (str | np.ndarray): Política del jugador.
+            enemy_policy (str | np.ndarray): Política de la IA.
+            max_turns (int): Ataques máximos por combate; los que lo alcanzan quedan sin ganador.
+        """
+        while True:
+            rows = np.flatnonzero((self.winner == self.DRAW) & (self.turns < max_turns))
+            if len(rows) == 0:
+                return
+            self.step(rows=rows, policies=(player_policy, enemy_policy))
+
+    def step(self, rows: np.ndarray, policies: tuple[str | np.ndarray, ...]) -> None:
+        """
+        Realiza un ataque en cada uno de los combates indicados, como `Combat.set_attack`.
+
+        Args:
+            rows (np.ndarray): Combates sin ganador que avanzan en este paso.
+            policies (tuple[str | np.ndarray, ...]): Política del jugador y de la IA.
+        """
+        side = self.turn[rows]
+        defender = 1 - side
+        attacker_id = self.teams[rows, side, self.active[rows, side]]
+        defender_id = self.teams[rows, defender, self.active[rows, defender]]
+
+        slots = np.empty(len(rows), dtype=np.int64)
+        for trainer in (self.PLAYER, self.ENEMY):
+            mask = side == trainer
+            slots[mask] = self.__choose(
+                policy=policies[trainer],
+                attacker_id=attacker_id[mask],
+                defender_id=defender_id[mask],
+            )
+
+        for position in np.flatnonzero(np.isin(rows, self.__logged)).tolist():
+            self.logs[int(rows[position])].append(
+                (int(side[position]), int(slots[position]))
+            )
+
+        # Se aplica el daño; la vida nunca queda por debajo de 0, como en Trainer
+        health = (
+            self.health[rows, defender] - self.__damage[attacker_id, slots, defender_id]
+        )
+        self.health[rows, defender] = np.maximum(health, 0)
+        self.turn[rows] = defender
+        self.turns[rows] += 1
+
+        # Pokémon derrotados: entra el siguiente o el entrenador pierde el combate
+        fainted = health <= 0
+        fainted_rows = rows[fainted]
+        fainted_side = defender[fainted]
+        last = self.active[fainted_rows, fainted_side] == self.teams.shape[2] - 1
+
+        switch_rows = fainted_rows[~last]
+        switch_side = fainted_side[~last]
+        self.active[switch_rows, switch_side] += 1
+        self.health[switch_rows, switch_side] = self.__max_health[
+            self.teams[switch_rows, switch_side, self.active[switch_rows, switch_side]]
+        ]
+        self.winner[fainted_rows[last]] = 1 - fainted_side[last]
+
+        # Combat decide el turno por velocidad cada vez que un Pokémon es derrotado (también el
+        # último, así que el desempate consume el generador aunque el combate haya terminado)
+        self.turn[fainted_rows] = self.__speed_order(fainted_rows)
+
+    def get_results(self) -> list[tuple[str | None, int]]:
+        """
+        Obtiene el ganador y la cantidad de ataques de cada combate, con el formato del simulador.
+
+        Returns:
+            list[tuple[str | None, int]]: Nombre del ganador (`Player`, `Enemy` o None) y ataques.
+        """
+        names = {self.PLAYER: "Player", self.ENEMY: "Enemy", self.DRAW: None}
+        return [
+            (names[winner], turns)
+            for winner, turns in zip(self.winner.tolist(), self.turns.tolist())
+        ]
+
+    def verify(self, battle: int) -> bool:
+        """
+        Repite un combate registrado con el motor escalar (`Combat`) y compara el resultado.
+
+        Se comprueba, ataque por ataque, que le toque al mismo entrenador, y al final que
+        coincidan el ganador, los Pokémon activos y su vida.
+
+        Args:
+            battle (int): Combate a verificar (debe estar en `log_battles`).
+
+        Returns:
+            bool: True si ambos motores jugaron exactamente el mismo combate.
+
+        Raises:
+            ValueError: Si el combate no se registró.
+        """
+        if battle not in self.logs:
+            raise ValueError(f"Battle {battle} was not logged")
+
+        # El combate escalar desempata las velocidades con el generador global, con la misma semilla
+        random.seed(self.__tie_seed(battle))
+        trainers = [
+            [self.roster[pokemon_id] for pokemon_id in team]
+            for team in self.teams[battle].tolist()
+        ]
+        combat = Combat(
+            Player(trainers[self.PLAYER]),
+            Enemy(trainers[self.ENEMY], transposition_size=0, tablebase_size=0),
+        )
+
+        for side, slot in self.logs[battle]:
+            expected = (
+                CombatState.PLAYER_TURN
+                if side == self.PLAYER
+                else CombatState.ENEMY_TURN
+            )
+            if combat.get_state() != expected:
+                return False
+
+            pokemon = combat.get_players()[side].get_current_pokemon()
+            combat.set_attack(
+                attack=(
+                    pokemon.get_move_1_name(),
+                    pokemon.get_move_2_name(),
+                    pokemon.get_super_move_name(),
+                )[slot]
+            )
+
+        players = combat.get_players()
+        names = {self.PLAYER: "Player", self.ENEMY: "Enemy", self.DRAW: None}
+        return (
+            combat.get_winner() == names[int(self.winner[battle])]
+            and [trainer.get_current_index() for trainer in players]
+            == self.active[battle].tolist()
+            and [trainer.get_current_pokemon_health() for trainer in players]
+            == self.health[battle].tolist()
+        )
+
+    def __choose(
+        self, policy: str | np.ndarray, attacker_id: np.ndarray, defender_id: np.ndarray
+    ) -> np.ndarray:
+        """
+        Elige el movimiento de cada atacante según la política.
+
+        Args:
+            policy (str | np.ndarray): `random`, `greedy` o tabla de movimientos por [atacante][defensor].
+            attacker_id (np.ndarray): Pokémon que ataca en cada combate.
+            defender_id (np.ndarray): Pokémon que recibe el ataque en cada combate.
+
+        Returns:
+            np.ndarray: Posición del movimiento elegido en cada combate.
+
+        Raises:
+            ValueError: Si la política no existe.
+        """
+        if isinstance(policy, np.ndarray):
+            return policy[attacker_id, defender_id]
+
+        if policy == "random":
+            return self.__generator.integers(0, 3, size=len(attacker_id))
+
+        if policy == "greedy":
+            # argmax devuelve el primer máximo, igual que max sobre los tres ataques
+            return np.argmax(
+                self.__damage[attacker_id[:, None], np.arange(3), defender_id[:, None]],
+                axis=1,
+            )
+
+        raise ValueError(f"Unknown policy '{policy}'")
+
+    def __speed_order(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Decide a quién le toca atacar según la velocidad de los Pokémon activos, como `Combat.__next_turn`.
+
+        Args:
+            rows (np.ndarray): Combates en los que se decide el turno.
+
+        Returns:
+            np.ndarray: Entrenador que ataca a continuación en cada combate.
+        """
+        player_speed = self.__speed[
+            self.teams[rows, self.PLAYER, self.active[rows, self.PLAYER]]
+        ]
+        enemy_speed = self.__speed[
+            self.teams[rows, self.ENEMY, self.active[rows, self.ENEMY]]
+        ]
+        turn = np.where(player_speed > enemy_speed, self.PLAYER, self.ENEMY)
+
+        # Los empates son poco frecuentes: se deciden uno por uno con el generador de cada combate
+        for position in np.flatnonzero(player_speed == enemy_speed).tolist():
+            battle = int(rows[position])
+            if battle not in self.__tie_generators:
+                self.__tie_generators[battle] = random.Random(self.__tie_seed(battle))
+            turn[position] = self.__tie_generators[battle].choice([0, 1])
+
+        return turn
+
+    def __tie_seed(self, battle: int) -> str:
+        """
+        Obtiene la semilla de los desempates de velocidad de un combate.
+
+        Args:
+            battle (int): Número del combate.
+
+        Returns:
+            str: Semilla del generador del combate.
+        """
+        return f"{self.seed}:{battle}"
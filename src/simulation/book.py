@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.combat.combat import Combat
+from src.combat.matchups import MatchupMatrix
+from src.simulation import simulator
+from src.simulation.simulator import init_worker
+from src.trainers.enemy.ia import Enemy
+from src.trainers.enemy.opening_book import OpeningBook
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.enemy.team_selection import TeamSelector
+from src.trainers.trainers import Player
+
+
+def draw_book_teams(
+    battles: int, team_size: int, seed: int, counter: bool = False
+) -> list[tuple[tuple[str, ...], tuple[str, ...]]]:
+    """
+    Sortea los equipos de los combates para los que se genera el libro.
+
+    Los equipos son los mismos que usa `BattleSimulator` con la misma semilla y tamaño de equipo.
+
+    Args:
+        battles (int): Cantidad de combates.
+        team_size (int): Pokémon por equipo.
+        seed (int): Semilla de los sorteos.
+        counter (bool): Si es True, el equipo de la IA es el que elige `TeamSelector` contra el
+            equipo del jugador (como con el botón "IA auto" de la pantalla de selección).
+
+    Returns:
+        list[tuple[tuple[str, ...], tuple[str, ...]]]: Equipos del jugador y de la IA de cada combate.
+
+    Raises:
+        ValueError: Si no hay suficientes Pokémon para ambos equipos.
+    """
+    init_worker()
+    names = sorted(simulator._pokemon)
+    if 2 * team_size > len(names):
+        raise ValueError(
+            f"Not enough Pokémon for two teams of {team_size} without repetitions "
+            f"(the Pokédex has {len(names)})"
+        )
+    selector = (
+        TeamSelector(
+            MatchupMatrix.load_or_build(
+                roster=[simulator._pokemon[name] for name in names],
+                level=Combat.DEFAULT_POKEMON_LEVEL,
+                damage_table=simulator._damage_table,
+            )
+        )
+        if counter
+        else None
+    )
+
+    teams = []
+    for index in range(battles):
+        sample = random.Random(f"{seed}:{index}").sample(names, 2 * team_size)
+        player, enemy = sample[:team_size], sample[team_size:]
+        if selector is not None:
+            enemy = selector.select(player, size=team_size)
+        teams.append((tuple(player), tuple(enemy)))
+    return teams
+
+
+def generate_book_entries(
+    teams: list[tuple[tuple[str, ...], tuple[str, ...]]],
+    depth: int,
+    plies: int,
+    options: dict,
+) -> dict[int, int]:
+    """
+    Genera las entradas del libro para un bloque de combates dentro de un proceso trabajador.
+
+    Es una función de módulo para que pueda enviarse a otros procesos.
+
+    Args:
+        teams (list[tuple[tuple[str, ...], tuple[str, ...]]]): Equipos de cada combate.
+        depth (int): Profundidad de búsqueda de cada posición.
+        plies (int): Ataques desde el inicio del combate que cubre el libro.
+        options (dict): Opciones de `Enemy` para la búsqueda.
+
+    Returns:
+        dict[int, int]: Posición del ataque elegido por clave de posición.
+    """
+    init_worker()
+    book = OpeningBook(depth=depth, plies=plies)
+    options = {
+        **options,
+        "depth": depth,
+        "time_budget": None,
+        "workers": 0,
+        "opening_book": None,
+    }
+
+    for player, enemy in teams:
+        # La IA del combate es también la que busca las posiciones del libro
+        searcher = Enemy([simulator._pokemon[name] for name in enemy], **options)
+        combat = Combat(
+            Player([simulator._pokemon[name] for name in player]),
+            searcher,
+            damage_table=simulator._damage_table,
+        )
+        book.add(state=SearchState(combat), searcher=searcher)
+    return book.entries
+
+
+def build_opening_book(
+    teams: list[tuple[tuple[str, ...], tuple[str, ...]]],
+    book: OpeningBook,
+    options: dict | None = None,
+    workers: int = 0,
+) -> OpeningBook:
+    """
+    Agrega al libro las posiciones de los primeros turnos de cada combate, repartiendo los
+    combates entre varios procesos.
+
+    Args:
+        teams (list[tuple[tuple[str, ...], tuple[str, ...]]]): Equipos de cada combate.
+        book (OpeningBook): Libro al que se agregan las entradas (define profundidad y ataques).
+        options (dict | None): Opciones de `Enemy` para la búsqueda (salvo la profundidad).
+        workers (int): Procesos trabajadores. Con 0 o 1 se genera en el proceso actual.
+
+    Returns:
+        OpeningBook: El mismo libro, con las entradas nuevas.
+    """
+    options = options or {}
+
+    if workers <= 1:
+        entries = [generate_book_entries(teams, book.depth, book.plies, options)]
+    else:
+        chunk = max(1, min(16, len(teams) // (workers * 8)))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        ) as executor:
+            futures = [
+                executor.submit(
+                    generate_book_entries,
+                    teams[first : first + chunk],
+                    book.depth,
+                    book.plies,
+                    options,
+                )
+                for first in range(0, len(teams), chunk)
+            ]
+            entries = [future.result() for future in futures]
+
+    for part in entries:
+        book.entries.update(part)
+    return book
+
+
+def main() -> None:
+    """
+    Genera el libro de aperturas desde la línea de comandos: `python -m src.simulation.book`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulation.book",
+        description="Genera el libro de aperturas de la IA buscando con más profundidad las "
+        "posiciones de los primeros turnos.",
+    )
+    parser.add_argument(
+        "--battles",
+        type=int,
+        default=1000,
+        help="combates sorteados (los mismos equipos que `python -m src.simulation`)",
+    )
+    parser.add_argument("--team-size", type=int, default=5, help="Pokémon por equipo")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de los sorteos")
+    parser.add_argument(
+        "--counter",
+        action="store_true",
+        help="la IA usa el equipo que elige el botón 'IA auto' contra el equipo del jugador",
+    )
+    parser.add_argument(
+        "--player", help="equipo del jugador separado por comas (en lugar de sortearlo)"
+    )
+    parser.add_argument(
+        "--enemy", help="equipo de la IA separado por comas (en lugar de sortearlo)"
+    )
+    parser.add_argument(
+        "--depth", type=int, default=16, help="profundidad de búsqueda del libro"
+    )
+    parser.add_argument(
+        "--plies",
+        type=int,
+        default=4,
+        help="ataques desde el inicio del combate que cubre el libro",
+    )
+    parser.add_argument(
+        "--options",
+        type=json.loads,
+        default={},
+        help="otras opciones de Enemy para la búsqueda, en JSON",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="procesos trabajadores (por defecto, uno por núcleo)",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="archivo del libro (por defecto, el que usa el juego); si ya existe con la misma "
+        "profundidad, se le agregan las entradas nuevas",
+    )
+    args = parser.parse_args()
+
+    if (args.player is None) != (args.enemy is None):
+        parser.error("--player and --enemy must be given together")
+
+    if args.player is not None:
+        teams = [(tuple(args.player.split(",")), tuple(args.enemy.split(",")))]
+    else:
+        teams = draw_book_teams(
+            battles=args.battles,
+            team_size=args.team_size,
+            seed=args.seed,
+            counter=args.counter,
+        )
+
+    output = args.output or OpeningBook.get_default_path()
+    book = OpeningBook(depth=args.depth, plies=args.plies)
+    existing = OpeningBook()
+    if existing.load(output) and existing.depth == args.depth:
+        book.entries = existing.entries
+
+    started = time.perf_counter()
+    previous = len(book.entries)
+    build_opening_book(
+        teams=teams, book=book, options=args.options, workers=args.workers
+    )
+    book.save(output)
+
+    print(
+        f"Posiciones nuevas: {len(book.entries) - previous} "
+        f"(total {len(book.entries)}) en {time.perf_counter() - started:.1f} s"
+    )
+    print(f"Libro guardado en {output}")
+
+
+if __name__ == "__main__":
+    main()
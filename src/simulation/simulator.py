@@ -0,0 +1,421 @@
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.combat.combat import Combat, CombatState
+from src.combat.damage_table import DamageTable
+from src.dataset.dataset import Dataset
+from src.pokemon.pokemon import Pokemon
+from src.simulation.batch import BatchCombat, random_teams
+from src.trainers.enemy.ia import Enemy
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.trainers import Player, Trainer
+
+# Estado de cada proceso trabajador: los Pokémon de la Pokédex y sus tablas de daño, que se
+# cargan una sola vez y se comparten entre todos los combates del proceso
+_pokemon: dict[str, Pokemon] = {}
+_damage_table: DamageTable | None = None
+
+
+def init_worker() -> None:
+    """
+    Carga la Pokédex y construye las tablas de daño del proceso, si aún no se hizo.
+    """
+    global _damage_table
+
+    if _damage_table is not None:
+        return
+
+    for data in Dataset().get_all_pokemon():
+        _pokemon[data["Nombre"]] = Pokemon(data)
+    _damage_table = DamageTable(
+        roster=list(_pokemon.values()), level=Combat.DEFAULT_POKEMON_LEVEL
+    )
+
+
+def simulate_battles(
+    config: dict, first: int, count: int
+) -> list[tuple[str | None, int]]:
+    """
+    Juega un bloque de combates consecutivos dentro de un proceso trabajador.
+
+    Es una función de módulo para que pueda enviarse a otros procesos.
+
+    Args:
+        config (dict): Opciones del simulador, con el formato de `BattleSimulator.get_config`.
+        first (int): Número del primer combate del bloque.
+        count (int): Cantidad de combates del bloque.
+
+    Returns:
+        list[tuple[str | None, int]]: Ganador (None si se alcanzó el límite de ataques) y
+            cantidad de ataques de cada combate.
+    """
+    init_worker()
+    return [simulate_battle(config, index) for index in range(first, first + count)]
+
+
+def simulate_battle(config: dict, index: int) -> tuple[str | None, int]:
+    """
+    Juega un combate completo sin interfaz. Los equipos y los desempates de velocidad dependen
+    solo de la semilla y del número de combate, así que cada combate es reproducible.
+
+    Args:
+        config (dict): Opciones del simulador, con el formato de `BattleSimulator.get_config`.
+        index (int): Número del combate.
+
+    Returns:
+        tuple[str | None, int]: Ganador (None si se alcanzó el límite de ataques) y cantidad de ataques.
+    """
+    rng = random.Random(f"{config['seed']}:{index}")
+    # El combate usa el generador global para desempatar velocidades
+    random.seed(f"{config['seed']}:{index}:combat")
+
+    names = rng.sample(sorted(_pokemon), 2 * config["team_size"])
+    player_team = [_pokemon[name] for name in names[: config["team_size"]]]
+    enemy_team = [_pokemon[name] for name in names[config["team_size"] :]]
+
+    combat = Combat(
+        Player(player_team),
+        Enemy(enemy_team, **config["enemy_options"]),
+        damage_table=_damage_table,
+    )
+    # La IA del jugador busca sobre el estado con los entrenadores intercambiados
+    player_ai = (
+        Enemy(player_team, **config["player_options"])
+        if config["player_policy"] == "ai"
+        else None
+    )
+
+    turns = 0
+    while combat.get_state() != CombatState.WINNER and turns < config["max_turns"]:
+        if combat.get_state() == CombatState.ENEMY_TURN:
+            if config["enemy_policy"] == "ai":
+                combat.enemy_set_attack()
+            else:
+                combat.set_attack(
+                    attack=choose_policy_attack(
+                        combat=combat, side=1, policy=config["enemy_policy"], rng=rng
+                    )
+                )
+        elif player_ai is not None:
+            combat.set_attack(
+                attack=player_ai.search_attack(state=SearchState(combat).flipped())
+            )
+        else:
+            combat.set_attack(
+                attack=choose_policy_attack(
+                    combat=combat, side=0, policy=config["player_policy"], rng=rng
+                )
+            )
+        turns += 1
+
+    return combat.get_winner(), turns
+
+
+def choose_policy_attack(
+    combat: Combat, side: int, policy: str, rng: random.Random
+) -> str:
+    """
+    Elige el ataque de un entrenador sin búsqueda: al azar o el de mayor daño inmediato.
+
+    Args:
+        combat (Combat): Combate en curso.
+        side (int): Índice del entrenador que ataca (0 para el jugador, 1 para la IA).
+        policy (str): `random` o `greedy`.
+        rng (random.Random): Generador con el que se elige al azar.
+
+    Returns:
+        str: Nombre del ataque elegido.
+    """
+    trainers: tuple[Trainer, Trainer] = combat.get_players()
+    attacker, defender = trainers[side], trainers[1 - side]
+    pokemon = attacker.get_current_pokemon()
+    attacks = [
+        pokemon.get_move_1_name(),
+        pokemon.get_move_2_name(),
+        pokemon.get_super_move_name(),
+    ]
+
+    if policy == "random":
+        return rng.choice(attacks)
+
+    # Se elige el primer ataque con mayor daño contra el Pokémon rival actual
+    return max(
+        attacks,
+        key=lambda attack: combat.calculate_damage(
+            current_trainer=attacker, next_trainer=defender, attack=attack
+        ),
+    )
+
+
+class SimulationReport:
+    """
+    Resultados de una serie de combates simulados.
+
+    Atributos:
+        battles (int): Cantidad de combates jugados.
+        wins (dict[str, int]): Victorias del jugador (`Player`), de la IA (`Enemy`) y combates
+            que alcanzaron el límite de ataques (`draw`).
+        turns (list[int]): Cantidad de ataques de cada combate.
+        elapsed (float): Segundos que tardó la simulación completa.
+        verified (int): Combates del motor por lotes repetidos con el motor escalar.
+        mismatches (list[int]): Combates verificados en los que ambos motores no coinciden.
+    """
+
+    def __init__(
+        self,
+        results: list[tuple[str | None, int]],
+        elapsed: float,
+        verified: int = 0,
+        mismatches: list[int] | None = None,
+    ) -> None:
+        """
+        Resume los resultados de los combates.
+
+        Args:
+            results (list[tuple[str | None, int]]): Ganador y cantidad de ataques de cada combate.
+            elapsed (float): Segundos que tardó la simulación.
+            verified (int): Combates verificados con el motor escalar.
+            mismatches (list[int] | None): Combates verificados que no coinciden.
+        """
+        self.battles = len(results)
+        self.wins = {"Player": 0, "Enemy": 0, "draw": 0}
+        for winner, _ in results:
+            self.wins[winner or "draw"] += 1
+        self.turns = [turns for _, turns in results]
+        self.elapsed = elapsed
+        self.verified = verified
+        self.mismatches = mismatches or []
+
+    def get_win_rate(self, name: str) -> float:
+        """
+        Calcula la proporción de combates ganados por un entrenador.
+
+        Args:
+            name (str): `Player`, `Enemy` o `draw`.
+
+        Returns:
+            float: Proporción entre 0 y 1.
+        """
+        return self.wins[name] / self.battles if self.battles else 0.0
+
+    def get_battles_per_second(self) -> float:
+        """
+        Calcula los combates jugados por segundo.
+
+        Returns:
+            float: Combates por segundo.
+        """
+        return self.battles / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Convierte el resumen en un diccionario.
+
+        Returns:
+            dict: Victorias, proporciones, estadísticas de ataques por combate y velocidad.
+        """
+        return {
+            "battles": self.battles,
+            "wins": dict(self.wins),
+            "win_rate": {name: self.get_win_rate(name) for name in self.wins},
+            "turns": {
+                "mean": statistics.mean(self.turns) if self.turns else 0.0,
+                "median": statistics.median(self.turns) if self.turns else 0.0,
+                "min": min(self.turns, default=0),
+                "max": max(self.turns, default=0),
+            },
+            "elapsed": self.elapsed,
+            "battles_per_second": self.get_battles_per_second(),
+            "verified": self.verified,
+            "mismatches": list(self.mismatches),
+        }
+
+
+class BattleSimulator:
+    """
+    Juega combates completos sin interfaz, con ambos entrenadores controlados por políticas
+    automáticas, y reparte los combates entre varios procesos.
+
+    Las políticas son `ai` (la búsqueda de `Enemy`, con las opciones indicadas), `random` (ataque
+    al azar) y `greedy` (ataque de mayor daño inmediato). Los equipos de cada combate se sortean
+    de la Pokédex a partir de la semilla y del número de combate, así que los resultados no
+    dependen de la cantidad de procesos.
+
+    Con el motor `batch`, los combates se juegan todos a la vez con `BatchCombat` en el proceso
+    actual (solo con las políticas `random` y `greedy`), y una muestra se repite con el motor
+    escalar para comprobar que ambos coinciden.
+
+    Atributos:
+        POLICIES (tuple[str, ...]): Políticas disponibles.
+        ENGINES (tuple[str, ...]): Motores de combate disponibles.
+        player_policy (str): Política del jugador.
+        enemy_policy (str): Política de la IA.
+        player_options (dict): Opciones de `Enemy` para el jugador, si usa la política `ai`.
+        enemy_options (dict): Opciones de `Enemy` para la IA.
+        team_size (int): Pokémon por equipo.
+        max_turns (int): Ataques máximos por combate; si se alcanzan, el combate es un empate.
+        workers (int): Procesos trabajadores. Con 0 o 1 se juega en el proceso actual.
+        seed (int): Semilla de los sorteos.
+        engine (str): Motor de combate: `scalar` (un `Combat` por combate) o `batch`.
+        verify (int): Combates del motor por lotes que se verifican con el motor escalar.
+    """
+
+    POLICIES = ("ai", "random", "greedy")
+    ENGINES = ("scalar", "batch")
+
+    def __init__(
+        self,
+        player_policy: str = "random",
+        enemy_policy: str = "ai",
+        player_options: dict | None = None,
+        enemy_options: dict | None = None,
+        team_size: int = 5,
+        max_turns: int = 500,
+        workers: int = 0,
+        seed: int = 0,
+        engine: str = "scalar",
+        verify: int = 0,
+    ):
+        """
+        Inicializa el simulador.
+
+        Args:
+            player_policy (str): Política del jugador.
+            enemy_policy (str): Política de la IA.
+            player_options (dict | None): Opciones de `Enemy` para el jugador.
+            enemy_options (dict | None): Opciones de `Enemy` para la IA. Cada combate ya corre en
+                su propio proceso, por eso la búsqueda de cada IA siempre es secuencial.
+            team_size (int): Pokémon por equipo.
+            max_turns (int): Ataques máximos por combate.
+            workers (int): Procesos trabajadores.
+            seed (int): Semilla de los sorteos.
+            engine (str): Motor de combate: `scalar` o `batch`.
+            verify (int): Combates del motor por lotes que se verifican con el motor escalar.
+
+        Raises:
+            ValueError: Si alguna política o el motor no existen, si el motor por lotes no admite
+                la política o si el tamaño de los equipos no es válido (menor que 1 o mayor que la
+                mitad de la Pokédex).
+        """
+        for policy in (player_policy, enemy_policy):
+            if policy not in self.POLICIES:
+                raise ValueError(f"Unknown policy '{policy}'")
+            if engine == "batch" and policy not in BatchCombat.POLICIES:
+                raise ValueError(f"The batch engine does not support policy '{policy}'")
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'")
+        if team_size < 1:
+            raise ValueError("team_size must be positive")
+        # Se comprueba aquí y no en los procesos trabajadores, donde fallaría el sorteo
+        roster_size = len(Dataset().get_all_pokemon_names())
+        if 2 * team_size > roster_size:
+            raise ValueError(
+                f"Not enough Pokémon for two teams of {team_size} without repetitions "
+                f"(the Pokédex has {roster_size})"
+            )
+
+        self.player_policy = player_policy
+        self.enemy_policy = enemy_policy
+        self.player_options = {**(player_options or {}), "workers": 0}
+        self.enemy_options = {**(enemy_options or {}), "workers": 0}
+        self.team_size = team_size
+        self.max_turns = max_turns
+        self.workers = workers
+        self.seed = seed
+        self.engine = engine
+        self.verify = verify
+
+    def get_config(self) -> dict:
+        """
+        Obtiene las opciones del simulador en la forma en que se envían a los procesos trabajadores.
+
+        Returns:
+            dict: Opciones del simulador.
+        """
+        return {
+            "player_policy": self.player_policy,
+            "enemy_policy": self.enemy_policy,
+            "player_options": self.player_options,
+            "enemy_options": self.enemy_options,
+            "team_size": self.team_size,
+            "max_turns": self.max_turns,
+            "seed": self.seed,
+        }
+
+    def run(self, battles: int) -> SimulationReport:
+        """
+        Juega la cantidad de combates indicada.
+
+        Args:
+            battles (int): Cantidad de combates.
+
+        Returns:
+            SimulationReport: Resumen de los resultados.
+        """
+        if self.engine == "batch":
+            return self.run_batch(battles=battles)
+
+        config = self.get_config()
+        started = time.perf_counter()
+
+        if self.workers <= 1:
+            results = simulate_battles(config, 0, battles)
+        else:
+            # Bloques pequeños para repartir bien la carga, ya que la duración de los combates varía
+            chunk = max(1, min(64, battles // (self.workers * 8)))
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        simulate_battles, config, first, min(chunk, battles - first)
+                    )
+                    for first in range(0, battles, chunk)
+                ]
+                results = [result for future in futures for result in future.result()]
+
+        return SimulationReport(results=results, elapsed=time.perf_counter() - started)
+
+    def run_batch(self, battles: int) -> SimulationReport:
+        """
+        Juega todos los combates a la vez con el motor por lotes y verifica una muestra con el motor escalar.
+
+        Args:
+            battles (int): Cantidad de combates.
+
+        Returns:
+            SimulationReport: Resumen de los resultados, con los combates que no coinciden.
+        """
+        init_worker()
+        roster = list(_pokemon.values())
+        sample = random.Random(self.seed).sample(
+            range(battles), min(self.verify, battles)
+        )
+
+        started = time.perf_counter()
+        engine = BatchCombat(
+            roster=roster,
+            teams=random_teams(
+                battles=battles,
+                roster_size=len(roster),
+                team_size=self.team_size,
+                seed=self.seed,
+            ),
+            damage_table=_damage_table,
+            seed=self.seed,
+            log_battles=sample,
+        )
+        engine.run(
+            player_policy=self.player_policy,
+            enemy_policy=self.enemy_policy,
+            max_turns=self.max_turns,
+        )
+        elapsed = time.perf_counter() - started
+
+        return SimulationReport(
+            results=engine.get_results(),
+            elapsed=elapsed,
+            verified=len(sample),
+            mismatches=[battle for battle in sample if not engine.verify(battle)],
+        )
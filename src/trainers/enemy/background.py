@@ -0,0 +1,285 @@
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.enemy.stats import SearchStats
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from src.combat.combat import Combat
+    from src.trainers.enemy.ia import Enemy
+
+# Estado del proceso trabajador: el buscador (con su tabla de transposición, que se conserva
+# entre turnos), el evento de parada de cada búsqueda en curso y las búsquedas canceladas
+# antes de empezar
+_enemy: "Enemy | None" = None
+_lock = threading.Lock()
+_running: dict[int, threading.Event] = {}
+_cancelled: set[int] = set()
+
+
+def init_worker(pokemon: list, options: dict, stops: "Queue") -> None:
+    """
+    Construye el buscador del proceso trabajador y empieza a escuchar los pedidos de parada.
+
+    Args:
+        pokemon (list): Pokémon de la IA.
+        options (dict): Opciones de búsqueda del enemigo original.
+        stops (Queue): Cola por la que llegan los identificadores de las búsquedas a detener.
+    """
+    global _enemy
+
+    # Se importa aquí para evitar la importación circular con el módulo de la IA
+    from src.trainers.enemy.ia import Enemy
+
+    _enemy = Enemy(pokemon, **options)
+    threading.Thread(target=watch_stops, args=(stops,), daemon=True).start()
+
+
+def watch_stops(stops: "Queue") -> None:
+    """
+    Detiene las búsquedas pedidas por el proceso principal. Se ejecuta en un hilo del trabajador
+    que pasa casi todo el tiempo bloqueado esperando la cola.
+
+    Args:
+        stops (Queue): Cola por la que llegan los identificadores de las búsquedas a detener.
+    """
+    while True:
+        job = stops.get()
+
+        with _lock:
+            if job in _running:
+                _running[job].set()
+            else:
+                # La búsqueda todavía no empezó: se descarta cuando llegue
+                _cancelled.add(job)
+
+
+def run_search(job: int, payload: bytes) -> tuple[str | None, dict]:
+    """
+    Ejecuta una búsqueda dentro del proceso trabajador.
+
+    Args:
+        job (int): Identificador de la búsqueda.
+        payload (bytes): Estado compacto del combate serializado con pickle (le toca a la IA).
+
+    Returns:
+        tuple[str | None, dict]: Ataque elegido (None si se detuvo) y estadísticas.
+    """
+    # Se importa aquí para evitar la importación circular con el módulo de la IA
+    from src.trainers.enemy.ia import SearchTimeout
+
+    stop_event = threading.Event()
+    with _lock:
+        if job in _cancelled:
+            _cancelled.discard(job)
+            return None, SearchStats().to_dict()
+        _running[job] = stop_event
+
+    try:
+        # Muchas búsquedas del trabajador son anticipadas y se descartan: el proceso principal
+        # registra las estadísticas solo de las que usa
+        attack = _enemy.search_attack(
+            state=pickle.loads(payload), stop_event=stop_event, log_stats=False
+        )
+    except (SearchTimeout, ValueError):
+        # Una búsqueda detenida antes de completar una iteración no tiene ataque
+        attack = None
+    finally:
+        with _lock:
+            del _running[job]
+
+    return attack, _enemy.stats.to_dict()
+
+
+class BackgroundSearch:
+    """
+    Ejecuta la búsqueda de la IA en un proceso aparte para no bloquear el bucle de la interfaz.
+
+    Se usa un proceso y no un hilo porque la búsqueda es puro cálculo en Python: en un hilo
+    competiría por el GIL con el dibujado y los cuadros se alargarían. El estado del combate se
+    copia en forma compacta en el hilo que llama a `start`, por lo que la búsqueda nunca lee el
+    combate mientras la interfaz lo dibuja. Las búsquedas se ejecutan de una en una en el mismo
+    proceso, que conserva su tabla de transposición entre turnos.
+
+    Mientras el jugador elige su ataque, `ponder` busca de antemano la respuesta de la IA a cada
+    uno de sus tres movimientos. Cuando empieza el turno de la IA, `start` reutiliza la búsqueda
+    de la posición que realmente se alcanzó (identificada por su clave Zobrist) y cancela las
+    demás; si ninguna coincide, la búsqueda nueva parte de la tabla ya llena por las anticipadas.
+    Solo las búsquedas cuyo ataque se usa se agregan al `stats_log` del enemigo, marcando si
+    fueron anticipadas.
+
+    Atributos:
+        enemy (Enemy): Enemigo cuyas opciones de búsqueda usa el proceso trabajador.
+    """
+
+    def __init__(self, enemy: "Enemy"):
+        """
+        Inicializa el ejecutor de búsquedas en segundo plano. El proceso se crea con la primera búsqueda.
+
+        Args:
+            enemy (Enemy): Enemigo cuyas opciones de búsqueda usa el proceso trabajador.
+        """
+        self.enemy = enemy
+        self.__stops = multiprocessing.Queue()
+        # El trabajador ya corre en su propio proceso, por eso busca en forma secuencial
+        self.__executor = ProcessPoolExecutor(
+            max_workers=1,
+            initializer=init_worker,
+            initargs=(
+                enemy.get_pokemon(),
+                {**enemy.get_search_options(), "workers": 0},
+                self.__stops,
+            ),
+        )
+        self.__future: Future | None = None
+        self.__job = 0
+        self.__running_job = 0
+        # Indica si la búsqueda en curso es una anticipada que se reutilizó
+        self.__pondered = False
+        # Búsquedas anticipadas por clave de la posición: (identificador, futuro)
+        self.__pondering: dict[int, tuple[int, Future]] = {}
+
+    def start(self, combat: "Combat") -> None:
+        """
+        Inicia la búsqueda del ataque de la IA para el estado actual del combate.
+
+        Si la posición se buscó de antemano con `ponder`, se reutiliza esa búsqueda. Las demás
+        búsquedas anticipadas y la búsqueda anterior, si seguía en curso, se cancelan.
+
+        Args:
+            combat (Combat): Combate en el que le toca a la IA.
+        """
+        self.cancel()
+        state = SearchState(combat)
+        pondered = self.__pondering.pop(state.get_key(True), None)
+        self.cancel_ponder()
+
+        self.__pondered = pondered is not None
+        if pondered is not None:
+            self.__running_job, self.__future = pondered
+            return
+
+        self.__running_job, self.__future = self.__submit(state)
+
+    def ponder(self, combat: "Combat") -> None:
+        """
+        Busca de antemano la respuesta de la IA a cada ataque posible del jugador.
+
+        Las búsquedas se encolan empezando por el ataque que más daño causa, que es el que el
+        jugador tiene más probabilidad de elegir. Las búsquedas anticipadas anteriores se cancelan.
+
+        Args:
+            combat (Combat): Combate en el que le toca al jugador.
+        """
+        self.cancel_ponder()
+        state = SearchState(combat)
+        player, enemy = state.active
+        damage = state.damage[SearchState.PLAYER][player]
+        slots = sorted(range(3), key=lambda slot: damage[slot][enemy], reverse=True)
+
+        for slot in slots:
+            state.make_move(SearchState.PLAYER, slot)
+            # Si el ataque gana el combate, la IA no llega a responder
+            if state.winner is None:
+                self.__pondering[state.get_key(True)] = self.__submit(state)
+            state.unmake_move()
+
+    def cancel_ponder(self) -> None:
+        """
+        Cancela las búsquedas anticipadas que no se hayan reutilizado.
+        """
+        for job, future in self.__pondering.values():
+            self.__cancel_job(job, future)
+        self.__pondering.clear()
+
+    def __submit(self, state: SearchState) -> tuple[int, Future]:
+        """
+        Encola una búsqueda en el proceso trabajador.
+
+        Args:
+            state (SearchState): Estado en el que le toca a la IA. Se serializa en este momento,
+                por lo que puede modificarse después.
+
+        Returns:
+            tuple[int, Future]: Identificador de la búsqueda y su futuro.
+        """
+        self.__job += 1
+        return self.__job, self.__executor.submit(
+            run_search, self.__job, pickle.dumps(state)
+        )
+
+    def __cancel_job(self, job: int, future: Future) -> None:
+        """
+        Cancela una búsqueda: si aún no se envió al trabajador se descarta, y si ya empezó se le
+        pide que se detenga en su siguiente nodo.
+
+        Args:
+            job (int): Identificador de la búsqueda.
+            future (Future): Futuro de la búsqueda.
+        """
+        if not future.cancel() and not future.done():
+            self.__stops.put(job)
+
+    def is_running(self) -> bool:
+        """
+        Indica si hay una búsqueda iniciada cuyo resultado aún no se ha consumido.
+
+        Returns:
+            bool: True si hay una búsqueda pendiente o terminada sin consumir.
+        """
+        return self.__future is not None
+
+    def done(self) -> bool:
+        """
+        Indica si la búsqueda iniciada ya terminó.
+
+        Returns:
+            bool: True si el resultado está disponible.
+        """
+        return self.__future is not None and self.__future.done()
+
+    def result(self) -> str:
+        """
+        Consume el resultado de la búsqueda, esperándola si aún no terminó.
+
+        Returns:
+            str: Ataque elegido por la IA.
+
+        Raises:
+            RuntimeError: Si no hay ninguna búsqueda iniciada.
+            ValueError: Si la búsqueda no encontró un ataque válido.
+        """
+        if self.__future is None:
+            raise RuntimeError("No enemy search has been started")
+
+        future, self.__future = self.__future, None
+        attack, stats = future.result()
+        self.enemy.stats = SearchStats.from_dict(stats)
+
+        if attack is None:
+            raise ValueError("No valid attack found")
+
+        self.enemy.write_stats(attack, pondered=self.__pondered)
+        return attack
+
+    def cancel(self) -> None:
+        """
+        Cancela la búsqueda en curso, si existe, sin esperar a que termine.
+        """
+        if self.__future is None:
+            return
+
+        future, self.__future = self.__future, None
+        self.__cancel_job(self.__running_job, future)
+
+    def shutdown(self) -> None:
+        """
+        Cancela las búsquedas en curso, si existen, y detiene el proceso trabajador.
+        """
+        self.cancel()
+        self.cancel_ponder()
+        self.__executor.shutdown(wait=True)
+        self.__stops.close()
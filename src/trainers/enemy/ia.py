@@ -1,74 +1,250 @@
-import copy
-from typing import TYPE_CHECKING, Callable
+import os
+import threading
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
 from src.trainers.trainers import Trainer
+from src.trainers.enemy.mcts import MonteCarloSearch
+from src.trainers.enemy.opening_book import OpeningBook
+from src.trainers.enemy.ordering import MoveOrdering
+from src.trainers.enemy.parallel import ParallelSearch
+from src.trainers.enemy.search_cache import PersistentSearchCache
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.enemy.stats import SearchStats
+from src.trainers.enemy.tablebase import Tablebase
+from src.trainers.enemy.transposition import TranspositionTable
 
 if TYPE_CHECKING:
     from src.combat.combat import Combat
 
 
+class SearchTimeout(Exception):
+    """
+    Excepción interna que interrumpe la búsqueda cuando se agota el tiempo del turno.
+    """
+
+
 class Enemy(Trainer):
     """
     Clase que representa a un entrenador enemigo controlado por IA.
     Implementa lógica de heurística y el algoritmo Minimax con poda alfa-beta
-    para seleccionar el mejor ataque posible en combate.
+    para seleccionar el mejor ataque posible en combate. Como alternativa, puede
+    usar una búsqueda en árbol Monte Carlo (`engine="mcts"`).
+
+    Atributos:
+        depth (int): Profundidad de búsqueda usada por choose_attack.
+        time_budget (float | None): Segundos por turno para la profundización iterativa.
+        max_depth (int): Profundidad máxima de la profundización iterativa.
+        transposition_table (TranspositionTable | None): Tabla de posiciones ya buscadas, compartida entre turnos.
+        move_ordering (MoveOrdering | None): Ordenamiento de ataques (daño esperado, killer moves e historia).
+        stats (SearchStats): Contadores de la última búsqueda de choose_attack.
+        parallel (ParallelSearch | None): Búsqueda repartida entre procesos, si está activada.
+        tablebase_size (int): Pokémon por entrenador a partir de los cuales se usa la tabla de finales.
+        tablebase_dir (str | None): Carpeta donde se guardan y cargan las tablas de finales.
+        tablebases (dict[str, Tablebase]): Tablas de finales ya generadas o cargadas, por equipos.
+        ENGINES (tuple[str, ...]): Motores de búsqueda disponibles.
+        engine (str): Motor de búsqueda usado por choose_attack (`minimax` o `mcts`).
+        mcts (MonteCarloSearch | None): Búsqueda Monte Carlo, si es el motor elegido.
+        stats_log (str | None): Archivo JSONL al que se agregan las estadísticas de cada turno.
+        trace_memory (bool): Indica si se mide el pico de memoria de cada búsqueda.
+        opening_book (OpeningBook | None): Libro con los ataques de los primeros turnos, si se cargó.
+        search_cache (PersistentSearchCache | None): Posiciones buscadas guardadas en disco entre ejecuciones.
 
     Métodos:
-        evaluate_heuristic(combat: "Combat", maximizing: bool) -> float:
+        evaluate_heuristic(state: SearchState, maximizing: bool) -> float:
             Evalúa el estado actual del combate y retorna un valor heurístico.
 
-        generate_possible_attacks(combat: "Combat", is_ia: bool) -> list[tuple[str, "Combat"]]:
-            Genera todas las combinaciones posibles de ataques y sus estados resultantes.
+        generate_possible_attacks(state: SearchState, is_ia: bool) -> list[tuple[str, int]]:
+            Genera los ataques posibles del entrenador que tiene el turno.
 
-        minmax(combat: "Combat", depth: int, alpha: float, beta: float, maximizing: bool) -> tuple[str | None, float]:
+        minmax(state: SearchState, depth: int, alpha: float, beta: float, maximizing: bool) -> tuple[str | None, float]:
             Implementa el algoritmo Minimax con poda alfa-beta para determinar el mejor ataque.
 
+        parallel_minmax(state: SearchState, depth: int) -> tuple[str | None, float]:
+            Reparte la búsqueda Minimax entre varios procesos.
+
+        iterative_deepening(state: SearchState, time_budget: float) -> tuple[str | None, int]:
+            Busca con profundidad creciente hasta agotar el tiempo disponible.
+
+        probe_opening_book(state: SearchState) -> str | None:
+            Obtiene el ataque del libro de aperturas si la posición está en el libro.
+
+        probe_tablebase(state: SearchState) -> str | None:
+            Obtiene el ataque exacto de la tabla de finales si el combate ya está en el final.
+
         choose_attack(combat: "Combat") -> str:
-            Selecciona el mejor ataque posible usando Minimax.
+            Selecciona el mejor ataque posible usando Minimax. Las estadísticas quedan en `stats`.
+
+        choose_attack_with_stats(combat: "Combat") -> tuple[str, SearchStats]:
+            Selecciona el mejor ataque y retorna también las estadísticas de esa búsqueda.
+
+        search_attack(state: SearchState, stop_event: threading.Event | None, log_stats: bool) -> str:
+            Selecciona el mejor ataque a partir de un estado compacto, sin leer el combate.
+
+        write_stats(attack: str, **fields) -> None:
+            Agrega las estadísticas de la última búsqueda a `stats_log`, si se indicó.
+
+        get_search_options() -> dict:
+            Retorna las opciones de búsqueda con las que se construyó el enemigo.
     """
 
-    def __init__(self, pokemon: list):
+    ENGINES = ("minimax", "mcts")
+
+    def __init__(
+        self,
+        pokemon: list,
+        depth: int = 3,
+        transposition_size: int = 1 << 16,
+        time_budget: float | None = None,
+        max_depth: int = 64,
+        move_ordering: bool = True,
+        workers: int = 0,
+        split_depth: int = 1,
+        tablebase_size: int = 2,
+        tablebase_dir: str | None = None,
+        engine: str = "minimax",
+        playouts: int = 1000,
+        playout_policy: str = "random",
+        stats_log: str | None = None,
+        trace_memory: bool = False,
+        opening_book: str | None = None,
+        search_cache: str | None = None,
+        search_cache_size: int = 64 << 20,
+    ):
         """
         Inicializa el entrenador enemigo con una lista de Pokémon.
 
         Args:
             pokemon (list): Lista de Pokémon del enemigo.
+            depth (int): Profundidad de búsqueda del algoritmo Minimax.
+            transposition_size (int): Cantidad máxima de posiciones en la tabla de transposición.
+                Con 0 la búsqueda no usa tabla de transposición.
+            time_budget (float | None): Segundos disponibles por turno. Si se indica, se usa
+                profundización iterativa en lugar de la profundidad fija.
+            max_depth (int): Profundidad máxima de la profundización iterativa.
+            move_ordering (bool): Si es False, los ataques se exploran en el orden fijo
+                (movimiento 1, movimiento 2, super movimiento), salvo el de la tabla de transposición.
+            workers (int): Cantidad de procesos para la búsqueda paralela. Con 0 o 1 se busca en
+                el proceso actual.
+            split_depth (int): Niveles del árbol que se expanden antes de repartir el trabajo entre procesos.
+            tablebase_size (int): Cuando a ambos entrenadores les quedan como mucho esta cantidad de
+                Pokémon (1 o 2), el ataque se toma de la tabla de finales. Con 0 no se usa.
+            tablebase_dir (str | None): Carpeta donde se guardan las tablas generadas, para no
+                generarlas de nuevo. Si es None, solo se conservan en memoria.
+            engine (str): Motor de búsqueda: `minimax` o `mcts` (búsqueda en árbol Monte Carlo).
+            playouts (int): Simulaciones por turno de la búsqueda Monte Carlo. Si además se indica
+                `time_budget`, la búsqueda también se detiene al agotar el tiempo.
+            playout_policy (str): Política de las simulaciones: `random` o `greedy` (mayor daño).
+            stats_log (str | None): Archivo JSONL al que se agrega una línea con las estadísticas
+                de cada búsqueda, para detectar en los registros cambios en la latencia de la IA.
+            trace_memory (bool): Si es True, se mide el pico de memoria de cada búsqueda con
+                `tracemalloc`. Hace la búsqueda bastante más lenta, por eso está desactivado por defecto.
+            opening_book (str | None): Archivo del libro de aperturas (generado con
+                `python -m src.simulation.book`). Si no existe o no es válido, se busca normalmente.
+            search_cache (str | None): Base de datos SQLite donde se guardan las posiciones buscadas
+                para reutilizarlas en otras partidas y ejecuciones (puede compartirse entre varios
+                procesos). Los resultados guardados pueden venir de búsquedas más profundas, así
+                que con el tiempo la IA responde más rápido y juega como si buscara más profundo.
+                Solo se usa en la búsqueda Minimax secuencial.
+            search_cache_size (int): Tamaño máximo aproximado de la base, en bytes.
+
+        Raises:
+            ValueError: Si el motor de búsqueda o la política de simulación no existen.
         """
-        super().__init__("Enemy", pokemon)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown search engine '{engine}'")
 
-    def evaluate_heuristic(self, combat: "Combat", maximizing: bool) -> float:
+        super().__init__("Enemy", pokemon)
+        self.depth = depth
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.transposition_table = (
+            TranspositionTable(size=transposition_size)
+            if transposition_size > 0
+            else None
+        )
+        self.move_ordering = MoveOrdering() if move_ordering else None
+        self.stats = SearchStats()
+        self.parallel = (
+            ParallelSearch(workers=workers, split_depth=split_depth)
+            if workers > 1
+            else None
+        )
+        self.tablebase_size = tablebase_size
+        self.tablebase_dir = tablebase_dir
+        self.tablebases: dict[str, Tablebase] = {}
+        self.engine = engine
+        self.mcts = (
+            MonteCarloSearch(playouts=playouts, policy=playout_policy)
+            if engine == "mcts"
+            else None
+        )
+        self.stats_log = stats_log
+        self.trace_memory = trace_memory
+        self.opening_book = (
+            OpeningBook.open(opening_book) if opening_book is not None else None
+        )
+        self.search_cache = (
+            PersistentSearchCache(path=search_cache, max_size=search_cache_size)
+            if search_cache is not None
+            else None
+        )
+        # Opciones con las que otros procesos construyen un buscador equivalente
+        self.__search_options = {
+            "depth": depth,
+            "transposition_size": transposition_size,
+            "time_budget": time_budget,
+            "max_depth": max_depth,
+            "move_ordering": move_ordering,
+            "workers": workers,
+            "split_depth": split_depth,
+            "tablebase_size": tablebase_size,
+            "tablebase_dir": tablebase_dir,
+            "engine": engine,
+            "playouts": playouts,
+            "playout_policy": playout_policy,
+            "stats_log": stats_log,
+            "trace_memory": trace_memory,
+            "opening_book": opening_book,
+            "search_cache": search_cache,
+            "search_cache_size": search_cache_size,
+        }
+        self.__deadline: float | None = None
+        self.__stop_event: threading.Event | None = None
+        self.__depth_limited = False
+        # Jugada del estado en la raíz de la búsqueda en curso, para medir el tiempo de cada ataque
+        self.__root_ply: int | None = None
+        self.__memory_tracing = False
+        self.__memory_baseline = 0
+        # Huella de los equipos de la búsqueda en curso, que se combina con las claves de la caché en disco
+        self.__cache_salt: int | None = None
+
+    def evaluate_heuristic(self, state: SearchState, maximizing: bool) -> float:
         """
         Evalúa el estado actual del combate y retorna un valor heurístico.
 
         Args:
-            combat (Combat): Instancia del combate actual.
+            state (SearchState): Estado compacto del combate.
             maximizing (bool): Indica si se está maximizando o minimizando la heurística.
 
         Returns:
             float: Valor heurístico del estado del combate.
         """
-        # Se obtienen los jugadores: player (usuario) y enemy (IA)
-        player, enemy = combat.get_players()
-
         # Se obtiene la vida actual del Pokémon activo de cada entrenador
-        hp_enemy = enemy.get_current_pokemon_health()
-        hp_player = player.get_current_pokemon_health()
+        hp_enemy = state.health[SearchState.ENEMY]
+        hp_player = state.health[SearchState.PLAYER]
 
         # Se obtiene la cantidad de Pokémon vivos de cada entrenador
-        live_pokemon_enemy = enemy.get_live_pokemon()
-        live_pokemon_player = player.get_live_pokemon()
+        live_pokemon_enemy = state.get_live_pokemon(SearchState.ENEMY)
+        live_pokemon_player = state.get_live_pokemon(SearchState.PLAYER)
 
-        # Se determina el entrenador actual y el siguiente según si se maximiza o minimiza
+        # Se determina el entrenador actual según si se maximiza o minimiza
         # Si se maximiza, el estado del combate proviene de la elección del jugador, por eso el turno actual es del usuario
         # En caso contrario, el turno actual es de la IA
-        current_trainer = player if maximizing else enemy
-        next_trainer = enemy if maximizing else player
-
-        # Se calcula la efectividad del ataque actual
-        efectivity = combat.calculate_effectiveness(
-            current_trainer=current_trainer,
-            next_trainer=next_trainer,
-            attack=combat.get_current_attack(),
-        )
+        current_trainer = SearchState.PLAYER if maximizing else SearchState.ENEMY
+
+        # Se obtiene la efectividad del ataque actual
+        efectivity = state.get_effectiveness(current_trainer)
 
         # La heurística combina:
         # - Diferencia de vida entre la IA y el jugador
@@ -80,161 +256,557 @@ class Enemy(Trainer):
             + (efectivity * 2)
         )
 
+    def evaluate_children(self, state: SearchState, maximizing: bool) -> list[float]:
+        """
+        Evalúa con la heurística las posiciones a las que llevan los tres ataques del entrenador
+        que tiene el turno, en una sola pasada sobre las tablas del estado.
+
+        El resultado es idéntico a aplicar cada ataque con `make_move` y llamar a
+        `evaluate_heuristic`, pero sin modificar el estado ni recorrer el árbol. Se usa en los
+        nodos a un nivel de las hojas, donde todos los hijos se evalúan con la heurística.
+
+        Args:
+            state (SearchState): Estado compacto del combate (sin ganador).
+            maximizing (bool): Indica si el turno es de la IA.
+
+        Returns:
+            list[float]: Valor heurístico de cada hijo, en el orden de los movimientos (0, 1 y 2).
+        """
+        side = SearchState.ENEMY if maximizing else SearchState.PLAYER
+        defender = 1 - side
+        attacker = state.active[side]
+        index = state.active[defender]
+        health = state.health[defender]
+        damage = state.damage[side][attacker]
+        effectiveness = state.effectiveness[side][attacker]
+        live_attacker = state.get_live_pokemon(side)
+        live_defender = state.get_live_pokemon(defender)
+        last = state.sizes[defender] - 1
+
+        values = []
+        for slot in range(3):
+            # Se aplica el ataque sobre el Pokémon defensor igual que SearchState.make_move
+            defender_health = health - damage[slot][index]
+            defender_index = index
+            defender_live = live_defender
+            if defender_health <= 0:
+                if index < last:
+                    defender_index = index + 1
+                    defender_health = state.max_health[defender][defender_index]
+                    defender_live -= 1
+                else:
+                    defender_health = 0
+                    defender_live = 0
+
+            # En el hijo el turno es del defensor: la heurística toma como atacante a `side`
+            efectivity = effectiveness[defender_index][slot]
+            if side == SearchState.ENEMY:
+                hp_enemy, hp_player = state.health[side], defender_health
+                live_enemy, live_player = live_attacker, defender_live
+            else:
+                hp_enemy, hp_player = defender_health, state.health[side]
+                live_enemy, live_player = defender_live, live_attacker
+
+            # Misma expresión que evaluate_heuristic, para obtener exactamente el mismo valor
+            values.append(
+                (hp_enemy - hp_player)
+                + ((live_enemy - live_player) * 5)
+                + (efectivity * 2)
+            )
+
+        return values
+
     def generate_possible_attacks(
-        self, combat: "Combat", is_ia: bool
-    ) -> list[tuple[str, "Combat"]]:
+        self, state: SearchState, is_ia: bool
+    ) -> list[tuple[str, int]]:
         """
-        Genera todas las combinaciones posibles de ataques y sus estados resultantes.
+        Genera los ataques posibles del entrenador que tiene el turno.
+
+        Los ataques no se aplican aquí: quien recorre el árbol los aplica sobre el estado con
+        `SearchState.make_move` y los deshace con `SearchState.unmake_move`, evitando copiar el combate.
 
         Args:
-            combat (Combat): Instancia del combate actual.
+            state (SearchState): Estado compacto del combate.
             is_ia (bool): Indica si el turno es de la IA.
 
         Returns:
-            list[tuple[str, Combat]]: Lista de tuplas con el nombre del ataque y el estado de combate resultante.
-        """
-
-        def set_attack(
-            current_trainer: Trainer,
-            next_trainer: Trainer,
-            damage: int,
-            combat: "Combat",
-        ) -> None:
-            current_health = next_trainer.get_current_pokemon_health() - damage
-            next_trainer.set_current_pokemon_health(health=current_health)
-
-            if not next_trainer.is_current_pokemon_alive():
-                next_trainer.set_pokemon()
-
-            if not next_trainer.is_alive():
-                combat.set_winner(current_trainer.get_name())
-
-        player, enemy = combat.get_players()
-        current_trainer = enemy if is_ia else player
-        next_trainer = player if is_ia else enemy
-        attacks: list[tuple[str, "Combat"]] = []
-
-        # Se obtienen los nombres de los movimientos disponibles del Pokémon actual
-        moves: list[Callable[[], str]] = [
-            current_trainer.get_current_pokemon().get_move_1_name,
-            current_trainer.get_current_pokemon().get_move_2_name,
-            current_trainer.get_current_pokemon().get_super_move_name,
-        ]
+            list[tuple[str, int]]: Lista de tuplas con el nombre del ataque y su posición (0, 1 o 2).
+        """
+        side = SearchState.ENEMY if is_ia else SearchState.PLAYER
+
+        # Se obtienen los nombres de los movimientos disponibles del Pokémon actual (movimiento 1, 2 y super movimiento)
+        return [(move, slot) for slot, move in enumerate(state.get_moves(side))]
+
+    def order_attacks(
+        self,
+        state: SearchState,
+        maximizing: bool,
+        hash_move: int | None = None,
+        preferred_move: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """
+        Genera los ataques del entrenador que tiene el turno en el orden en que se explorarán.
 
-        # Para cada movimiento posible, se simula el resultado del ataque
-        for move in moves:
-            # Se crea una copia profunda del estado actual del combate para no modificar el original
-            copy_combat = copy.deepcopy(combat)
-            player, enemy = copy_combat.get_players()
-            current_trainer = enemy if is_ia else player
-            next_trainer = player if is_ia else enemy
-            attack = move()
-
-            # Se calcula el daño que haría el ataque simulado
-            damage = copy_combat.calculate_damage(
-                current_trainer=current_trainer,
-                next_trainer=next_trainer,
-                attack=attack,
-            )
+        Args:
+            state (SearchState): Estado compacto del combate.
+            maximizing (bool): Indica si el turno es de la IA.
+            hash_move (int | None): Posición del mejor movimiento según la tabla de transposición.
+            preferred_move (int | None): Posición del movimiento que debe explorarse primero.
 
-            # Se registra el ataque y se actualiza el estado del combate simulado
-            copy_combat.set_current_attack(attack=attack)
-            set_attack(
-                current_trainer=current_trainer,
-                next_trainer=next_trainer,
-                damage=damage,
-                combat=copy_combat,
+        Returns:
+            list[tuple[str, int]]: Ataques ordenados (nombre y posición).
+        """
+        side = SearchState.ENEMY if maximizing else SearchState.PLAYER
+        attacks = self.generate_possible_attacks(state=state, is_ia=maximizing)
+
+        # Se ordenan los ataques para provocar más podas: el mejor movimiento guardado en la tabla
+        # va primero, salvo que se indique explícitamente otro movimiento preferido
+        if self.move_ordering is not None:
+            attacks = self.move_ordering.sort(
+                state=state, side=side, attacks=attacks, hash_move=hash_move
             )
-
-            # Se añade la tupla (nombre del ataque, estado del combate simulado) a la lista de posibles ataques
-            attacks.append((attack, copy_combat))
+        elif hash_move is not None:
+            attacks.sort(key=lambda attack: attack[1] != hash_move)
+        if preferred_move is not None:
+            attacks.sort(key=lambda attack: attack[1] != preferred_move)
 
         return attacks
 
     def minmax(
-        self, combat: "Combat", depth: int, alpha: float, beta: float, maximizing: bool
+        self,
+        state: SearchState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        maximizing: bool,
+        preferred_move: int | None = None,
     ) -> tuple[str | None, float]:
         """
         Implementa el algoritmo Minimax con poda alfa-beta para determinar el mejor ataque.
 
         Args:
-            combat (Combat): Instancia del combate actual.
+            state (SearchState): Estado compacto del combate. Se modifica durante la búsqueda y se restaura al terminar.
             depth (int): Profundidad máxima de búsqueda.
             alpha (float): Valor alfa para la poda.
             beta (float): Valor beta para la poda.
             maximizing (bool): Indica si se está maximizando o minimizando.
+            preferred_move (int | None): Posición del movimiento que se explora primero en este nodo.
 
         Returns:
             tuple[str | None, float]: Mejor ataque y su valor heurístico.
+
+        Raises:
+            SearchTimeout: Si hay un tiempo límite activo y se superó, o si se pidió detener la búsqueda.
         """
+        self.stats.nodes += 1
+
         # Caso base: si se alcanza la profundidad máxima o hay un ganador, se evalúa la heurística del estado actual
-        if depth == 0 or combat.get_winner():
-            return None, self.evaluate_heuristic(combat=combat, maximizing=maximizing)
+        if depth == 0 or state.winner is not None:
+            if depth == 0:
+                self.__depth_limited = True
+            self.stats.leaves += 1
+            return None, self.evaluate_heuristic(state=state, maximizing=maximizing)
+
+        if (self.__stop_event is not None and self.__stop_event.is_set()) or (
+            self.__deadline is not None and time.perf_counter() >= self.__deadline
+        ):
+            raise SearchTimeout()
+
+        # Se consulta la tabla de transposición: si la posición ya se buscó con suficiente profundidad
+        # y su valor es concluyente para la ventana actual, no hace falta expandirla de nuevo
+        table = self.transposition_table
+        side = SearchState.ENEMY if maximizing else SearchState.PLAYER
+        hash_move = None
+
+        if table is not None:
+            key = state.get_key(maximizing)
+            entry = table.probe(key)
+
+            if entry is not None:
+                entry_depth, flag, value, hash_move = entry
+
+                # Solo se reutilizan valores buscados con la misma profundidad: así el resultado de
+                # cada posición no depende del camino ni del orden de búsqueda (ni de si se busca en paralelo)
+                if entry_depth == depth and (
+                    flag == TranspositionTable.EXACT
+                    or (flag == TranspositionTable.LOWER_BOUND and value >= beta)
+                    or (flag == TranspositionTable.UPPER_BOUND and value <= alpha)
+                ):
+                    # La entrada pudo venir de una búsqueda limitada por profundidad
+                    self.__depth_limited = True
+                    move = (
+                        None if hash_move is None else state.get_moves(side)[hash_move]
+                    )
+                    return move, value
+
+        # Si la posición vale la pena, se consulta también la caché en disco. Sus resultados
+        # pueden venir de búsquedas más profundas de otras partidas, y también se aceptan
+        cache = self.search_cache
+        cache_key = None
+        if (
+            cache is not None
+            and self.__cache_salt is not None
+            and depth >= cache.min_depth
+        ):
+            cache_key = self.__cache_salt ^ state.get_key(maximizing)
+            entry = cache.probe(cache_key)
+
+            if entry is not None:
+                entry_depth, flag, value, cache_move = entry
+
+                if entry_depth >= depth and (
+                    flag == TranspositionTable.EXACT
+                    or (flag == TranspositionTable.LOWER_BOUND and value >= beta)
+                    or (flag == TranspositionTable.UPPER_BOUND and value <= alpha)
+                ):
+                    self.__depth_limited = True
+                    move = (
+                        None
+                        if cache_move is None
+                        else state.get_moves(side)[cache_move]
+                    )
+                    return move, value
+
+                if hash_move is None:
+                    hash_move = cache_move
+
+        attacks = self.order_attacks(
+            state=state,
+            maximizing=maximizing,
+            hash_move=hash_move,
+            preferred_move=preferred_move,
+        )
 
+        initial_alpha, initial_beta = alpha, beta
         best_move = None
+        best_slot = None
+
+        # A un nivel de las hojas, los hijos se evalúan todos juntos sin aplicar los ataques
+        leaf_values = (
+            self.evaluate_children(state=state, maximizing=maximizing)
+            if depth == 1
+            else None
+        )
+        if leaf_values is not None:
+            self.__depth_limited = True
 
         if maximizing:
             max_heuristic = float("-inf")
+            is_root = state.get_ply() == self.__root_ply
 
             # Para cada posible ataque de la IA, se simula el resultado y se llama recursivamente a minmax
-            for move, new_combat in self.generate_possible_attacks(
-                combat=combat, is_ia=True
-            ):
+            for move, slot in attacks:
+                started = time.perf_counter() if is_root else 0.0
+
                 # Se explora el siguiente nivel del árbol, ahora minimizando (turno del jugador)
-                _, heuristic = self.minmax(
-                    combat=new_combat,
-                    depth=depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                    maximizing=False,
-                )
+                if leaf_values is not None:
+                    self.stats.nodes += 1
+                    self.stats.leaves += 1
+                    heuristic = leaf_values[slot]
+                else:
+                    state.make_move(SearchState.ENEMY, slot)
+                    _, heuristic = self.minmax(
+                        state=state,
+                        depth=depth - 1,
+                        alpha=alpha,
+                        beta=beta,
+                        maximizing=False,
+                    )
+                    state.unmake_move()
+
+                if is_root:
+                    self.stats.add_root_time(
+                        move=move, seconds=time.perf_counter() - started
+                    )
 
                 # Se actualiza el mejor valor heurístico y el movimiento asociado si se encuentra uno mejor
                 if heuristic > max_heuristic:
                     max_heuristic = heuristic
                     best_move = move
+                    best_slot = slot
 
                 # Se actualiza alpha con el mejor valor encontrado hasta ahora
                 alpha = max(alpha, heuristic)
 
                 # Poda alfa-beta: si beta es menor o igual a alpha, se corta la rama
                 if beta <= alpha:
+                    self.record_cutoff(state=state, side=side, slot=slot, depth=depth)
                     break
 
-            return best_move, max_heuristic
+            best_heuristic = max_heuristic
         else:
             min_heuristic = float("inf")
 
             # Para cada posible ataque del jugador, se simula el resultado y se llama recursivamente a minmax
-            for move, new_combat in self.generate_possible_attacks(
-                combat=combat, is_ia=False
-            ):
+            for move, slot in attacks:
                 # Se explora el siguiente nivel del árbol, ahora maximizando (turno de la IA)
-                _, heuristic = self.minmax(
-                    combat=new_combat,
-                    depth=depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                    maximizing=True,
-                )
+                if leaf_values is not None:
+                    self.stats.nodes += 1
+                    self.stats.leaves += 1
+                    heuristic = leaf_values[slot]
+                else:
+                    state.make_move(SearchState.PLAYER, slot)
+                    _, heuristic = self.minmax(
+                        state=state,
+                        depth=depth - 1,
+                        alpha=alpha,
+                        beta=beta,
+                        maximizing=True,
+                    )
+                    state.unmake_move()
 
                 # Se actualiza el menor valor heurístico y el movimiento asociado si se encuentra uno peor para la IA
                 if heuristic < min_heuristic:
                     min_heuristic = heuristic
                     best_move = move
+                    best_slot = slot
 
                 # Se actualiza beta con el mejor valor encontrado hasta ahora para el jugador
                 beta = min(beta, heuristic)
 
                 # Poda alfa-beta: si beta es menor o igual a alpha, se corta la rama
                 if beta <= alpha:
+                    self.record_cutoff(state=state, side=side, slot=slot, depth=depth)
                     break
 
-            return best_move, min_heuristic
+            best_heuristic = min_heuristic
+
+        # Se guarda el resultado indicando si el valor es exacto o solo una cota de la ventana recibida
+        if table is not None or cache_key is not None:
+            if best_heuristic <= initial_alpha:
+                flag = TranspositionTable.UPPER_BOUND
+            elif best_heuristic >= initial_beta:
+                flag = TranspositionTable.LOWER_BOUND
+            else:
+                flag = TranspositionTable.EXACT
+
+            if table is not None:
+                table.store(key, depth, flag, best_heuristic, best_slot)
+            if cache_key is not None:
+                cache.store(cache_key, depth, flag, best_heuristic, best_slot)
+
+        return best_move, best_heuristic
+
+    def record_cutoff(
+        self, state: SearchState, side: int, slot: int, depth: int
+    ) -> None:
+        """
+        Registra un corte alfa-beta en las estadísticas y en el ordenamiento de ataques.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+            side (int): Índice del entrenador cuyo ataque provocó el corte.
+            slot (int): Posición del ataque.
+            depth (int): Profundidad restante del nodo.
+        """
+        self.stats.cutoffs += 1
+
+        if self.move_ordering is not None:
+            self.move_ordering.record_cutoff(
+                state=state, side=side, slot=slot, depth=depth
+            )
+
+    def parallel_minmax(
+        self, state: SearchState, depth: int
+    ) -> tuple[str | None, float]:
+        """
+        Busca el mejor ataque de la IA repartiendo el árbol entre varios procesos.
+
+        Devuelve el mismo ataque y valor que `minmax` con la misma profundidad: la raíz se ordena
+        igual y se elige el primer ataque de mayor valor.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+            depth (int): Profundidad de búsqueda.
+
+        Returns:
+            tuple[str | None, float]: Mejor ataque y su valor heurístico.
+        """
+        if self.parallel is None or depth == 0 or state.winner is not None:
+            return self.minmax(
+                state=state,
+                depth=depth,
+                alpha=float("-inf"),
+                beta=float("inf"),
+                maximizing=True,
+            )
+
+        self.stats.nodes += 1
+        table = self.transposition_table
+        hash_move = None
+
+        # Se consulta la raíz en la tabla de transposición igual que en la búsqueda secuencial
+        if table is not None:
+            key = state.get_key(True)
+            entry = table.probe(key)
+
+            if entry is not None:
+                entry_depth, flag, value, hash_move = entry
+
+                if entry_depth == depth and flag == TranspositionTable.EXACT:
+                    move = (
+                        None
+                        if hash_move is None
+                        else state.get_moves(SearchState.ENEMY)[hash_move]
+                    )
+                    return move, value
+
+        attacks = self.order_attacks(state=state, maximizing=True, hash_move=hash_move)
+        values = self.parallel.search(
+            enemy=self,
+            state=state,
+            depth=depth,
+            attacks=attacks,
+            # Los procesos trabajadores buscan su subárbol en forma secuencial y sin la caché en
+            # disco, para que su valor sea exacto
+            options={**self.__search_options, "workers": 0, "search_cache": None},
+        )
+
+        # Se elige el primer ataque con el mayor valor, como lo haría la búsqueda secuencial
+        best = values.index(max(values))
+
+        if table is not None:
+            table.store(
+                key, depth, TranspositionTable.EXACT, values[best], attacks[best][1]
+            )
+
+        return attacks[best][0], values[best]
+
+    def close(self) -> None:
+        """
+        Libera los procesos de la búsqueda paralela, si existen, y cierra la caché en disco.
+        """
+        if self.parallel is not None:
+            self.parallel.shutdown()
+        if self.search_cache is not None:
+            self.search_cache.close()
+            self.search_cache = None
+
+    def iterative_deepening(
+        self, state: SearchState, time_budget: float
+    ) -> tuple[str | None, int]:
+        """
+        Busca con profundidad 1, 2, 3... hasta agotar el tiempo disponible.
+
+        Cada iteración explora primero el mejor ataque de la iteración anterior. Si el tiempo
+        se agota a mitad de una iteración, se descarta y se usa el resultado de la última
+        iteración completa. La primera iteración siempre se completa para tener un ataque válido.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+            time_budget (float): Segundos disponibles para la búsqueda.
+
+        Returns:
+            tuple[str | None, int]: Mejor ataque de la última iteración completa y su profundidad.
+        """
+        deadline = time.perf_counter() + time_budget
+        moves = state.get_moves(SearchState.ENEMY)
+        best_attack = None
+        completed_depth = 0
+
+        for depth in range(1, self.max_depth + 1):
+            # La primera iteración se hace sin límite de tiempo
+            self.__deadline = deadline if depth > 1 else None
+            self.__depth_limited = False
+
+            try:
+                attack, _ = self.minmax(
+                    state=state,
+                    depth=depth,
+                    alpha=float("-inf"),
+                    beta=float("inf"),
+                    maximizing=True,
+                    preferred_move=(
+                        None if best_attack is None else moves.index(best_attack)
+                    ),
+                )
+            except SearchTimeout:
+                break
+            finally:
+                self.__deadline = None
+
+            best_attack = attack
+            completed_depth = depth
+
+            # Si ninguna rama llegó al límite de profundidad, buscar más profundo no cambia el resultado
+            if not self.__depth_limited or time.perf_counter() >= deadline:
+                break
+
+        return best_attack, completed_depth
+
+    def probe_opening_book(self, state: SearchState) -> str | None:
+        """
+        Obtiene el ataque del libro de aperturas, buscado de antemano con más profundidad.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+
+        Returns:
+            str | None: Nombre del ataque, o None si no hay libro o la posición no está en él.
+        """
+        if self.opening_book is None:
+            return None
+
+        attack = self.opening_book.probe(state=state)
+        if attack is not None:
+            self.stats.depth = self.opening_book.depth
+        return attack
+
+    def probe_tablebase(self, state: SearchState) -> str | None:
+        """
+        Obtiene el ataque exacto de la tabla de finales si a ambos entrenadores les quedan pocos Pokémon.
+
+        La tabla de los equipos se genera la primera vez que se necesita (o se carga de
+        `tablebase_dir`, si ya se había guardado) y se conserva para los turnos siguientes.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+
+        Returns:
+            str | None: Nombre del mejor ataque, o None si el combate aún no llegó al final.
+        """
+        if self.tablebase_size == 0 or state.winner is not None:
+            return None
+
+        remaining = [
+            state.sizes[side] - state.active[side]
+            for side in (SearchState.PLAYER, SearchState.ENEMY)
+        ]
+        if max(remaining) > self.tablebase_size:
+            return None
+
+        tablebase = Tablebase(state=state, size=self.tablebase_size)
+        key = tablebase.get_key()
+
+        if key not in self.tablebases:
+            path = None
+            if self.tablebase_dir is not None:
+                # El archivo depende de los datos del final, no solo de los nombres
+                path = os.path.join(self.tablebase_dir, f"{tablebase.fingerprint}.npz")
+
+            if path is None or not tablebase.load(path):
+                tablebase.generate()
+                if path is not None:
+                    tablebase.save(path)
+
+            self.tablebases[key] = tablebase
+
+        result = self.tablebases[key].probe(state)
+        return None if result is None else state.get_moves(SearchState.ENEMY)[result[0]]
+
+    def get_search_options(self) -> dict:
+        """
+        Retorna las opciones de búsqueda con las que se construyó el enemigo.
+
+        Returns:
+            dict: Argumentos del constructor (salvo los Pokémon) para crear un buscador equivalente.
+        """
+        return dict(self.__search_options)
 
     def choose_attack(self, combat: "Combat") -> str:
         """
-        Selecciona el mejor ataque posible usando el algoritmo Minimax.
+        Selecciona el mejor ataque posible usando el algoritmo Minimax. Las estadísticas de la
+        búsqueda quedan en `stats`.
 
         Args:
             combat (Combat): Instancia del combate actual.
@@ -245,15 +817,191 @@ class Enemy(Trainer):
         Raises:
             ValueError: Si no se encuentra un ataque válido.
         """
-        attack, _ = self.minmax(
-            combat=combat,
-            depth=3,  # Se establece una profundidad de búsqueda de 3 niveles teniendo en cueta que el combate puede ser complejo y se busca un equilibrio entre rendimiento y dificultad
-            alpha=float("-inf"),
-            beta=float("inf"),
-            maximizing=True,
-        )
+        return self.search_attack(state=SearchState(combat))
+
+    def choose_attack_with_stats(self, combat: "Combat") -> tuple[str, SearchStats]:
+        """
+        Selecciona el mejor ataque posible y retorna también las estadísticas de la búsqueda.
+
+        Cada búsqueda crea un objeto de estadísticas nuevo, así que el retornado no cambia con
+        las búsquedas siguientes (a diferencia de `stats`, que siempre es el de la última).
+
+        Args:
+            combat (Combat): Instancia del combate actual.
+
+        Returns:
+            tuple[str, SearchStats]: Nombre del ataque seleccionado y estadísticas de su búsqueda.
+
+        Raises:
+            ValueError: Si no se encuentra un ataque válido.
+        """
+        attack = self.choose_attack(combat=combat)
+        return attack, self.stats
+
+    def search_attack(
+        self,
+        state: SearchState,
+        stop_event: threading.Event | None = None,
+        log_stats: bool = True,
+    ) -> str:
+        """
+        Selecciona el mejor ataque posible a partir de un estado compacto ya construido.
+
+        Si la posición está en el libro de aperturas o el combate llegó al final cubierto por la
+        tabla de finales, el ataque se toma de ahí sin buscar. Con el motor `mcts` se usa la
+        búsqueda Monte Carlo. Con Minimax, si hay `time_budget` se usa profundización iterativa
+        hasta agotar el tiempo; en otro caso se busca con la profundidad fija `depth`. Al no leer
+        el combate, puede ejecutarse en otro hilo o proceso mientras la interfaz sigue dibujando.
+        Las estadísticas quedan en `stats` y, si se indicó `stats_log` y `log_stats` es True, se
+        agregan al archivo.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+            stop_event (threading.Event | None): Evento que, al activarse desde otro hilo, detiene
+                la búsqueda en el siguiente nodo. Con profundización iterativa se usa la última
+                iteración completa.
+            log_stats (bool): Si es False, las estadísticas no se agregan a `stats_log`. Lo usan
+                las búsquedas anticipadas, que se registran recién si su ataque se usa.
+
+        Returns:
+            str: Nombre del ataque seleccionado.
+
+        Raises:
+            ValueError: Si no se encuentra un ataque válido.
+            SearchTimeout: Si se pidió detener una búsqueda de profundidad fija.
+        """
+        # Las entradas de búsquedas anteriores se conservan, pero pasan a poder reemplazarse
+        if self.transposition_table is not None:
+            self.transposition_table.new_search()
+        if self.move_ordering is not None:
+            self.move_ordering.new_search()
+        self.stats = SearchStats()
+
+        started = time.perf_counter()
+        self.__start_memory_trace()
+        try:
+            # En los primeros turnos el ataque se toma del libro y en el final del combate, de
+            # la tabla de finales, sin buscar
+            attack = self.probe_opening_book(state=state)
+            if attack is None:
+                attack = self.probe_tablebase(state=state)
+            if attack is None:
+                attack = self.__search(state=state, stop_event=stop_event)
+        finally:
+            # Las posiciones nuevas se escriben en la caché en disco una vez por turno
+            if self.search_cache is not None:
+                self.search_cache.flush()
+            self.stats.elapsed = time.perf_counter() - started
+            # Los contadores de la tabla se reinician al empezar cada búsqueda
+            if self.transposition_table is not None:
+                self.stats.add_transposition(
+                    probes=self.transposition_table.probes,
+                    hits=self.transposition_table.hits,
+                )
+            self.__stop_memory_trace()
 
         if attack is None:
             raise ValueError("No valid attack found")
 
+        if log_stats:
+            self.write_stats(attack)
+
         return attack
+
+    def write_stats(self, attack: str, **fields) -> None:
+        """
+        Agrega las estadísticas de la última búsqueda (`stats`) a `stats_log`, si se indicó.
+
+        Args:
+            attack (str): Ataque elegido en la búsqueda.
+            **fields: Datos adicionales del registro.
+        """
+        if self.stats_log is not None:
+            self.stats.write_jsonl(
+                self.stats_log, engine=self.engine, attack=attack, **fields
+            )
+
+    def __search(
+        self, state: SearchState, stop_event: threading.Event | None
+    ) -> str | None:
+        """
+        Busca el mejor ataque con el motor y las opciones del enemigo.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+            stop_event (threading.Event | None): Evento que detiene la búsqueda al activarse.
+
+        Returns:
+            str | None: Nombre del mejor ataque, o None si no se encontró ninguno.
+        """
+        self.__stop_event = stop_event
+        self.__root_ply = state.get_ply()
+        # Los procesos de la búsqueda paralela no usan la caché en disco
+        if self.search_cache is not None and self.parallel is None:
+            self.__cache_salt = state.get_fingerprint()
+        try:
+            if self.mcts is not None:
+                slot = self.mcts.search(
+                    state=state,
+                    stats=self.stats,
+                    deadline=(
+                        None
+                        if self.time_budget is None
+                        else time.perf_counter() + self.time_budget
+                    ),
+                    stop_event=stop_event,
+                )
+                return (
+                    None if slot is None else state.get_moves(SearchState.ENEMY)[slot]
+                )
+
+            if self.time_budget is not None:
+                attack, self.stats.depth = self.iterative_deepening(
+                    state=state, time_budget=self.time_budget
+                )
+                return attack
+
+            if self.parallel is not None:
+                attack, _ = self.parallel_minmax(state=state, depth=self.depth)
+            else:
+                attack, _ = self.minmax(
+                    state=state,
+                    depth=self.depth,  # Por defecto 3 niveles, teniendo en cuenta que el combate puede ser complejo y se busca un equilibrio entre rendimiento y dificultad
+                    alpha=float("-inf"),
+                    beta=float("inf"),
+                    maximizing=True,
+                )
+            self.stats.depth = self.depth
+            return attack
+        finally:
+            self.__stop_event = None
+            self.__root_ply = None
+            self.__cache_salt = None
+
+    def __start_memory_trace(self) -> None:
+        """
+        Empieza a medir la memoria reservada por la búsqueda, si `trace_memory` está activado.
+        """
+        if not self.trace_memory:
+            return
+
+        # Si otro código ya estaba midiendo la memoria, se respeta su medición y solo se
+        # descuenta lo que ya estaba reservado
+        self.__memory_tracing = not tracemalloc.is_tracing()
+        if self.__memory_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.__memory_baseline = tracemalloc.get_traced_memory()[0]
+
+    def __stop_memory_trace(self) -> None:
+        """
+        Registra el pico de memoria de la búsqueda en las estadísticas, si `trace_memory` está activado.
+        """
+        if not self.trace_memory:
+            return
+
+        peak = tracemalloc.get_traced_memory()[1]
+        self.stats.peak_memory = max(peak - self.__memory_baseline, 0)
+        if self.__memory_tracing:
+            tracemalloc.stop()
+            self.__memory_tracing = False
@@ -0,0 +1,228 @@
+import math
+import random
+import threading
+import time
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.enemy.stats import SearchStats
+
+
+class MonteCarloNode:
+    """
+    Nodo del árbol de la búsqueda Monte Carlo.
+
+    Atributos:
+        slot (int | None): Posición del ataque que lleva a este nodo (None en la raíz).
+        parent (MonteCarloNode | None): Nodo padre.
+        children (list[MonteCarloNode]): Hijos ya expandidos.
+        untried (list[int]): Ataques que aún no se expandieron.
+        visits (int): Cantidad de simulaciones que pasaron por el nodo.
+        value (float): Suma de los resultados de esas simulaciones, desde el punto de vista del
+            entrenador que realizó el ataque que lleva a este nodo.
+    """
+
+    __slots__ = ("slot", "parent", "children", "untried", "visits", "value")
+
+    def __init__(
+        self, slot: int | None, parent: "MonteCarloNode | None", untried: list[int]
+    ):
+        """
+        Inicializa un nodo sin simulaciones.
+
+        Args:
+            slot (int | None): Posición del ataque que lleva a este nodo.
+            parent (MonteCarloNode | None): Nodo padre.
+            untried (list[int]): Ataques que se pueden expandir desde este nodo.
+        """
+        self.slot = slot
+        self.parent = parent
+        self.children: list[MonteCarloNode] = []
+        self.untried = untried
+        self.visits = 0
+        self.value = 0.0
+
+
+class MonteCarloSearch:
+    """
+    Búsqueda en árbol Monte Carlo (MCTS) con selección UCT, alternativa a Minimax.
+
+    En lugar de una heurística, cada simulación juega el combate hasta el final sobre el estado
+    compacto (`SearchState.make_move` y `unmake_move`, sin copiar el combate) y cuenta quién ganó.
+    Los ataques de las simulaciones se eligen al azar (`random`) o por mayor daño (`greedy`).
+
+    Atributos:
+        POLICIES (tuple[str, ...]): Políticas de simulación disponibles.
+        playouts (int): Cantidad de simulaciones por búsqueda.
+        exploration (float): Constante de exploración de UCT.
+        policy (str): Política de simulación.
+        max_playout_length (int): Ataques máximos por simulación; si se alcanza, cuenta como empate.
+        random (random.Random): Generador de números aleatorios de la búsqueda.
+    """
+
+    POLICIES = ("random", "greedy")
+
+    def __init__(
+        self,
+        playouts: int = 1000,
+        exploration: float = math.sqrt(2),
+        policy: str = "random",
+        max_playout_length: int = 200,
+        seed: int | None = None,
+    ):
+        """
+        Inicializa la búsqueda Monte Carlo.
+
+        Args:
+            playouts (int): Cantidad de simulaciones por búsqueda.
+            exploration (float): Constante de exploración de UCT.
+            policy (str): Política de simulación (`random` o `greedy`).
+            max_playout_length (int): Ataques máximos por simulación.
+            seed (int | None): Semilla para reproducir las búsquedas.
+
+        Raises:
+            ValueError: Si la política no existe o la cantidad de simulaciones no es positiva.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown playout policy '{policy}'")
+        if playouts < 1:
+            raise ValueError("playouts must be positive")
+
+        self.playouts = playouts
+        self.exploration = exploration
+        self.policy = policy
+        self.max_playout_length = max_playout_length
+        self.random = random.Random(seed)
+
+    def search(
+        self,
+        state: SearchState,
+        stats: SearchStats,
+        deadline: float | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> int | None:
+        """
+        Busca el mejor ataque de la IA (le toca a la IA en el estado).
+
+        Args:
+            state (SearchState): Estado compacto del combate. Se restaura al terminar.
+            stats (SearchStats): Contadores donde se acumulan nodos, simulaciones y la
+                profundidad máxima del árbol.
+            deadline (float | None): Momento (según `time.perf_counter`) en que se detiene la búsqueda.
+            stop_event (threading.Event | None): Evento que detiene la búsqueda al activarse.
+
+        Returns:
+            int | None: Posición del ataque más visitado, o None si no hubo simulaciones.
+        """
+        root = MonteCarloNode(slot=None, parent=None, untried=self.__moves())
+        stats.nodes += 1
+
+        for _ in range(self.playouts):
+            if (stop_event is not None and stop_event.is_set()) or (
+                deadline is not None and time.perf_counter() >= deadline
+            ):
+                break
+
+            node = root
+            side = SearchState.ENEMY
+            depth = 0
+
+            # Selección: se baja por el árbol eligiendo el hijo con mayor UCT
+            while not node.untried and node.children:
+                node = self.__select(node)
+                state.make_move(side, node.slot)
+                side = 1 - side
+                depth += 1
+
+            # Expansión: se agrega un hijo con un ataque aún no probado
+            if node.untried and state.winner is None:
+                slot = node.untried.pop(self.random.randrange(len(node.untried)))
+                child = MonteCarloNode(slot=slot, parent=node, untried=self.__moves())
+                node.children.append(child)
+                node = child
+                state.make_move(side, slot)
+                side = 1 - side
+                depth += 1
+                stats.nodes += 1
+
+            stats.depth = max(stats.depth, depth)
+
+            # Simulación hasta el final del combate y propagación del resultado
+            result = self.__playout(state, side)
+            stats.playouts += 1
+
+            for _ in range(depth):
+                state.unmake_move()
+
+            # El resultado se suma desde el punto de vista de quien atacó para llegar a cada nodo
+            mover = 1 - side
+            while node is not None:
+                node.visits += 1
+                node.value += result if mover == SearchState.ENEMY else 1.0 - result
+                mover = 1 - mover
+                node = node.parent
+
+        if not root.children:
+            return None
+
+        # Se elige el ataque más visitado, que es el más robusto
+        return max(root.children, key=lambda child: child.visits).slot
+
+    def __moves(self) -> list[int]:
+        """
+        Obtiene los ataques que se pueden expandir desde un nodo.
+
+        Returns:
+            list[int]: Posiciones de los tres movimientos.
+        """
+        return [0, 1, 2]
+
+    def __select(self, node: MonteCarloNode) -> MonteCarloNode:
+        """
+        Elige el hijo con mayor valor UCT (promedio más un término de exploración).
+
+        Args:
+            node (MonteCarloNode): Nodo con todos sus hijos expandidos.
+
+        Returns:
+            MonteCarloNode: Hijo elegido.
+        """
+        log_visits = math.log(node.visits)
+        return max(
+            node.children,
+            key=lambda child: child.value / child.visits
+            + self.exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def __playout(self, state: SearchState, side: int) -> float:
+        """
+        Juega el combate hasta el final con la política de simulación y deshace los ataques.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+            side (int): Entrenador al que le toca atacar.
+
+        Returns:
+            float: 1 si gana la IA, 0 si gana el jugador y 0.5 si se alcanzó el límite de ataques.
+        """
+        length = 0
+        while state.winner is None and length < self.max_playout_length:
+            if self.policy == "greedy":
+                damage = state.damage[side][state.active[side]]
+                defender = state.active[1 - side]
+                slot = max(
+                    range(3),
+                    key=lambda slot: (damage[slot][defender], self.random.random()),
+                )
+            else:
+                slot = self.random.randrange(3)
+
+            state.make_move(side, slot)
+            side = 1 - side
+            length += 1
+
+        winner = state.winner
+        for _ in range(length):
+            state.unmake_move()
+
+        if winner is None:
+            return 0.5
+        return 1.0 if winner == SearchState.ENEMY else 0.0
@@ -0,0 +1,260 @@
+import os
+import zipfile
+from typing import TYPE_CHECKING
+import numpy as np
+from src.trainers.enemy.search_state import SearchState
+from src.utils.cache import get_cache_dir
+
+if TYPE_CHECKING:
+    from src.trainers.enemy.ia import Enemy
+
+
+class OpeningBook:
+    """
+    Libro de aperturas: el mejor ataque de la IA en las primeras jugadas de cada combate,
+    buscado de antemano con una profundidad mayor que la que permite el tiempo de un turno.
+
+    La posición inicial de un combate depende solo de los dos equipos, así que las posiciones
+    de los primeros turnos se repiten entre partidas. El libro guarda, para cada posición en la
+    que le toca a la IA (Pokémon activos y vida de cada entrenador), la posición del ataque
+    elegido. La clave combina la clave Zobrist del estado con una huella de los datos de ambos
+    equipos (daño, efectividad, vida, velocidad y movimientos), de modo que si cambian los datos
+    del juego las entradas anteriores dejan de coincidir en lugar de dar un ataque equivocado.
+
+    Atributos:
+        VERSION (int): Versión del formato; los libros de otra versión no se cargan.
+        depth (int): Profundidad con la que se buscan las posiciones del libro.
+        plies (int): Cantidad de ataques desde el inicio del combate que cubre el libro.
+        entries (dict[int, int]): Posición del ataque elegido por clave de posición.
+    """
+
+    VERSION = 2
+    # Libros ya cargados por ruta, con la fecha de modificación del archivo, para que todas las
+    # IA del proceso compartan el mismo libro
+    __opened: dict[str, tuple[int, "OpeningBook"]] = {}
+
+    def __init__(self, depth: int = 16, plies: int = 4):
+        """
+        Inicializa el libro vacío.
+
+        Args:
+            depth (int): Profundidad con la que se buscan las posiciones del libro.
+            plies (int): Cantidad de ataques desde el inicio del combate que cubre el libro.
+        """
+        self.depth = depth
+        self.plies = plies
+        self.entries: dict[int, int] = {}
+        # Huella de los datos de cada par de equipos, que no cambia durante el combate
+        self.__digests: dict[tuple, int] = {}
+
+    @staticmethod
+    def get_default_path() -> str:
+        """
+        Obtiene la ruta del libro que usa el juego, dentro de la carpeta de caché. La carpeta no
+        se crea: si no existe (o no se puede leer), `open` no encuentra el libro y la IA juega sin él.
+
+        Returns:
+            str: Ruta del archivo del libro.
+        """
+        return os.path.join(get_cache_dir("book", create=False), "opening_book.npz")
+
+    @classmethod
+    def open(cls, path: str) -> "OpeningBook | None":
+        """
+        Carga un libro o, si ya se cargó en este proceso y el archivo no cambió, reutiliza el mismo.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            OpeningBook | None: El libro, o None si el archivo no existe, no se puede leer o no es
+                válido.
+        """
+        try:
+            modified = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        opened = cls.__opened.get(path)
+        if opened is not None and opened[0] == modified:
+            return opened[1]
+
+        book = cls()
+        if not book.load(path):
+            return None
+        cls.__opened[path] = (modified, book)
+        return book
+
+    def get_key(self, state: SearchState) -> int:
+        """
+        Calcula la clave de la posición actual del estado (le toca a la IA).
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+
+        Returns:
+            int: Clave de 64 bits de la posición.
+        """
+        teams = (tuple(state.names), tuple(map(tuple, state.max_health)))
+        digest = self.__digests.get(teams)
+        if digest is None:
+            digest = state.get_fingerprint()
+            self.__digests[teams] = digest
+        return digest ^ state.key
+
+    def probe(self, state: SearchState) -> str | None:
+        """
+        Obtiene el ataque del libro para la posición actual.
+
+        Args:
+            state (SearchState): Estado compacto del combate (le toca a la IA).
+
+        Returns:
+            str | None: Nombre del ataque, o None si la posición no está en el libro.
+        """
+        if not self.entries or state.winner is not None:
+            return None
+
+        slot = self.entries.get(self.get_key(state))
+        return None if slot is None else state.get_moves(SearchState.ENEMY)[slot]
+
+    def add(self, state: SearchState, searcher: "Enemy") -> int:
+        """
+        Busca y agrega al libro todas las posiciones en las que le toca a la IA durante los
+        primeros `plies` ataques a partir del estado.
+
+        Se siguen las reglas de turno de `Combat`: los entrenadores se alternan y, cuando un
+        Pokémon es derrotado (y al inicio del combate), ataca primero el Pokémon más rápido; con
+        velocidades iguales se recorren ambos casos.
+
+        Args:
+            state (SearchState): Estado al inicio del combate. Se restaura al terminar.
+            searcher (Enemy): IA con la que se busca cada posición (normalmente con `depth`
+                igual a la del libro).
+
+        Returns:
+            int: Cantidad de posiciones nuevas agregadas.
+        """
+        added = len(self.entries)
+        for side in self.__get_first_sides(state):
+            self.__add_positions(state, side, self.plies, searcher)
+        return len(self.entries) - added
+
+    def __add_positions(
+        self, state: SearchState, side: int, plies: int, searcher: "Enemy"
+    ) -> None:
+        """
+        Agrega las posiciones alcanzables desde el estado en `plies` ataques o menos.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+            side (int): Entrenador al que le toca atacar.
+            plies (int): Ataques restantes por recorrer.
+            searcher (Enemy): IA con la que se busca cada posición.
+        """
+        if plies == 0 or state.winner is not None:
+            return
+
+        if side == SearchState.ENEMY:
+            key = self.get_key(state)
+            if key not in self.entries:
+                attack = searcher.search_attack(state=state)
+                self.entries[key] = state.get_moves(SearchState.ENEMY).index(attack)
+
+        defender = 1 - side
+        for slot in range(3):
+            active = state.active[defender]
+            state.make_move(side, slot)
+            # Si el Pokémon rival fue derrotado, el turno se decide de nuevo por velocidad
+            next_sides = (
+                [defender]
+                if state.active[defender] == active
+                else self.__get_first_sides(state)
+            )
+            for next_side in next_sides:
+                self.__add_positions(state, next_side, plies - 1, searcher)
+            state.unmake_move()
+
+    @staticmethod
+    def __get_first_sides(state: SearchState) -> list[int]:
+        """
+        Obtiene los entrenadores que pueden atacar primero con los Pokémon activos del estado.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+
+        Returns:
+            list[int]: El entrenador con el Pokémon más rápido o, si empatan, ambos.
+        """
+        speed = [
+            state.speed[side][state.active[side]]
+            for side in (SearchState.PLAYER, SearchState.ENEMY)
+        ]
+        if speed[SearchState.PLAYER] > speed[SearchState.ENEMY]:
+            return [SearchState.PLAYER]
+        if speed[SearchState.PLAYER] < speed[SearchState.ENEMY]:
+            return [SearchState.ENEMY]
+        return [SearchState.PLAYER, SearchState.ENEMY]
+
+    def save(self, path: str) -> None:
+        """
+        Guarda el libro en un archivo comprimido de NumPy.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Raises:
+            OSError: Si el archivo no se puede escribir. El archivo temporal se borra.
+        """
+        keys = np.fromiter(
+            self.entries.keys(), dtype=np.uint64, count=len(self.entries)
+        )
+        slots = np.fromiter(
+            self.entries.values(), dtype=np.uint8, count=len(self.entries)
+        )
+        # Se escribe en un archivo temporal y se renombra, para no dejar archivos a medio escribir
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            np.savez_compressed(
+                temporary,
+                keys=keys,
+                slots=slots,
+                header=np.array([self.VERSION, self.depth, self.plies]),
+            )
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+
+    def load(self, path: str) -> bool:
+        """
+        Carga el libro de un archivo guardado con `save`, reemplazando sus entradas.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si se cargó, False si el archivo no existe o no es válido.
+        """
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                version, depth, plies = data["header"].tolist()
+                keys = data["keys"]
+                slots = data["slots"]
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+            return False
+
+        if version != self.VERSION or keys.shape != slots.shape:
+            return False
+
+        self.depth = depth
+        self.plies = plies
+        self.entries = dict(zip(keys.tolist(), slots.tolist()))
+        return True
@@ -0,0 +1,97 @@
+from src.trainers.enemy.search_state import SearchState
+
+
+class MoveOrdering:
+    """
+    Ordena los ataques de cada nodo para que la poda alfa-beta corte lo antes posible.
+
+    El orden es: primero el mejor movimiento guardado en la tabla de transposición, luego los
+    movimientos asesinos (killer moves) del mismo nivel del árbol y, por último, el resto según
+    el daño esperado (calculado con las reglas de `Combat`) y la tabla de historia.
+
+    Atributos:
+        MAX_KILLERS (int): Cantidad de movimientos asesinos que se guardan por nivel.
+        killers (list[list[tuple[int, int, int]]]): Movimientos que provocaron un corte, por nivel del árbol.
+        history (dict[tuple[int, int, int], int]): Puntaje acumulado por los cortes de cada movimiento.
+    """
+
+    MAX_KILLERS = 2
+
+    def __init__(self) -> None:
+        """
+        Inicializa las tablas de movimientos asesinos e historia vacías.
+        """
+        self.killers: list[list[tuple[int, int, int]]] = []
+        self.history: dict[tuple[int, int, int], int] = {}
+
+    def new_search(self) -> None:
+        """
+        Prepara las tablas para una nueva búsqueda: los movimientos asesinos se descartan
+        y la historia se reduce a la mitad para que pese menos que la información nueva.
+        """
+        self.killers = []
+        self.history = {
+            move: score // 2 for move, score in self.history.items() if score > 1
+        }
+
+    def sort(
+        self,
+        state: SearchState,
+        side: int,
+        attacks: list[tuple[str, int]],
+        hash_move: int | None,
+    ) -> list[tuple[str, int]]:
+        """
+        Ordena los ataques de un nodo de mejor a peor candidato.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+            side (int): Índice del entrenador que ataca.
+            attacks (list[tuple[str, int]]): Ataques posibles (nombre y posición).
+            hash_move (int | None): Posición del mejor movimiento según la tabla de transposición.
+
+        Returns:
+            list[tuple[str, int]]: Ataques ordenados.
+        """
+        attacker = state.active[side]
+        damage = state.damage[side][attacker]
+        defender = state.active[1 - side]
+        ply = state.get_ply()
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+
+        def score(attack: tuple[str, int]) -> tuple[bool, bool, int, int]:
+            move = (side, attacker, attack[1])
+            return (
+                attack[1] == hash_move,
+                move in killers,
+                damage[attack[1]][defender],
+                self.history.get(move, 0),
+            )
+
+        return sorted(attacks, key=score, reverse=True)
+
+    def record_cutoff(
+        self, state: SearchState, side: int, slot: int, depth: int
+    ) -> None:
+        """
+        Registra un movimiento que provocó un corte alfa-beta.
+
+        Args:
+            state (SearchState): Estado compacto del combate (antes de aplicar el movimiento).
+            side (int): Índice del entrenador que atacó.
+            slot (int): Posición del movimiento.
+            depth (int): Profundidad restante del nodo donde ocurrió el corte.
+        """
+        move = (side, state.active[side], slot)
+        ply = state.get_ply()
+
+        while len(self.killers) <= ply:
+            self.killers.append([])
+
+        killers = self.killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.MAX_KILLERS :]
+
+        # Los cortes cerca de la raíz ahorran más trabajo, por eso pesan más
+        self.history[move] = self.history.get(move, 0) + depth * depth
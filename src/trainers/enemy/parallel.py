@@ -0,0 +1,196 @@
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Union
+from src.trainers.enemy.search_state import SearchState
+
+if TYPE_CHECKING:
+    from src.trainers.enemy.ia import Enemy
+
+# Nodo del árbol repartido entre procesos: un valor ya conocido, una búsqueda pendiente
+# en un proceso trabajador, o un nodo interno (si maximiza y sus hijos)
+SplitNode = Union[float, Future, tuple[bool, list["SplitNode"]]]
+
+
+def search_path(
+    pokemon: list,
+    options: dict,
+    payload: bytes,
+    path: tuple[int, ...],
+    depth: int,
+    maximizing: bool,
+) -> tuple[float, dict]:
+    """
+    Busca, dentro de un proceso trabajador, la posición a la que se llega aplicando `path` al estado.
+
+    Es una función de módulo para que pueda enviarse a otros procesos.
+
+    Args:
+        pokemon (list): Pokémon de la IA, para construir el buscador en el proceso trabajador.
+        options (dict): Opciones de búsqueda del enemigo original (tabla de transposición, ordenamiento).
+        payload (bytes): Estado compacto serializado con pickle.
+        path (tuple[int, ...]): Posiciones de los ataques a aplicar, empezando por la IA.
+        depth (int): Profundidad restante de búsqueda.
+        maximizing (bool): Indica si en la posición alcanzada le toca a la IA.
+
+    Returns:
+        tuple[float, dict]: Valor exacto de la posición y estadísticas de la búsqueda.
+    """
+    # Se importa aquí para evitar la importación circular con el módulo de la IA
+    from src.trainers.enemy.ia import Enemy
+
+    enemy = Enemy(pokemon, **options)
+    state: SearchState = pickle.loads(payload)
+    root_move = state.get_moves(SearchState.ENEMY)[path[0]]
+    started = time.perf_counter()
+
+    side = SearchState.ENEMY
+    for slot in path:
+        state.make_move(side, slot)
+        side = 1 - side
+
+    _, value = enemy.minmax(
+        state=state,
+        depth=depth,
+        alpha=float("-inf"),
+        beta=float("inf"),
+        maximizing=maximizing,
+    )
+
+    # El tiempo del subárbol se suma al del ataque de la raíz por el que se llega a él
+    enemy.stats.add_root_time(move=root_move, seconds=time.perf_counter() - started)
+    if enemy.transposition_table is not None:
+        enemy.stats.add_transposition(
+            probes=enemy.transposition_table.probes,
+            hits=enemy.transposition_table.hits,
+        )
+    return value, enemy.stats.to_dict()
+
+
+class ParallelSearch:
+    """
+    Reparte la búsqueda Minimax entre varios procesos dividiendo el árbol cerca de la raíz.
+
+    Cada subárbol se busca con ventana completa en un proceso trabajador, de modo que su valor
+    es exacto; luego los valores se combinan con minimax en el proceso principal y se elige el
+    primer ataque de mayor valor en el mismo orden que usa la búsqueda secuencial. Así el
+    resultado no depende del orden en que terminan los procesos y coincide con el secuencial.
+
+    Atributos:
+        workers (int): Cantidad de procesos trabajadores.
+        split_depth (int): Niveles del árbol que se expanden en el proceso principal antes de repartir
+            (1 reparte los ataques de la raíz, 2 reparte cada par ataque-respuesta).
+    """
+
+    def __init__(self, workers: int, split_depth: int = 1):
+        """
+        Inicializa la búsqueda paralela. Los procesos se crean en la primera búsqueda.
+
+        Args:
+            workers (int): Cantidad de procesos trabajadores.
+            split_depth (int): Niveles que se expanden antes de repartir el trabajo.
+
+        Raises:
+            ValueError: Si la cantidad de procesos o la profundidad de división no son positivas.
+        """
+        if workers < 1 or split_depth < 1:
+            raise ValueError("workers and split_depth must be positive")
+
+        self.workers = workers
+        self.split_depth = split_depth
+        self.__executor: ProcessPoolExecutor | None = None
+
+    def search(
+        self,
+        enemy: "Enemy",
+        state: SearchState,
+        depth: int,
+        attacks: list[tuple[str, int]],
+        options: dict,
+    ) -> list[float]:
+        """
+        Calcula el valor exacto de cada ataque de la raíz repartiendo el trabajo entre procesos.
+
+        Args:
+            enemy (Enemy): Enemigo que realiza la búsqueda.
+            state (SearchState): Estado compacto en la raíz (le toca a la IA).
+            depth (int): Profundidad total de búsqueda.
+            attacks (list[tuple[str, int]]): Ataques de la raíz en el orden de la búsqueda secuencial.
+            options (dict): Opciones con las que se construye el buscador de cada proceso.
+
+        Returns:
+            list[float]: Valor de cada ataque, en el mismo orden que `attacks`.
+        """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        # El estado se serializa antes de recorrerlo, para que los procesos no vean cambios posteriores
+        payload = pickle.dumps(state)
+        pokemon = enemy.get_pokemon()
+
+        def split(path: tuple[int, ...], depth: int, maximizing: bool) -> SplitNode:
+            # Las hojas se evalúan aquí mismo, no vale la pena enviarlas a otro proceso
+            if depth == 0 or state.winner is not None:
+                _, value = enemy.minmax(
+                    state=state,
+                    depth=depth,
+                    alpha=float("-inf"),
+                    beta=float("inf"),
+                    maximizing=maximizing,
+                )
+                return value
+
+            if len(path) >= self.split_depth:
+                return self.__executor.submit(
+                    search_path, pokemon, options, payload, path, depth, maximizing
+                )
+
+            side = SearchState.ENEMY if maximizing else SearchState.PLAYER
+            children: list[SplitNode] = []
+            for _, slot in enemy.generate_possible_attacks(
+                state=state, is_ia=maximizing
+            ):
+                state.make_move(side, slot)
+                children.append(split(path + (slot,), depth - 1, not maximizing))
+                state.unmake_move()
+
+            return maximizing, children
+
+        roots: list[SplitNode] = []
+        for _, slot in attacks:
+            state.make_move(SearchState.ENEMY, slot)
+            roots.append(split((slot,), depth - 1, False))
+            state.unmake_move()
+
+        return [self.__resolve(node, enemy) for node in roots]
+
+    def __resolve(self, node: SplitNode, enemy: "Enemy") -> float:
+        """
+        Obtiene el valor de un nodo del árbol repartido, esperando a los procesos si hace falta.
+
+        Args:
+            node (SplitNode): Nodo a resolver.
+            enemy (Enemy): Enemigo cuyas estadísticas acumulan el trabajo de los procesos.
+
+        Returns:
+            float: Valor exacto del nodo.
+        """
+        if isinstance(node, Future):
+            value, stats = node.result()
+            enemy.stats.add(stats)
+            return value
+
+        if isinstance(node, tuple):
+            maximizing, children = node
+            values = [self.__resolve(child, enemy) for child in children]
+            return max(values) if maximizing else min(values)
+
+        return node
+
+    def shutdown(self) -> None:
+        """
+        Detiene los procesos trabajadores, si se crearon.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
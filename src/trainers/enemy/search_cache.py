@@ -0,0 +1,250 @@
+import os
+import sqlite3
+import time
+
+
+class PersistentSearchCache:
+    """
+    Caché en disco de posiciones ya buscadas, que se conserva entre ejecuciones del juego.
+
+    Guarda, como la tabla de transposición, la profundidad, el tipo de cota, el valor y el mejor
+    movimiento de cada posición, pero en una base de datos SQLite local. Solo se guardan las
+    posiciones buscadas con al menos `min_depth` niveles, que son las que cuestan más y las pocas
+    que se consultan por búsqueda. Las posiciones nuevas se acumulan en memoria y se escriben
+    juntas en una sola transacción con `flush`, al terminar cada búsqueda.
+
+    La base usa el modo WAL, así que varios procesos del mismo equipo pueden leerla y escribirla
+    a la vez. Si se supera `max_size`, se eliminan las posiciones usadas hace más tiempo. Los
+    errores de la base (por ejemplo, si otro proceso la mantiene bloqueada demasiado tiempo) no
+    interrumpen la búsqueda: la caché simplemente no se usa en ese turno.
+
+    Atributos:
+        EVICTION (float): Fracción de las posiciones que se eliminan al superar `max_size`.
+        path (str): Ruta de la base de datos.
+        max_size (int): Tamaño máximo aproximado de la base, en bytes.
+        min_depth (int): Profundidad mínima de las posiciones que se guardan y consultan.
+        probes (int): Consultas realizadas.
+        hits (int): Consultas que encontraron la posición.
+        stores (int): Posiciones escritas en la base.
+        evictions (int): Posiciones eliminadas por tamaño.
+    """
+
+    EVICTION = 0.25
+
+    def __init__(self, path: str, max_size: int = 64 << 20, min_depth: int = 3):
+        """
+        Abre (o crea) la base de datos de la caché.
+
+        Args:
+            path (str): Ruta de la base de datos.
+            max_size (int): Tamaño máximo aproximado de la base, en bytes.
+            min_depth (int): Profundidad mínima de las posiciones que se guardan y consultan.
+
+        Raises:
+            ValueError: Si el tamaño máximo no es positivo.
+        """
+        if max_size <= 0:
+            raise ValueError("Search cache size must be positive")
+
+        self.path = path
+        self.max_size = max_size
+        self.min_depth = min_depth
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+        # Posiciones pendientes de escribir y posiciones leídas cuyo uso hay que registrar
+        self.__pending: dict[int, tuple[int, int, float, int | None]] = {}
+        self.__used: set[int] = set()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Sin transacciones implícitas: las escrituras se agrupan explícitamente en `flush`
+        self.__connection = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS positions ("
+            "key INTEGER PRIMARY KEY, depth INTEGER NOT NULL, flag INTEGER NOT NULL, "
+            "value REAL NOT NULL, move INTEGER, used REAL NOT NULL)"
+        )
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS positions_used ON positions (used)"
+        )
+
+    @staticmethod
+    def __to_row_key(key: int) -> int:
+        """
+        Convierte una clave de 64 bits sin signo en el entero con signo que guarda SQLite.
+
+        Args:
+            key (int): Clave de la posición.
+
+        Returns:
+            int: Clave entre -2^63 y 2^63 - 1.
+        """
+        key &= (1 << 64) - 1
+        return key - (1 << 64) if key >= 1 << 63 else key
+
+    def probe(self, key: int) -> tuple[int, int, float, int | None] | None:
+        """
+        Busca una posición en la caché (primero entre las pendientes de escribir).
+
+        Args:
+            key (int): Clave de la posición.
+
+        Returns:
+            tuple[int, int, float, int | None] | None: Profundidad, tipo de cota, valor y
+            mejor movimiento guardados, o None si la posición no está en la caché.
+        """
+        self.probes += 1
+        key = self.__to_row_key(key)
+
+        entry = self.__pending.get(key)
+        if entry is None:
+            try:
+                row = self.__connection.execute(
+                    "SELECT depth, flag, value, move FROM positions WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            entry = tuple(row)
+            self.__used.add(key)
+
+        self.hits += 1
+        return entry
+
+    def store(
+        self, key: int, depth: int, flag: int, value: float, best_move: int | None
+    ) -> None:
+        """
+        Agrega una posición a las pendientes de escribir, si se buscó con suficiente profundidad.
+
+        Args:
+            key (int): Clave de la posición.
+            depth (int): Profundidad con la que se buscó la posición.
+            flag (int): Tipo de cota del valor.
+            value (float): Valor heurístico obtenido.
+            best_move (int | None): Posición del mejor movimiento encontrado.
+        """
+        if depth < self.min_depth:
+            return
+
+        key = self.__to_row_key(key)
+        entry = self.__pending.get(key)
+        if entry is None or entry[0] <= depth:
+            self.__pending[key] = (depth, flag, value, best_move)
+
+    def flush(self) -> None:
+        """
+        Escribe las posiciones pendientes y registra el uso de las leídas en una sola transacción.
+        Si la base supera el tamaño máximo, elimina las posiciones usadas hace más tiempo.
+
+        En cada posición se conserva el resultado más profundo, aunque lo haya escrito otro proceso.
+        """
+        if not self.__pending and not self.__used:
+            return
+
+        now = time.time()
+        rows = [
+            (key, depth, flag, value, move, now)
+            for key, (depth, flag, value, move) in self.__pending.items()
+        ]
+        used = [(now, key) for key in self.__used]
+        self.__pending.clear()
+        self.__used.clear()
+
+        try:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.__connection.executemany(
+                    "INSERT INTO positions (key, depth, flag, value, move, used) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET depth = excluded.depth, "
+                    "flag = excluded.flag, value = excluded.value, move = excluded.move, "
+                    "used = excluded.used WHERE excluded.depth >= positions.depth",
+                    rows,
+                )
+                self.__connection.executemany(
+                    "UPDATE positions SET used = ? WHERE key = ?", used
+                )
+                self.__evict()
+            except BaseException:
+                self.__connection.execute("ROLLBACK")
+                raise
+            self.__connection.execute("COMMIT")
+        except sqlite3.Error:
+            return
+
+        self.stores += len(rows)
+
+    def __evict(self) -> None:
+        """
+        Elimina las posiciones usadas hace más tiempo si la base supera el tamaño máximo.
+        Las páginas liberadas se reutilizan en las escrituras siguientes.
+        """
+        page_size, pages, free = (
+            self.__connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in ("page_size", "page_count", "freelist_count")
+        )
+        if (pages - free) * page_size <= self.max_size:
+            return
+
+        count = self.__connection.execute("SELECT COUNT(*) FROM positions").fetchone()[
+            0
+        ]
+        removed = max(1, int(count * self.EVICTION))
+        self.__connection.execute(
+            "DELETE FROM positions WHERE key IN "
+            "(SELECT key FROM positions ORDER BY used LIMIT ?)",
+            (removed,),
+        )
+        self.evictions += removed
+
+    def get_size(self) -> int:
+        """
+        Obtiene la cantidad de posiciones guardadas en la base.
+
+        Returns:
+            int: Número de posiciones.
+        """
+        return self.__connection.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def get_hit_rate(self) -> float:
+        """
+        Obtiene la proporción de consultas que encontraron la posición.
+
+        Returns:
+            float: Tasa de aciertos entre 0 y 1.
+        """
+        if self.probes == 0:
+            return 0.0
+
+        return self.hits / self.probes
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Obtiene las estadísticas de uso de la caché.
+
+        Returns:
+            dict[str, int | float]: Consultas, aciertos, tasa de aciertos, posiciones escritas
+            y posiciones eliminadas.
+        """
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.get_hit_rate(),
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        """
+        Escribe las posiciones pendientes y cierra la base de datos.
+        """
+        self.flush()
+        self.__connection.close()
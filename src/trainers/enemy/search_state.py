@@ -0,0 +1,372 @@
+import random
+from typing import TYPE_CHECKING
+import numpy as np
+from src.utils.cache import fingerprint
+
+if TYPE_CHECKING:
+    from src.combat.combat import Combat
+
+
+class SearchState:
+    """
+    Representación compacta y reversible de un combate, usada por la IA durante la búsqueda.
+
+    En lugar de copiar el combate completo por cada ataque simulado, se guardan solo los
+    valores que cambian (Pokémon activo, vida, entrenadores vivos, último ataque y ganador)
+    y se precalculan las tablas de daño y efectividad con las reglas de `Combat`. Los ataques
+    se aplican con `make_move` y se deshacen con `unmake_move`.
+
+    Cada estado mantiene además una clave de tipo Zobrist (`key`) que se actualiza de forma
+    incremental con cada ataque y que identifica la posición (equipos, Pokémon activos y vida),
+    de modo que la tabla de transposición reconozca posiciones alcanzadas por distintos caminos.
+
+    Atributos:
+        PLAYER (int): Índice del jugador en las listas del estado.
+        ENEMY (int): Índice de la IA en las listas del estado.
+        ROOT_ATTACK (int): Posición del ataque que estaba registrado en el combate original.
+        TURN_KEY (int): Valor que se combina con la clave cuando el turno es del jugador.
+        sizes (list[int]): Cantidad de Pokémon de cada entrenador.
+        max_health (list[list[int]]): Vida máxima de cada Pokémon de cada entrenador.
+        speed (list[list[int]]): Velocidad de cada Pokémon de cada entrenador.
+        names (list[tuple[str, ...]]): Nombres de los Pokémon de cada entrenador, en orden de salida.
+        move_names (list[list[tuple[str, str, str]]]): Nombres de los tres movimientos de cada Pokémon.
+        damage (list[list[list[list[int]]]]): Daño por [entrenador][atacante][movimiento][defensor].
+        effectiveness (list[list[list[list[float]]]]): Efectividad por [entrenador][atacante][defensor][ataque].
+        active (list[int]): Índice del Pokémon activo de cada entrenador.
+        health (list[int]): Vida actual del Pokémon activo de cada entrenador.
+        alive (list[bool]): Indica si cada entrenador aún tiene Pokémon disponibles.
+        attack (int): Posición del último ataque realizado (0, 1, 2 o ROOT_ATTACK).
+        winner (int | None): Índice del entrenador ganador, si existe.
+        zobrist (list[list[list[int]]]): Valores aleatorios por [entrenador][Pokémon][vida].
+        key (int): Clave Zobrist de la posición actual.
+    """
+
+    PLAYER = 0
+    ENEMY = 1
+    ROOT_ATTACK = 3
+    TURN_KEY = random.Random("turn").getrandbits(64)
+
+    def __init__(self, combat: "Combat"):
+        """
+        Construye el estado compacto a partir de un combate en curso.
+
+        Args:
+            combat (Combat): Combate del que se toma el estado actual.
+        """
+        trainers = combat.get_players()
+        teams = [trainer.get_pokemon() for trainer in trainers]
+        root_attack = combat.get_current_attack()
+
+        self.sizes = [len(team) for team in teams]
+        self.max_health = [[pokemon.get_hp() for pokemon in team] for team in teams]
+        self.speed = [[pokemon.get_speed() for pokemon in team] for team in teams]
+        self.names = [tuple(pokemon.get_name() for pokemon in team) for team in teams]
+        self.move_names = [
+            [
+                (
+                    pokemon.get_move_1_name(),
+                    pokemon.get_move_2_name(),
+                    pokemon.get_super_move_name(),
+                )
+                for pokemon in team
+            ]
+            for team in teams
+        ]
+
+        # Se toman el daño y la efectividad de los tres movimientos de cada Pokémon contra cada
+        # Pokémon rival de las tablas precalculadas del combate
+        table = combat.get_damage_table()
+        ids = [table.get_team_ids(team) for team in teams]
+        if None not in ids:
+            self.damage = [
+                table.damage[np.ix_(ids[side], range(3), ids[1 - side])].tolist()
+                for side in (self.PLAYER, self.ENEMY)
+            ]
+            move_effectiveness = [
+                table.effectiveness[np.ix_(ids[side], range(3), ids[1 - side])]
+                .transpose(0, 2, 1)
+                .tolist()
+                for side in (self.PLAYER, self.ENEMY)
+            ]
+        else:
+            self.damage = [
+                [
+                    [
+                        [
+                            combat.calculate_pokemon_damage(
+                                attacker=attacker, defender=defender, attack=move
+                            )
+                            for defender in teams[1 - side]
+                        ]
+                        for move in self.move_names[side][i]
+                    ]
+                    for i, attacker in enumerate(teams[side])
+                ]
+                for side in (self.PLAYER, self.ENEMY)
+            ]
+            move_effectiveness = [
+                [
+                    [
+                        [
+                            combat.calculate_pokemon_effectiveness(
+                                attacker=attacker, defender=defender, attack=move
+                            )
+                            for move in self.move_names[side][i]
+                        ]
+                        for defender in teams[1 - side]
+                    ]
+                    for i, attacker in enumerate(teams[side])
+                ]
+                for side in (self.PLAYER, self.ENEMY)
+            ]
+
+        # La efectividad usada por la heurística agrega, en la última posición, la del ataque
+        # registrado en el combate original
+        self.effectiveness = [
+            [
+                [
+                    [
+                        *move_effectiveness[side][i][j],
+                        combat.calculate_pokemon_effectiveness(
+                            attacker=attacker, defender=defender, attack=root_attack
+                        ),
+                    ]
+                    for j, defender in enumerate(teams[1 - side])
+                ]
+                for i, attacker in enumerate(teams[side])
+            ]
+            for side in (self.PLAYER, self.ENEMY)
+        ]
+
+        self.active = [trainer.get_current_index() for trainer in trainers]
+        self.health = [trainer.get_current_pokemon_health() for trainer in trainers]
+        self.alive = [trainer.is_alive() for trainer in trainers]
+        self.attack = self.ROOT_ATTACK
+        self.winner = None
+
+        winner = combat.get_winner()
+        if winner:
+            self.winner = (
+                self.PLAYER if winner == trainers[0].get_name() else self.ENEMY
+            )
+
+        # Los valores Zobrist se derivan del nombre de cada Pokémon y de su posición en el equipo,
+        # así la clave es la misma entre turnos y no se confunde entre equipos distintos
+        self.zobrist = [
+            [
+                self.__zobrist_keys(side, index, pokemon.get_name(), pokemon.get_hp())
+                for index, pokemon in enumerate(team)
+            ]
+            for side, team in enumerate(teams)
+        ]
+        team_names = "|".join(",".join(names) for names in self.names)
+        self.key = random.Random(team_names).getrandbits(64)
+        for side in (self.PLAYER, self.ENEMY):
+            self.key ^= self.zobrist[side][self.active[side]][self.health[side]]
+
+        self.__history: list[tuple[int, int, int, bool, int, int | None, int]] = []
+
+    @staticmethod
+    def __zobrist_keys(side: int, index: int, name: str, max_health: int) -> list[int]:
+        """
+        Genera los valores Zobrist de un Pokémon para cada valor de vida posible.
+
+        Args:
+            side (int): Índice del entrenador.
+            index (int): Posición del Pokémon en el equipo.
+            name (str): Nombre del Pokémon.
+            max_health (int): Vida máxima del Pokémon.
+
+        Returns:
+            list[int]: Un valor aleatorio de 64 bits para cada vida entre 0 y max_health.
+        """
+        generator = random.Random(f"{side}:{index}:{name}")
+        return [generator.getrandbits(64) for _ in range(max_health + 1)]
+
+    def flipped(self) -> "SearchState":
+        """
+        Crea una copia del estado con los entrenadores intercambiados, para que la IA pueda
+        buscar el ataque del jugador (por ejemplo, en combates entre dos IA).
+
+        La copia no conserva los ataques pendientes de deshacer: su estado inicial es la posición actual.
+
+        Returns:
+            SearchState: Estado en el que el jugador ocupa el lugar de la IA y viceversa.
+        """
+        state = SearchState.__new__(SearchState)
+        state.sizes = self.sizes[::-1]
+        state.max_health = self.max_health[::-1]
+        state.speed = self.speed[::-1]
+        state.names = self.names[::-1]
+        state.move_names = self.move_names[::-1]
+        state.damage = self.damage[::-1]
+        state.effectiveness = self.effectiveness[::-1]
+        state.active = self.active[::-1]
+        state.health = self.health[::-1]
+        state.alive = self.alive[::-1]
+        state.attack = self.attack
+        state.winner = None if self.winner is None else 1 - self.winner
+
+        # Los valores Zobrist dependen del lado de cada Pokémon, por eso se generan de nuevo
+        state.zobrist = [
+            [
+                self.__zobrist_keys(side, index, name, max_health)
+                for index, (name, max_health) in enumerate(
+                    zip(state.names[side], state.max_health[side])
+                )
+            ]
+            for side in (self.PLAYER, self.ENEMY)
+        ]
+        team_names = "|".join(",".join(names) for names in state.names)
+        state.key = random.Random(team_names).getrandbits(64)
+        for side in (self.PLAYER, self.ENEMY):
+            state.key ^= state.zobrist[side][state.active[side]][state.health[side]]
+
+        state.__history = []
+        return state
+
+    def get_key(self, maximizing: bool) -> int:
+        """
+        Obtiene la clave de la posición actual incluyendo a quién le toca atacar.
+
+        Args:
+            maximizing (bool): True si el turno es de la IA, False si es del jugador.
+
+        Returns:
+            int: Clave Zobrist de la posición.
+        """
+        return self.key if maximizing else self.key ^ self.TURN_KEY
+
+    def get_fingerprint(self) -> int:
+        """
+        Calcula una huella de los datos fijos de ambos equipos (Pokémon, vida máxima, velocidad,
+        movimientos, daño y efectividad), que no cambian durante el combate.
+
+        A diferencia de la clave Zobrist, que solo depende de los nombres y la vida, la huella
+        cambia si cambian los datos del juego, así que sirve para distinguir posiciones guardadas
+        en disco entre ejecuciones.
+
+        Returns:
+            int: Huella de 64 bits.
+        """
+        # La efectividad del ataque registrado en el combate original (última posición) no forma
+        # parte de los datos de los equipos
+        digest = fingerprint(
+            self.names,
+            self.max_health,
+            self.speed,
+            self.move_names,
+            self.damage,
+            [
+                [[row[:3] for row in attacker] for attacker in side]
+                for side in self.effectiveness
+            ],
+        )
+        return int(digest[:16], 16)
+
+    def get_ply(self) -> int:
+        """
+        Obtiene la cantidad de ataques aplicados desde el estado inicial (nivel en el árbol de búsqueda).
+
+        Returns:
+            int: Número de ataques pendientes de deshacer.
+        """
+        return len(self.__history)
+
+    def get_live_pokemon(self, side: int) -> int:
+        """
+        Obtiene la cantidad de Pokémon restantes con vida de un entrenador.
+
+        Args:
+            side (int): Índice del entrenador (PLAYER o ENEMY).
+
+        Returns:
+            int: Número de Pokémon restantes, 0 si el entrenador está fuera de combate.
+        """
+        if not self.alive[side]:
+            return 0
+
+        return self.sizes[side] - self.active[side]
+
+    def get_moves(self, side: int) -> tuple[str, str, str]:
+        """
+        Obtiene los nombres de los movimientos del Pokémon activo de un entrenador.
+
+        Args:
+            side (int): Índice del entrenador (PLAYER o ENEMY).
+
+        Returns:
+            tuple[str, str, str]: Movimiento 1, movimiento 2 y super movimiento.
+        """
+        return self.move_names[side][self.active[side]]
+
+    def get_effectiveness(self, side: int) -> float:
+        """
+        Obtiene la efectividad del último ataque tomando a `side` como atacante.
+
+        Args:
+            side (int): Índice del entrenador considerado atacante.
+
+        Returns:
+            float: Multiplicador de efectividad.
+        """
+        return self.effectiveness[side][self.active[side]][self.active[1 - side]][
+            self.attack
+        ]
+
+    def make_move(self, side: int, slot: int) -> None:
+        """
+        Aplica un ataque sobre el estado, guardando lo necesario para deshacerlo.
+
+        Args:
+            side (int): Índice del entrenador que ataca.
+            slot (int): Posición del movimiento (0, 1 o 2).
+        """
+        defender = 1 - side
+        index = self.active[defender]
+        self.__history.append(
+            (
+                defender,
+                index,
+                self.health[defender],
+                self.alive[defender],
+                self.attack,
+                self.winner,
+                self.key,
+            )
+        )
+
+        self.attack = slot
+        self.key ^= self.zobrist[defender][index][self.health[defender]]
+        health = (
+            self.health[defender] - self.damage[side][self.active[side]][slot][index]
+        )
+
+        if health > 0:
+            self.health[defender] = health
+            self.key ^= self.zobrist[defender][index][health]
+            return
+
+        # El Pokémon activo ha sido derrotado: entra el siguiente o el entrenador queda fuera de combate
+        if index < self.sizes[defender] - 1:
+            self.active[defender] = index + 1
+            self.health[defender] = self.max_health[defender][index + 1]
+            self.key ^= self.zobrist[defender][index + 1][self.health[defender]]
+            return
+
+        self.health[defender] = 0
+        self.alive[defender] = False
+        self.winner = side
+        self.key ^= self.zobrist[defender][index][0]
+
+    def unmake_move(self) -> None:
+        """
+        Deshace el último ataque aplicado con `make_move`.
+        """
+        defender, index, health, alive, attack, winner, key = self.__history.pop()
+        self.active[defender] = index
+        self.health[defender] = health
+        self.alive[defender] = alive
+        self.attack = attack
+        self.winner = winner
+        self.key = key
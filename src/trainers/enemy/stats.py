@@ -0,0 +1,159 @@
+import json
+import os
+import time
+
+
+class SearchStats:
+    """
+    Contadores de una búsqueda de la IA, útiles para medir el efecto de las optimizaciones.
+
+    Atributos:
+        nodes (int): Nodos visitados (incluye las hojas).
+        leaves (int): Nodos evaluados con la heurística.
+        cutoffs (int): Cortes alfa-beta producidos.
+        playouts (int): Simulaciones hasta el final del combate (búsqueda Monte Carlo).
+        depth (int): Profundidad alcanzada (0 si el ataque se tomó de la tabla de finales).
+        elapsed (float): Segundos que tardó la búsqueda.
+        root_times (dict[str, float]): Segundos dedicados a cada ataque de la raíz.
+        tt_probes (int): Consultas a la tabla de transposición.
+        tt_hits (int): Consultas a la tabla de transposición que encontraron la posición.
+        peak_memory (int | None): Pico de memoria reservada durante la búsqueda, en bytes, si se midió.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa los contadores en cero.
+        """
+        self.nodes = 0
+        self.leaves = 0
+        self.cutoffs = 0
+        self.playouts = 0
+        self.depth = 0
+        self.elapsed = 0.0
+        self.root_times: dict[str, float] = {}
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.peak_memory: int | None = None
+
+    def add(self, other: dict) -> None:
+        """
+        Suma los contadores de otra búsqueda (por ejemplo, la de un proceso trabajador).
+
+        El tiempo total y la memoria no se suman: los mide la búsqueda que agrega los resultados.
+
+        Args:
+            other (dict): Contadores a sumar, con el formato de `to_dict`.
+        """
+        self.nodes += other["nodes"]
+        self.leaves += other["leaves"]
+        self.cutoffs += other["cutoffs"]
+        self.playouts += other["playouts"]
+        self.depth = max(self.depth, other["depth"])
+        self.tt_probes += other["tt_probes"]
+        self.tt_hits += other["tt_hits"]
+        for move, seconds in other["root_times"].items():
+            self.add_root_time(move=move, seconds=seconds)
+
+    def add_root_time(self, move: str, seconds: float) -> None:
+        """
+        Acumula el tiempo dedicado a un ataque de la raíz.
+
+        Args:
+            move (str): Nombre del ataque.
+            seconds (float): Segundos a sumar.
+        """
+        self.root_times[move] = self.root_times.get(move, 0.0) + seconds
+
+    def add_transposition(self, probes: int, hits: int) -> None:
+        """
+        Suma las consultas y los aciertos de la tabla de transposición durante la búsqueda.
+
+        Args:
+            probes (int): Consultas a la tabla.
+            hits (int): Consultas que encontraron la posición.
+        """
+        self.tt_probes += probes
+        self.tt_hits += hits
+
+    def get_tt_hit_rate(self) -> float:
+        """
+        Calcula la proporción de consultas a la tabla de transposición que encontraron la posición.
+
+        Returns:
+            float: Tasa de aciertos entre 0 y 1, o 0 si no se consultó la tabla.
+        """
+        return self.tt_hits / self.tt_probes if self.tt_probes > 0 else 0.0
+
+    def get_nps(self) -> float:
+        """
+        Calcula los nodos visitados por segundo.
+
+        Returns:
+            float: Nodos por segundo, o 0 si no se midió el tiempo.
+        """
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def get_branching_factor(self) -> float:
+        """
+        Calcula el factor de ramificación efectivo: hijos visitados por cada nodo expandido.
+
+        Returns:
+            float: Promedio de hijos por nodo interno, o 0 si no se expandió ningún nodo.
+        """
+        interior = self.nodes - self.leaves
+        return (self.nodes - 1) / interior if interior > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Convierte las estadísticas en un diccionario, incluidos los valores derivados.
+
+        Returns:
+            dict: Contadores de la búsqueda, nodos por segundo, factor de ramificación y tasa de
+                aciertos de la tabla de transposición.
+        """
+        return {
+            "nodes": self.nodes,
+            "leaves": self.leaves,
+            "cutoffs": self.cutoffs,
+            "playouts": self.playouts,
+            "depth": self.depth,
+            "elapsed": self.elapsed,
+            "nps": self.get_nps(),
+            "branching_factor": self.get_branching_factor(),
+            "root_times": dict(self.root_times),
+            "tt_probes": self.tt_probes,
+            "tt_hits": self.tt_hits,
+            "tt_hit_rate": self.get_tt_hit_rate(),
+            "peak_memory": self.peak_memory,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SearchStats":
+        """
+        Reconstruye las estadísticas a partir de un diccionario creado con `to_dict`.
+
+        Args:
+            data (dict): Estadísticas en forma de diccionario.
+
+        Returns:
+            SearchStats: Estadísticas reconstruidas.
+        """
+        stats = cls()
+        stats.add(data)
+        stats.elapsed = data["elapsed"]
+        stats.peak_memory = data["peak_memory"]
+        return stats
+
+    def write_jsonl(self, path: str, **fields) -> None:
+        """
+        Agrega las estadísticas como una línea JSON al final de un archivo.
+
+        Args:
+            path (str): Ruta del archivo JSONL. Las carpetas se crean si no existen.
+            **fields: Datos adicionales del registro (por ejemplo, el ataque elegido).
+        """
+        record = {"time": time.time(), **fields, **self.to_dict()}
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,402 @@
+import os
+import zipfile
+import numpy as np
+from src.trainers.enemy.search_state import SearchState
+from src.utils.cache import fingerprint
+
+
+class Tablebase:
+    """
+    Tabla de finales de combate resuelta de forma exacta por análisis retrógrado.
+
+    Cubre los últimos `size` Pokémon de cada equipo. Cada posición se describe con la vida
+    restante de cada entrenador (la vida del Pokémon activo más la vida completa de los que
+    faltan por salir) y a quién le toca atacar, de modo que todas las posiciones del final caben
+    en un arreglo. Se usan las mismas reglas que `Combat`: el daño de las tablas del estado, el
+    turno alterno y, cuando un Pokémon es derrotado, el turno para el Pokémon más rápido (con
+    velocidades iguales el turno es aleatorio, y se toma el promedio de ambos casos).
+
+    El valor de cada posición es el resultado esperado para la IA: 1 si gana, -1 si pierde y 0
+    si el combate no termina (ambos entrenadores prefieren ataques que no causan daño). Los valores
+    se guardan multiplicados por `SCALE` como enteros de 8 bits, lo que es exacto porque en un
+    final de dos Pokémon por lado hay como mucho dos turnos decididos al azar.
+
+    Atributos:
+        VERSION (int): Versión del formato de los archivos; los de otra versión no se cargan.
+        SCALE (int): Factor por el que se multiplican los valores guardados.
+        CHANCE (int): Indica que el siguiente turno se decide al azar.
+        size (int): Cantidad máxima de Pokémon por entrenador que cubre la tabla.
+        names (list[tuple[str, ...]]): Pokémon del final de cada entrenador, en orden de salida.
+        fingerprint (str): Huella de los datos del final (vida máxima, velocidad, daño y
+            efectividad), que identifica el archivo de la tabla.
+        values (np.ndarray | None): Valor escalado por [turno][vida restante del jugador][vida restante de la IA].
+    """
+
+    VERSION = 1
+    SCALE = 4
+    CHANCE = -1
+
+    def __init__(self, state: SearchState, size: int = 2):
+        """
+        Describe el final de los equipos del estado. La tabla queda vacía hasta llamar a
+        `generate` o `load`.
+
+        Args:
+            state (SearchState): Estado compacto de un combate entre los dos equipos.
+            size (int): Cantidad máxima de Pokémon por entrenador que cubre la tabla.
+
+        Raises:
+            ValueError: Si `size` es mayor que 2, porque los valores dejarían de ser exactos.
+        """
+        if not 1 <= size <= 2:
+            raise ValueError("Tablebase size must be 1 or 2")
+
+        self.size = size
+        sides = (SearchState.PLAYER, SearchState.ENEMY)
+        counts = [min(size, state.sizes[side]) for side in sides]
+        first = [state.sizes[side] - counts[side] for side in sides]
+        self.names = [state.names[side][first[side] :] for side in sides]
+        self.values: np.ndarray | None = None
+
+        # Datos del final con índices relativos al primer Pokémon del final
+        max_health = [state.max_health[side][first[side] :] for side in sides]
+        self.__speed = [state.speed[side][first[side] :] for side in sides]
+        self.__damage = [
+            [
+                [row[first[1 - side] :] for row in state.damage[side][first[side] + i]]
+                for i in range(counts[side])
+            ]
+            for side in sides
+        ]
+
+        # Si cambian los datos del juego (poder de los movimientos, estadísticas o tabla de tipos),
+        # cambia la huella y no se carga una tabla guardada con los datos anteriores
+        self.fingerprint = fingerprint(
+            self.VERSION,
+            self.names,
+            max_health,
+            self.__speed,
+            self.__damage,
+            [
+                [
+                    [
+                        row[:3]
+                        for row in state.effectiveness[side][first[side] + i][
+                            first[1 - side] :
+                        ]
+                    ]
+                    for i in range(counts[side])
+                ]
+                for side in sides
+            ],
+        )
+
+        # Vida restante al entrar cada Pokémon: su vida y la de todos los que salen después
+        self.__entry = [
+            [sum(max_health[side][i:]) for i in range(counts[side] + 1)]
+            for side in sides
+        ]
+
+        # Para cada vida restante se guarda qué Pokémon está activo y con cuánta vida
+        self.__active: list[list[int]] = []
+        self.__health: list[list[int]] = []
+        for side in sides:
+            active, health = [0], [0]
+            for i in reversed(range(counts[side])):
+                for hp in range(1, max_health[side][i] + 1):
+                    active.append(i)
+                    health.append(hp)
+            self.__active.append(active)
+            self.__health.append(health)
+
+    def get_key(self) -> str:
+        """
+        Obtiene el identificador de la tabla (los Pokémon del final de cada entrenador).
+
+        Returns:
+            str: Identificador de la tabla.
+        """
+        return "|".join(",".join(names) for names in self.names)
+
+    def contains(self, state: SearchState) -> bool:
+        """
+        Indica si la tabla cubre la posición del estado.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+
+        Returns:
+            bool: True si ambos equipos coinciden con los de la tabla y ya están en el final.
+        """
+        if state.winner is not None:
+            return False
+
+        for side in (SearchState.PLAYER, SearchState.ENEMY):
+            first = state.sizes[side] - len(self.names[side])
+            if (
+                state.names[side][first:] != self.names[side]
+                or state.active[side] < first
+            ):
+                return False
+
+        return True
+
+    def generate(self) -> None:
+        """
+        Resuelve todas las posiciones del final por análisis retrógrado.
+
+        Cada ataque que causa daño reduce la vida restante del defensor, por lo que las posiciones
+        se resuelven de menor a mayor vida restante y sus sucesores ya están resueltos. Los únicos
+        ciclos son ataques sin daño de ambos lados sobre la misma posición: si ninguno de los dos
+        entrenadores prefiere salir del ciclo, el combate no termina y la posición vale 0.
+
+        Raises:
+            ValueError: Si algún valor no es exacto al multiplicarlo por `SCALE`.
+        """
+        player_total = self.__entry[SearchState.PLAYER][0]
+        enemy_total = self.__entry[SearchState.ENEMY][0]
+        # Se trabaja con listas de Python, más rápidas que NumPy para acceder elemento a elemento
+        # Si un entrenador se queda sin vida restante, el otro ganó
+        values = [
+            [
+                [
+                    1.0 if player == 0 else -1.0 if enemy == 0 else 0.0
+                    for enemy in range(enemy_total + 1)
+                ]
+                for player in range(player_total + 1)
+            ]
+            for _ in range(2)
+        ]
+
+        for player in range(1, player_total + 1):
+            for enemy in range(1, enemy_total + 1):
+                positions = [player, enemy]
+                best_enemy, enemy_passes = self.__best(
+                    values, SearchState.ENEMY, positions
+                )
+                best_player, player_passes = self.__best(
+                    values, SearchState.PLAYER, positions
+                )
+
+                # Un ataque sin daño solo devuelve el turno al rival sobre la misma posición
+                if enemy_passes and player_passes:
+                    enemy_value = max(best_enemy, min(best_player, 0.0))
+                    player_value = min(best_player, max(best_enemy, 0.0))
+                elif enemy_passes:
+                    player_value = best_player
+                    enemy_value = max(best_enemy, player_value)
+                elif player_passes:
+                    enemy_value = best_enemy
+                    player_value = min(best_player, enemy_value)
+                else:
+                    enemy_value, player_value = best_enemy, best_player
+
+                values[SearchState.ENEMY][player][enemy] = enemy_value
+                values[SearchState.PLAYER][player][enemy] = player_value
+
+        scaled = np.array(values) * self.SCALE
+        if not np.array_equal(scaled, np.rint(scaled)):
+            raise ValueError("Tablebase values are not exact at the stored scale")
+        self.values = scaled.astype(np.int8)
+
+    def __best(
+        self, values: list[list[list[float]]], side: int, positions: list[int]
+    ) -> tuple[float, bool]:
+        """
+        Calcula el mejor valor entre los ataques que causan daño de un entrenador.
+
+        Args:
+            values (list[list[list[float]]]): Valores (sin escalar) de las posiciones ya resueltas.
+            side (int): Entrenador que ataca.
+            positions (list[int]): Vida restante de cada entrenador.
+
+        Returns:
+            tuple[float, bool]: Mejor valor para el entrenador (infinito si ningún ataque causa
+                daño) e indicador de si tiene algún ataque sin daño.
+        """
+        best = float("-inf") if side == SearchState.ENEMY else float("inf")
+        passes = False
+
+        for slot in range(3):
+            mover, successor = self.__attack(side, slot, positions)
+            if successor == positions:
+                passes = True
+                continue
+
+            value = self.__value(values, mover, successor)
+            best = max(best, value) if side == SearchState.ENEMY else min(best, value)
+
+        return best, passes
+
+    def __attack(
+        self, side: int, slot: int, positions: list[int]
+    ) -> tuple[int | None, list[int]]:
+        """
+        Aplica un ataque sobre una posición del final.
+
+        Args:
+            side (int): Entrenador que ataca.
+            slot (int): Posición del movimiento (0, 1 o 2).
+            positions (list[int]): Vida restante de cada entrenador.
+
+        Returns:
+            tuple[int | None, list[int]]: A quién le toca después (un entrenador, CHANCE si se
+                decide al azar o None si el combate terminó) y la vida restante de cada entrenador.
+        """
+        defender = 1 - side
+        attacker = self.__active[side][positions[side]]
+        index = self.__active[defender][positions[defender]]
+        damage = self.__damage[side][attacker][slot][index]
+        successor = list(positions)
+
+        if self.__health[defender][positions[defender]] > damage:
+            successor[defender] -= damage
+            return defender, successor
+
+        # El Pokémon derrotado se reemplaza por el siguiente, que entra con la vida completa
+        successor[defender] = self.__entry[defender][index + 1]
+        if successor[defender] == 0:
+            return None, successor
+
+        speeds = [
+            self.__speed[trainer][self.__active[trainer][successor[trainer]]]
+            for trainer in (SearchState.PLAYER, SearchState.ENEMY)
+        ]
+        if speeds[SearchState.PLAYER] > speeds[SearchState.ENEMY]:
+            return SearchState.PLAYER, successor
+        if speeds[SearchState.PLAYER] < speeds[SearchState.ENEMY]:
+            return SearchState.ENEMY, successor
+        return self.CHANCE, successor
+
+    @classmethod
+    def __value(
+        cls,
+        values: "list[list[list[float]]] | np.ndarray",
+        mover: int | None,
+        positions: list[int],
+    ) -> float:
+        """
+        Obtiene el valor de la posición que sigue a un ataque.
+
+        Args:
+            values (list[list[list[float]]] | np.ndarray): Valores de las posiciones, indexados por [turno][jugador][IA].
+            mover (int | None): A quién le toca, CHANCE o None si el combate terminó.
+            positions (list[int]): Vida restante de cada entrenador.
+
+        Returns:
+            float: Valor de la posición (en la misma escala que `values`).
+        """
+        player, enemy = positions
+        if mover == cls.CHANCE:
+            return (
+                values[SearchState.PLAYER][player][enemy]
+                + values[SearchState.ENEMY][player][enemy]
+            ) / 2
+
+        # Con None el combate terminó y cualquier turno tiene el valor del ganador
+        return values[SearchState.ENEMY if mover is None else mover][player][enemy]
+
+    def __positions(self, state: SearchState) -> list[int]:
+        """
+        Convierte el estado en la vida restante de cada entrenador.
+
+        Args:
+            state (SearchState): Estado compacto del combate, contenido en la tabla.
+
+        Returns:
+            list[int]: Vida restante del jugador y de la IA.
+        """
+        return [
+            state.health[side]
+            + self.__entry[side][
+                state.active[side] - state.sizes[side] + len(self.names[side]) + 1
+            ]
+            for side in (SearchState.PLAYER, SearchState.ENEMY)
+        ]
+
+    def probe(self, state: SearchState) -> tuple[int, float] | None:
+        """
+        Busca en la tabla el mejor ataque de la IA en la posición del estado (le toca a la IA).
+
+        Entre ataques de igual valor se prefiere el que causa daño, y entre ellos el de mayor
+        daño, para que una posición ganada avance hacia la victoria en lugar de repetirse.
+
+        Args:
+            state (SearchState): Estado compacto del combate.
+
+        Returns:
+            tuple[int, float] | None: Posición del mejor ataque y su valor (entre -1 y 1), o None
+                si la tabla no está generada o no cubre la posición.
+        """
+        if self.values is None or not self.contains(state):
+            return None
+
+        positions = self.__positions(state)
+        best = None
+        for slot in range(3):
+            mover, successor = self.__attack(SearchState.ENEMY, slot, positions)
+            value = self.__value(self.values, mover, successor) / self.SCALE
+            progress = positions[SearchState.PLAYER] - successor[SearchState.PLAYER]
+            if best is None or (value, progress) > best[1:]:
+                best = (slot, value, progress)
+
+        return best[0], float(best[1])
+
+    def save(self, path: str) -> None:
+        """
+        Guarda la tabla en un archivo comprimido de NumPy, junto con la huella de sus datos.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Raises:
+            ValueError: Si la tabla no está generada.
+        """
+        if self.values is None:
+            raise ValueError("Tablebase has not been generated")
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Se escribe en un archivo temporal y se renombra, para que otro proceso que comparte la
+        # carpeta no lea una tabla a medio escribir
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(
+            temporary,
+            values=self.values,
+            player=np.array(self.names[SearchState.PLAYER]),
+            enemy=np.array(self.names[SearchState.ENEMY]),
+            fingerprint=np.array(self.fingerprint),
+        )
+        os.replace(temporary, path)
+
+    def load(self, path: str) -> bool:
+        """
+        Carga la tabla desde un archivo guardado con `save`.
+
+        Args:
+            path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si el archivo existe y corresponde a los mismos Pokémon y datos; False si
+                no existe, está dañado o es de otros datos.
+        """
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                names = [tuple(data["player"].tolist()), tuple(data["enemy"].tolist())]
+                values = data["values"]
+                digest = str(data["fingerprint"])
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return False
+
+        shape = (
+            2,
+            self.__entry[SearchState.PLAYER][0] + 1,
+            self.__entry[SearchState.ENEMY][0] + 1,
+        )
+        if digest != self.fingerprint or names != self.names or values.shape != shape:
+            return False
+
+        self.values = values
+        return True
@@ -0,0 +1,74 @@
+import numpy as np
+from src.combat.matchups import MatchupMatrix
+
+
+class TeamSelector:
+    """
+    Elige el equipo de la IA como respuesta al equipo del jugador, usando la matriz de
+    resultados uno contra uno.
+
+    Cada candidato recibe como puntaje la suma de sus resultados esperados contra los Pokémon
+    del jugador; se eligen los de mayor puntaje y salen al combate en ese orden, del mejor al
+    peor. La elección solo recorre una columna de la matriz por Pokémon del jugador, así que
+    tarda muy poco incluso con Pokédex mucho más grandes.
+
+    Atributos:
+        matrix (MatchupMatrix): Resultados esperados de cada par de Pokémon.
+    """
+
+    def __init__(self, matrix: MatchupMatrix):
+        """
+        Inicializa el selector.
+
+        Args:
+            matrix (MatchupMatrix): Resultados esperados de cada par de Pokémon.
+        """
+        self.matrix = matrix
+        self.__ids = {name: i for i, name in enumerate(matrix.names)}
+
+    def select(
+        self, opponents: list[str], size: int = 5, exclude: list[str] | None = None
+    ) -> list[str]:
+        """
+        Elige los Pokémon de la IA contra los Pokémon del jugador.
+
+        Args:
+            opponents (list[str]): Nombres de los Pokémon del jugador. Si está vacío, se eligen
+                los Pokémon con mejor resultado promedio contra toda la Pokédex.
+            size (int): Cantidad de Pokémon a elegir.
+            exclude (list[str] | None): Pokémon que no se pueden elegir, además de los del jugador.
+
+        Returns:
+            list[str]: Nombres de los Pokémon elegidos, en el orden en que salen al combate.
+
+        Raises:
+            ValueError: Si algún Pokémon no está en la matriz o no quedan suficientes candidatos.
+        """
+        unknown = [name for name in opponents if name not in self.__ids]
+        if unknown:
+            raise ValueError(f"Unknown Pokémon: {', '.join(unknown)}")
+
+        outcomes = self.matrix.outcomes
+        if opponents:
+            scores = outcomes[:, [self.__ids[name] for name in opponents]].sum(axis=1)
+        else:
+            scores = outcomes.mean(axis=1)
+
+        # Los Pokémon ya elegidos por el jugador (o excluidos) no pueden repetirse
+        blocked = [
+            self.__ids[name]
+            for name in [*opponents, *(exclude or [])]
+            if name in self.__ids
+        ]
+        scores = scores.astype(np.float64)
+        scores[blocked] = -np.inf
+
+        available = len(scores) - len(set(blocked))
+        if size > available:
+            raise ValueError("Not enough Pokémon left to build the team")
+
+        # Se buscan los mejores sin ordenar toda la Pokédex y luego se ordenan solo esos
+        # (los empates se resuelven por el orden de la Pokédex)
+        best = np.argpartition(-scores, size - 1)[:size] if size else []
+        best = sorted(best, key=lambda i: (-scores[i], i))
+        return [self.matrix.names[i] for i in best]
@@ -0,0 +1,139 @@
+class TranspositionTable:
+    """
+    Tabla de transposición de tamaño fijo para la búsqueda Minimax de la IA.
+
+    Guarda, por clave Zobrist de la posición, la profundidad buscada, el valor obtenido,
+    el tipo de cota de ese valor y la posición del mejor movimiento. Las entradas se ubican
+    en un arreglo de tamaño potencia de dos (clave & máscara); ante una colisión se conserva
+    la entrada más profunda, salvo que pertenezca a una búsqueda anterior.
+
+    Atributos:
+        EXACT (int): El valor guardado es exacto.
+        LOWER_BOUND (int): El valor guardado es una cota inferior (hubo corte beta).
+        UPPER_BOUND (int): El valor guardado es una cota superior (ningún movimiento superó alfa).
+        size (int): Cantidad máxima de entradas.
+        probes (int): Consultas realizadas.
+        hits (int): Consultas que encontraron la posición.
+        stores (int): Entradas guardadas.
+        replacements (int): Entradas que sobrescribieron a otra posición distinta.
+    """
+
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+
+    def __init__(self, size: int = 1 << 16):
+        """
+        Inicializa la tabla vacía.
+
+        Args:
+            size (int): Cantidad máxima de entradas. Se redondea a la potencia de dos superior.
+
+        Raises:
+            ValueError: Si el tamaño no es positivo.
+        """
+        if size <= 0:
+            raise ValueError("Transposition table size must be positive")
+
+        self.size = 1 << (size - 1).bit_length()
+        self.__mask = self.size - 1
+        self.__entries: list[tuple[int, int, int, float, int | None, int] | None] = [
+            None
+        ] * self.size
+        self.__generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def new_search(self) -> None:
+        """
+        Marca el inicio de una nueva búsqueda para que las entradas antiguas puedan reemplazarse.
+        """
+        self.__generation += 1
+
+    def clear(self) -> None:
+        """
+        Elimina todas las entradas y reinicia las estadísticas.
+        """
+        self.__entries = [None] * self.size
+        self.__generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def probe(self, key: int) -> tuple[int, int, float, int | None] | None:
+        """
+        Busca una posición en la tabla.
+
+        Args:
+            key (int): Clave Zobrist de la posición.
+
+        Returns:
+            tuple[int, int, float, int | None] | None: Profundidad, tipo de cota, valor y
+            mejor movimiento guardados, o None si la posición no está en la tabla.
+        """
+        self.probes += 1
+        entry = self.__entries[key & self.__mask]
+
+        if entry is None or entry[0] != key:
+            return None
+
+        self.hits += 1
+        return entry[1], entry[2], entry[3], entry[4]
+
+    def store(
+        self, key: int, depth: int, flag: int, value: float, best_move: int | None
+    ) -> None:
+        """
+        Guarda el resultado de buscar una posición.
+
+        Args:
+            key (int): Clave Zobrist de la posición.
+            depth (int): Profundidad con la que se buscó la posición.
+            flag (int): Tipo de cota del valor (EXACT, LOWER_BOUND o UPPER_BOUND).
+            value (float): Valor heurístico obtenido.
+            best_move (int | None): Posición del mejor movimiento encontrado.
+        """
+        index = key & self.__mask
+        entry = self.__entries[index]
+
+        # Política de reemplazo: se prefiere la entrada más profunda de la búsqueda actual
+        if entry is not None and entry[5] == self.__generation and entry[1] > depth:
+            return
+
+        if entry is not None and entry[0] != key:
+            self.replacements += 1
+
+        self.__entries[index] = (key, depth, flag, value, best_move, self.__generation)
+        self.stores += 1
+
+    def get_hit_rate(self) -> float:
+        """
+        Obtiene la proporción de consultas que encontraron la posición.
+
+        Returns:
+            float: Tasa de aciertos entre 0 y 1.
+        """
+        if self.probes == 0:
+            return 0.0
+
+        return self.hits / self.probes
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Obtiene las estadísticas de uso de la tabla.
+
+        Returns:
+            dict[str, int | float]: Consultas, aciertos, tasa de aciertos, entradas guardadas,
+            reemplazos y entradas ocupadas.
+        """
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.get_hit_rate(),
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "used": self.size - self.__entries.count(None),
+        }
@@ -46,6 +46,24 @@ class Trainer(ABC):
         """
         return self.__pokemon[self.__current]
 
+    def get_pokemon(self) -> list[Pokemon]:
+        """
+        Obtiene la lista completa de Pokémon del entrenador, en orden de salida al combate.
+
+        Returns:
+            list[Pokemon]: Lista de Pokémon del entrenador.
+        """
+        return self.__pokemon
+
+    def get_current_index(self) -> int:
+        """
+        Obtiene el índice del Pokémon actualmente en combate.
+
+        Returns:
+            int: Índice del Pokémon activo dentro de la lista del entrenador.
+        """
+        return self.__current
+
     def get_current_pokemon_health(self) -> int:
         """
         Obtiene la salud actual del Pokémon activo.
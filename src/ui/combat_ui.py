@@ -1,6 +1,7 @@
 import pygame
 import os
 from src.combat.combat import Combat, CombatState
+from src.trainers.enemy.background import BackgroundSearch
 
 
 # Clase encargada de manejar la interfaz gráfica del combate
@@ -27,6 +28,11 @@ class CombatUI:
         self.enemy_wait_time = 0
         self.enemy_turn_delay = 4000
 
+        # La búsqueda de la IA corre en un proceso aparte para que la ventana siga a 60 fps
+        self.enemy_search = BackgroundSearch(self.combat.get_players()[1])
+        # Mientras el jugador elige, la IA busca de antemano su respuesta a cada ataque posible
+        self.enemy_pondering = False
+
         # Control de mensajes de cambio de Pokémon
         self.change_message = ""
         self.show_change_message = False
@@ -68,6 +74,7 @@ class CombatUI:
             pygame.display.flip()
             clock.tick(60)
 
+        self.enemy_search.shutdown()
         pygame.quit()
 
     # Manejo de eventos (cerrar ventana, clics, etc.)
@@ -96,21 +103,33 @@ class CombatUI:
         state = self.combat.get_state()
         if state == CombatState.ENEMY_TURN:
             self.handle_enemy_turn_delay()
+        elif state == CombatState.PLAYER_TURN and not self.enemy_pondering:
+            self.enemy_search.ponder(self.combat)
+            self.enemy_pondering = True
 
     # Lógica para generar retraso en el turno enemigo (para mostrar la animación)
+    # La IA empieza a buscar su ataque en segundo plano al comenzar su turno y el resultado se usa
+    # al terminar el retraso; si la búsqueda aún no acaba, se sigue dibujando hasta que termine
     def handle_enemy_turn_delay(self):
         if self.enemy_wait_time == 0:
             self.enemy_wait_time = pygame.time.get_ticks()
+            if not self.enemy_search.is_running():
+                self.enemy_search.start(self.combat)
         else:
             current_time = pygame.time.get_ticks()
-            if current_time - self.enemy_wait_time >= self.enemy_turn_delay:
+            if (
+                current_time - self.enemy_wait_time >= self.enemy_turn_delay
+                and self.enemy_search.done()
+            ):
                 self.enemy_turn()
                 self.enemy_wait_time = 0
 
-    # Ejecuta el turno del enemigo
+    # Ejecuta el turno del enemigo con el ataque calculado en segundo plano
     def enemy_turn(self):
         prev_player_pokemon = self.combat.get_info_player()["pokemon_name"]
-        attack, damage = self.combat.enemy_set_attack()
+        attack, damage = self.combat.enemy_set_attack(
+            attack=self.enemy_search.result()
+        )
         name_pokemon = self.combat.get_info_enemy()["pokemon_name"]
         self.text_attack = f"IA: {name_pokemon} ha utilizado el ataque {attack} y causó {damage} de daño."
 
@@ -323,6 +342,9 @@ class CombatUI:
                 prev_enemy_pokemon = self.combat.get_info_enemy()["pokemon_name"]
 
                 damage = self.combat.set_attack(move_name)
+                # La elección ya se conoce: al empezar su turno la IA reutiliza la búsqueda anticipada
+                # que coincida y descarta las demás
+                self.enemy_pondering = False
                 name_pokemon = self.combat.get_info_player()["pokemon_name"]
                 self.text_attack = f"PLAYER: {name_pokemon} ha utilizado el ataque {move_name} y causó {damage} de daño."
 
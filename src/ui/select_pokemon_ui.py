@@ -1,33 +1,43 @@
 # Importamos todas las librerías necesarias
+# (requests, el combate y la IA se importan recién cuando se usan, para abrir antes la ventana)
 import pygame
-import requests
 import io
-from urllib.request import urlopen
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Importamos módulos propios del proyecto
 from src.dataset.dataset import Dataset
-from src.pokemon.pokemon import Pokemon
-from src.trainers.trainers import Player
-from src.trainers.enemy.ia import Enemy
-from src.combat.combat import Combat
-from src.ui.combat_ui import CombatUI
+from src.ui.sprite_cache import SpriteCache
 
 
 # Clase que representa cada botón individual de selección de Pokémon en pantalla
 class PokemonButton:
-    def __init__(self, name: str, image: pygame.surface, rect: pygame.Rect):
+    def __init__(
+        self, name: str, image: pygame.Surface | None, rect: pygame.Rect
+    ) -> None:
         """
         Inicializa el botón del Pokémon.
         :param name: Nombre del Pokémon.
-        :param image: Imagen del Pokémon (superficie pygame).
+        :param image: Imagen del Pokémon (superficie pygame), o None mientras se descarga.
         :param rect: Rectángulo donde se dibuja el botón.
         """
         self.name = name
-        self.image = pygame.transform.scale(image, (80, 80))  # Redimensionamos imagen
+        self.image = None
         self.rect = rect
         self.font = pygame.font.Font(None, 20)
+        if image is not None:
+            self.set_image(image)
 
-    def draw(self, surface: pygame.surface) -> None:
+    def set_image(self, image: pygame.Surface) -> None:
+        """
+        Asigna la imagen del botón, redimensionada.
+        """
+        self.image = pygame.transform.scale(image, (80, 80))
+
+    def draw(self, surface: pygame.Surface) -> None:
         """
         Dibuja el botón en la pantalla.
         """
@@ -35,7 +45,8 @@ class PokemonButton:
         pygame.draw.rect(surface, border_color, self.rect, border_radius=5)
         inner_rect = self.rect.inflate(-5, -5)
         pygame.draw.rect(surface, (255, 255, 255), inner_rect, border_radius=5)
-        surface.blit(self.image, (inner_rect.x + 10, inner_rect.y + 10))
+        if self.image is not None:
+            surface.blit(self.image, (inner_rect.x + 10, inner_rect.y + 10))
         text = self.font.render(self.name.capitalize(), True, (0, 0, 0))
         surface.blit(text, (inner_rect.x + 5, inner_rect.y + 90))
 
@@ -47,13 +58,200 @@ class PokemonButton:
 
 
 # Clase encargada de descargar y cachear imágenes desde la PokeAPI
+# Las descargas se hacen en segundo plano, con varios hilos que comparten las conexiones (una
+# sesión de requests), y la ventana solo convierte las imágenes ya descargadas: pygame debe
+# convertir las superficies en el hilo principal. La dirección de la API y la de las imágenes se
+# pueden cambiar al crear el cargador o con las variables de entorno POKEMON_GAME_API_URL y
+# POKEMON_GAME_SPRITE_URL (por ejemplo, para usar un servidor local).
+# Las URL y las imágenes se guardan en disco (SpriteCache): con la caché completa, el juego no usa
+# la red, y con POKEMON_GAME_OFFLINE=1 nunca la usa (los Pokémon sin imagen guardada no se muestran).
 class ImageLoader:
-    def __init__(self):
+    DEFAULT_API_URL = "https://pokeapi.co/api/v2"
+    # Comienzo de las URL de las imágenes que devuelve la PokeAPI
+    DEFAULT_SPRITE_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/"
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        sprite_base_url: str | None = None,
+        workers: int = 8,
+        timeout: float = 10.0,
+        sprite_cache: SpriteCache | None = None,
+        offline: bool | None = None,
+    ) -> None:
         """
         Inicializa el cargador de imágenes con caché para evitar llamadas duplicadas.
-        """
+        :param base_url: Dirección de la API. Si es None, se usa POKEMON_GAME_API_URL o la PokeAPI.
+        :param sprite_base_url: Dirección que reemplaza a DEFAULT_SPRITE_URL en las URL de las
+            imágenes. Si es None, se usa POKEMON_GAME_SPRITE_URL o las URL tal como las da la API.
+        :param workers: Descargas simultáneas como máximo.
+        :param timeout: Segundos de espera de cada pedido.
+        :param sprite_cache: Caché en disco. Si es None, se usa la de la carpeta de caché del juego.
+        :param offline: Si es True, solo se usan las imágenes guardadas en disco. Si es None, se
+            usa la variable de entorno POKEMON_GAME_OFFLINE.
+        """
+        self.base_url = (
+            base_url or os.environ.get("POKEMON_GAME_API_URL") or self.DEFAULT_API_URL
+        ).rstrip("/")
+        self.sprite_base_url = sprite_base_url or os.environ.get(
+            "POKEMON_GAME_SPRITE_URL"
+        )
+        if self.sprite_base_url:
+            self.sprite_base_url = self.sprite_base_url.rstrip("/") + "/"
+        self.workers = workers
+        self.timeout = timeout
+        self.offline = (
+            os.environ.get("POKEMON_GAME_OFFLINE", "") not in ("", "0")
+            if offline is None
+            else offline
+        )
+        self.sprite_cache = sprite_cache or SpriteCache()
         self.image_cache = {}  # Caché para URLs de imágenes
-        self.surface_cache = {}  # Caché para superficies pygame ya cargadas
+        # Caché para superficies pygame ya cargadas (None si fallaron)
+        self.surface_cache = {}
+
+        # Sesión, hilos y descargas se crean con la primera imagen que se pide
+        self.session = None
+        self.executor = None
+        self.waiting = deque()  # Nombres por descargar, en orden de prioridad
+        self.downloads = {}  # Bytes descargados (None si fallaron), por nombre
+        self.requested = set()  # Nombres pedidos que todavía no se convirtieron
+        self.condition = threading.Condition()
+
+    def get_session(self):
+        """
+        Crea (una sola vez) la sesión HTTP que comparten todos los hilos, con tantas conexiones
+        abiertas como descargas simultáneas.
+        """
+        with self.condition:
+            if self.session is None:
+                import requests
+
+                self.session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self.workers, pool_maxsize=self.workers
+                )
+                self.session.mount("http://", adapter)
+                self.session.mount("https://", adapter)
+            return self.session
+
+    def prefetch(self, pokemon_names: list[str], urgent: bool = False) -> None:
+        """
+        Empieza a descargar en segundo plano las imágenes que todavía no se pidieron.
+        :param pokemon_names: Nombres de los Pokémon, en el orden en que se descargan.
+        :param urgent: Si es True, se descargan antes que las pedidas anteriormente.
+        """
+        with self.condition:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="sprites"
+                )
+
+            names = [name.lower() for name in pokemon_names]
+            for name in reversed(names) if urgent else names:
+                if name in self.surface_cache:
+                    continue
+                if name in self.requested:
+                    # Si todavía espera su turno, se adelanta
+                    if urgent and name in self.waiting:
+                        self.waiting.remove(name)
+                        self.waiting.appendleft(name)
+                    continue
+
+                self.requested.add(name)
+                if urgent:
+                    self.waiting.appendleft(name)
+                else:
+                    self.waiting.append(name)
+                # Cada tarea descarga la imagen que esté primera en la cola en ese momento
+                self.executor.submit(self.download_next)
+
+    def download_next(self) -> None:
+        """
+        Descarga la siguiente imagen de la cola (se ejecuta en un hilo del grupo).
+        """
+        with self.condition:
+            if not self.waiting:
+                return
+            name = self.waiting.popleft()
+
+        data = None
+        try:
+            data = self.download_image(name)
+        finally:
+            # Aunque la descarga falle, se registra para que nadie la siga esperando
+            with self.condition:
+                self.downloads[name] = data
+                self.condition.notify_all()
+
+    def download_image(self, pokemon_name: str) -> bytes | None:
+        """
+        Obtiene los bytes de la imagen del Pokémon de la caché en disco o, si no está, la descarga
+        y la guarda.
+        """
+        pokemon_name = pokemon_name.lower()
+        data = self.sprite_cache.get(pokemon_name)
+        if (
+            data is not None
+            or self.offline
+            or self.sprite_cache.is_missing(pokemon_name)
+        ):
+            return data
+
+        url = self.get_pokemon_image_url(pokemon_name)
+        if not url:
+            return None
+
+        try:
+            response = self.get_session().get(
+                self.get_sprite_url(url), timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            print(f"Error cargando imagen desde URL {url}: {e}")
+            return None
+
+        self.sprite_cache.put(pokemon_name, url, response.content)
+        return response.content
+
+    def get_sprite_url(self, url: str) -> str:
+        """
+        Obtiene la dirección desde la que se descarga una imagen de la API, cambiando el
+        comienzo de la URL si se indicó otra dirección para las imágenes.
+        :param url: URL de la imagen, tal como la devuelve la API (y se guarda en la caché).
+        """
+        if self.sprite_base_url and url.startswith(self.DEFAULT_SPRITE_URL):
+            return self.sprite_base_url + url[len(self.DEFAULT_SPRITE_URL) :]
+        return url
+
+    def is_loading(self, pokemon_name: str) -> bool:
+        """
+        Indica si la imagen del Pokémon se está descargando.
+        """
+        return pokemon_name.lower() in self.requested
+
+    def get_image(self, pokemon_name: str, wait: bool = False) -> pygame.Surface | None:
+        """
+        Devuelve la imagen del Pokémon si ya se descargó, convirtiéndola en el hilo principal.
+        Si todavía no se pidió, empieza a descargarla antes que las demás.
+        :param wait: Si es True, espera a que termine la descarga.
+        """
+        name = pokemon_name.lower()
+        if name in self.surface_cache:
+            return self.surface_cache[name]
+
+        self.prefetch([name], urgent=True)
+        with self.condition:
+            if wait:
+                self.condition.wait_for(lambda: name in self.downloads)
+            if name not in self.downloads:
+                return None
+            data = self.downloads.pop(name)
+            self.requested.discard(name)
+
+        surface = self.load_image_from_bytes(data, name) if data else None
+        self.surface_cache[name] = surface
+        return surface
 
     def get_pokemon_image_url(self, pokemon_name: str) -> str | None:
         """
@@ -63,27 +261,52 @@ class ImageLoader:
         if pokemon_name in self.image_cache:
             return self.image_cache[pokemon_name]
 
-        url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_name}/"
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            image_url = data["sprites"]["front_default"]
-            self.image_cache[pokemon_name] = image_url
+        image_url = self.sprite_cache.get_url(pokemon_name)
+        if (
+            image_url is not None
+            or self.offline
+            or self.sprite_cache.is_missing(pokemon_name)
+        ):
             return image_url
+
+        url = f"{self.base_url}/pokemon/{pokemon_name}/"
+        try:
+            response = self.get_session().get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                data = response.json()
+                image_url = data["sprites"]["front_default"]
+                self.image_cache[pokemon_name] = image_url
+                if image_url is None:
+                    self.sprite_cache.put_missing(pokemon_name)
+                return image_url
+            if response.status_code == 404:
+                # La API no conoce al Pokémon: no se vuelve a consultar en las próximas ejecuciones
+                self.sprite_cache.put_missing(pokemon_name)
+        except Exception as e:
+            print(f"Error consultando {url}: {e}")
         return None
 
+    def load_image_from_bytes(self, data: bytes, source: str) -> pygame.Surface | None:
+        """
+        Convierte los bytes de una imagen en superficie pygame (debe llamarse desde el hilo principal).
+        """
+        try:
+            return pygame.image.load(io.BytesIO(data)).convert_alpha()
+        except Exception as e:
+            print(f"Error cargando imagen de {source}: {e}")
+            return None
+
     def load_image_from_url(self, url: str) -> pygame.Surface | None:
         """
         Descarga la imagen desde la URL y la convierte en superficie pygame.
         """
         try:
-            response = urlopen(url)
-            image_data = io.BytesIO(response.read())
-            surface = pygame.image.load(image_data).convert_alpha()
-            return surface
+            response = self.get_session().get(url, timeout=self.timeout)
+            response.raise_for_status()
         except Exception as e:
             print(f"Error cargando imagen desde URL {url}: {e}")
             return None
+        return self.load_image_from_bytes(response.content, url)
 
     def get_scaled_image(
         self, pokemon_name: str, size: tuple[int, int]
@@ -91,27 +314,26 @@ class ImageLoader:
         """
         Devuelve la imagen escalada al tamaño deseado, utilizando la caché si es posible.
         """
-        pokemon_name = pokemon_name.lower()
-
-        if pokemon_name in self.surface_cache:
-            return pygame.transform.scale(self.surface_cache[pokemon_name], size)
-
-        if pokemon_name in self.image_cache:
-            url = self.image_cache[pokemon_name]
-            surface = self.load_image_from_url(url)
-            if surface:
-                self.surface_cache[pokemon_name] = surface
-                return pygame.transform.scale(surface, size)
-
-        url = self.get_pokemon_image_url(pokemon_name)
-        if url:
-            surface = self.load_image_from_url(url)
-            if surface:
-                self.surface_cache[pokemon_name] = surface
-                return pygame.transform.scale(surface, size)
-
+        surface = self.get_image(pokemon_name, wait=True)
+        if surface:
+            return pygame.transform.scale(surface, size)
         return None
 
+    def close(self) -> None:
+        """
+        Cancela las descargas pendientes, cierra las conexiones y guarda el índice de la caché.
+        """
+        with self.condition:
+            executor, self.executor = self.executor, None
+            # Las imágenes que no llegaron a descargarse se pueden volver a pedir después
+            self.requested.difference_update(self.waiting)
+            self.waiting.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.session is not None:
+            self.session.close()
+        self.sprite_cache.flush()
+
 
 # Clase principal de la pantalla de selección de los equipos
 class PokemonSelectionScreen:
@@ -119,10 +341,23 @@ class PokemonSelectionScreen:
         """
         Inicializa la pantalla de selección.
         """
+        self.started = time.perf_counter()
+        self.first_frame_time = (
+            None  # Segundos desde la creación hasta el primer cuadro
+        )
         self.data = Dataset()
+        # La tabla de daño y el selector del equipo de la IA se calculan la primera vez que se
+        # necesitan (al pedir el equipo automático o al empezar el combate)
+        self.damage_table = None
+        self.team_selector = None
         self.image_loader = ImageLoader()
         self.name_pokemons = self.data.get_all_pokemon_names()
-        self.pokemon_buttons = []
+        # Botones ya creados por nombre; solo se crean los de los Pokémon visibles
+        self.pokemon_buttons = {}
+        self.visible_buttons = []
+        self.search_text = ""  # Comienzo del nombre de los Pokémon que se muestran
+        self.page_size = 24  # Botones que caben en la cuadrícula (6 columnas y 4 filas)
+        self.visible_names = self.name_pokemons[: self.page_size]
         self.current_selector = "player"  # Turno actual de selección
         self.select_player = []  # Pokémon seleccionados por el jugador
         self.select_ia = []  # Pokémon seleccionados por la IA
@@ -133,22 +368,71 @@ class PokemonSelectionScreen:
         self.bg_color = (255, 255, 255)
         self.running = True
 
-    def run(self) -> None:
+    def get_damage_table(self):
+        """
+        Obtiene el daño y la efectividad de toda la Pokédex, calculados una sola vez para todos
+        los combates.
+        """
+        if self.damage_table is None:
+            from src.combat.combat import Combat
+            from src.combat.damage_table import DamageTable
+            from src.pokemon.pokemon import Pokemon
+
+            roster = [Pokemon(data) for data in self.data.get_all_pokemon()]
+            self.damage_table = DamageTable(
+                roster=roster,
+                level=Combat.DEFAULT_POKEMON_LEVEL,
+            )
+        return self.damage_table
+
+    def get_team_selector(self):
+        """
+        Obtiene el selector del equipo de la IA, con los resultados uno contra uno (guardados en
+        disco) de toda la Pokédex.
+        """
+        if self.team_selector is None:
+            from src.combat.combat import Combat
+            from src.combat.matchups import MatchupMatrix
+            from src.pokemon.pokemon import Pokemon
+            from src.trainers.enemy.team_selection import TeamSelector
+
+            roster = [Pokemon(data) for data in self.data.get_all_pokemon()]
+            self.team_selector = TeamSelector(
+                MatchupMatrix.load_or_build(
+                    roster,
+                    Combat.DEFAULT_POKEMON_LEVEL,
+                    damage_table=self.get_damage_table(),
+                )
+            )
+        return self.team_selector
+
+    def run(self, max_frames: int | None = None) -> None:
         """
         Bucle principal de la ventana.
+        :param max_frames: Si se indica, la ventana se cierra después de esa cantidad de cuadros
+            (para medir el arranque).
         """
         pygame.init()
         self.font = pygame.font.Font(None, 36)
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Selecciona los Pokémons para la Batalla")
         clock = pygame.time.Clock()
+        frames = 0
+        # Se descargan en segundo plano las imágenes de toda la Pokédex, primero las visibles
+        self.image_loader.prefetch(self.visible_names + self.name_pokemons)
 
         while self.running:
             self.handle_events()
             if self.running:
                 self.update_screen()
+                if self.first_frame_time is None:
+                    self.first_frame_time = time.perf_counter() - self.started
+                frames += 1
+                if max_frames is not None and frames >= max_frames:
+                    break
                 clock.tick(60)
 
+        self.image_loader.close()
         pygame.quit()
 
     def handle_events(self) -> None:
@@ -161,6 +445,29 @@ class PokemonSelectionScreen:
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 pos = pygame.mouse.get_pos()
                 self.handle_mouse_click(pos)
+            elif event.type == pygame.KEYDOWN:
+                self.handle_key(event)
+
+    def handle_key(self, event: pygame.event.Event) -> None:
+        """
+        Escribe o borra en la búsqueda y muestra los Pokémon cuyo nombre empieza con el texto.
+        """
+        if event.key == pygame.K_BACKSPACE:
+            self.search_text = self.search_text[:-1]
+        elif event.key == pygame.K_ESCAPE:
+            self.search_text = ""
+        elif event.unicode and event.unicode.isprintable():
+            self.search_text += event.unicode
+        else:
+            return
+
+        names = (
+            self.data.search_by_prefix(self.search_text)
+            if self.search_text
+            else self.name_pokemons
+        )
+        self.visible_names = names[: self.page_size]
+        self.image_loader.prefetch(self.visible_names, urgent=True)
 
     def handle_mouse_click(self, pos: tuple[int, int]) -> None:
         """
@@ -168,10 +475,12 @@ class PokemonSelectionScreen:
         """
         if self.switch_button.collidepoint(pos):
             self.switch_selector()
+        elif self.auto_button.collidepoint(pos):
+            self.auto_select_ia()
         elif self.battle_button.collidepoint(pos):
             self.confirm_selection()
 
-        for button in self.pokemon_buttons:
+        for button in self.visible_buttons:
             if button.is_clicked(pos):
                 self.toggle_selection(button.name)
                 break
@@ -210,23 +519,29 @@ class PokemonSelectionScreen:
         """
         x, y = 50, 50
         max_width = 800
-
-        for i, name in enumerate(self.name_pokemons):
-            if len(self.pokemon_buttons) <= i:
-                url = self.image_loader.get_pokemon_image_url(name)
-                image = self.image_loader.load_image_from_url(url) if url else None
-
-                if image:
-                    rect = pygame.Rect(x, y, 100, 120)
-                    button = PokemonButton(name, image, rect)
-                    self.pokemon_buttons.append(button)
-
-            if i < len(self.pokemon_buttons):
-                self.pokemon_buttons[i].draw(self.screen)
-                x += 120
-                if x + 100 > max_width:
-                    x = 50
-                    y += 150
+        self.visible_buttons = []
+
+        for name in self.visible_names:
+            button = self.pokemon_buttons.get(name)
+            if button is None:
+                button = PokemonButton(name, None, pygame.Rect(0, 0, 100, 120))
+                self.pokemon_buttons[name] = button
+
+            # La imagen se toma cuando termina de descargarse, sin detener la ventana
+            if button.image is None:
+                image = self.image_loader.get_image(name)
+                if image is not None:
+                    button.set_image(image)
+                elif not self.image_loader.is_loading(name):
+                    continue  # No se pudo cargar la imagen: el Pokémon no se muestra
+
+            button.rect.topleft = (x, y)
+            button.draw(self.screen)
+            self.visible_buttons.append(button)
+            x += 120
+            if x + 100 > max_width:
+                x = 50
+                y += 150
 
     def draw_sidebar_panel(self) -> None:
         """
@@ -235,6 +550,7 @@ class PokemonSelectionScreen:
         self.draw_sidebar()
         self.draw_current_turn()
         self.draw_selected_teams()
+        self.draw_search()
         self.draw_action_buttons()
 
     def draw_sidebar(self) -> None:
@@ -278,12 +594,26 @@ class PokemonSelectionScreen:
             text = font_small.render(f"- {name.capitalize()}", True, (0, 0, 0))
             self.screen.blit(text, (panel_x + 20, 330 + i * 25))
 
+    def draw_search(self) -> None:
+        """
+        Muestra el texto de búsqueda (se escribe con el teclado).
+        """
+        panel_x = 800
+        font_small = pygame.font.Font(None, 24)
+        text = font_small.render(f"Buscar: {self.search_text}_", True, (0, 0, 0))
+        self.screen.blit(text, (panel_x + 10, 475))
+
     def draw_action_buttons(self) -> None:
         """
-        Dibuja los botones de acción: cambiar turno y comenzar batalla.
+        Dibuja los botones de acción: equipo automático de la IA, cambiar turno y comenzar batalla.
         """
         panel_x = 800
 
+        self.auto_button = pygame.Rect(panel_x + 30, self.screen_height - 160, 140, 40)
+        pygame.draw.rect(self.screen, (50, 50, 200), self.auto_button, border_radius=10)
+        auto_text = self.font.render("IA auto", True, (255, 255, 255))
+        self.screen.blit(auto_text, auto_text.get_rect(center=self.auto_button.center))
+
         self.switch_button = pygame.Rect(
             panel_x + 30, self.screen_height - 110, 140, 40
         )
@@ -311,6 +641,12 @@ class PokemonSelectionScreen:
         self.current_selector = "IA" if self.current_selector == "player" else "player"
         # print(f"Selector actual: {self.current_selector}")
 
+    def auto_select_ia(self) -> None:
+        """
+        Elige el equipo de la IA como respuesta a los Pokémon elegidos por el jugador.
+        """
+        self.select_ia = self.get_team_selector().select(self.select_player, size=5)
+
     def load_imgs_pokemons(self):
         """
         Carga y escala las imágenes de los Pokémon seleccionados para el combate.
@@ -330,6 +666,13 @@ class PokemonSelectionScreen:
         Inicia el combate si ambos equipos tienen 5 Pokémon.
         """
         if len(self.select_player) == 5 and len(self.select_ia) == 5:
+            from src.combat.combat import Combat
+            from src.pokemon.pokemon import Pokemon
+            from src.trainers.enemy.ia import Enemy
+            from src.trainers.enemy.opening_book import OpeningBook
+            from src.trainers.trainers import Player
+            from src.ui.combat_ui import CombatUI
+
             print("Selección confirmada, nos vamos a la batalla!")
             self.running = False
 
@@ -342,9 +685,13 @@ class PokemonSelectionScreen:
             ]
 
             player = Player(player_pokemons)
-            enemy = Enemy(enemy_pokemons)
-            combat = Combat(player, enemy)
+            # La IA toma los primeros ataques del libro de aperturas, si se generó
+            enemy = Enemy(enemy_pokemons, opening_book=OpeningBook.get_default_path())
+            combat = Combat(player, enemy, damage_table=self.get_damage_table())
             imgs_combat = self.load_imgs_pokemons()
+            # El combate se ejecuta dentro de este ciclo, así que las descargas se detienen (y se
+            # guarda el índice de la caché) antes de empezarlo y de crear el proceso de la IA
+            self.image_loader.close()
 
             combat_ui = CombatUI(combat, imgs_loaded=imgs_combat)
             combat_ui.run()
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from src.utils.cache import get_cache_dir
+
+
+class SpriteCache:
+    """
+    Caché en disco de las imágenes de los Pokémon, que se conserva entre ejecuciones del juego.
+
+    Cada imagen se guarda en un archivo cuyo nombre es la huella SHA-256 de su contenido, así que
+    las imágenes repetidas se guardan una sola vez y una imagen dañada se detecta al leerla. Un
+    índice (`index.json`) guarda, por Pokémon, la URL de su imagen (el dato que se consulta a la
+    API), la huella y el tamaño del archivo y cuándo se usó por última vez. Si los archivos superan
+    `max_size`, se eliminan los de los Pokémon usados hace más tiempo. También se recuerdan los
+    Pokémon para los que la API respondió que no hay imagen, para no volver a consultarlos.
+
+    Los métodos pueden llamarse desde varios hilos. El índice se escribe en disco con `flush`.
+
+    Atributos:
+        VERSION (int): Versión del índice; los índices de otra versión se descartan.
+        path (str): Carpeta de la caché.
+        max_size (int): Tamaño máximo de las imágenes guardadas, en bytes.
+        hits (int): Imágenes encontradas en la caché.
+        misses (int): Imágenes que no estaban en la caché.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | None = None, max_size: int = 32 << 20):
+        """
+        Abre la caché y carga su índice.
+
+        Args:
+            path (str | None): Carpeta de la caché. Si es None, se usa la del juego.
+            max_size (int): Tamaño máximo de las imágenes guardadas, en bytes.
+
+        Raises:
+            ValueError: Si el tamaño máximo no es positivo.
+        """
+        if max_size <= 0:
+            raise ValueError("Sprite cache size must be positive")
+
+        # La carpeta se crea al guardar la primera imagen: si no se puede escribir, la caché
+        # queda vacía y las imágenes se descargan (o faltan, sin conexión) como si no existiera
+        self.path = path or get_cache_dir("sprites", create=False)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__changed = False
+        # Datos de cada Pokémon: URL, huella y tamaño de la imagen y última vez que se usó
+        self.__entries: dict[str, dict] = {}
+
+        try:
+            with open(self.__get_index_path(), encoding="utf-8") as file:
+                index = json.load(file)
+            if index.get("version") == self.VERSION:
+                self.__entries = index["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.__entries = {}
+
+    def __get_index_path(self) -> str:
+        """
+        Obtiene la ruta del índice.
+
+        Returns:
+            str: Ruta de `index.json`.
+        """
+        return os.path.join(self.path, "index.json")
+
+    def __get_blob_path(self, digest: str) -> str:
+        """
+        Obtiene la ruta del archivo de una imagen, repartidos en subcarpetas por los dos primeros
+        caracteres de la huella.
+
+        Args:
+            digest (str): Huella SHA-256 de la imagen.
+
+        Returns:
+            str: Ruta del archivo.
+        """
+        return os.path.join(self.path, "blobs", digest[:2], f"{digest}.png")
+
+    def get_url(self, name: str) -> str | None:
+        """
+        Obtiene la URL de la imagen de un Pokémon, si ya se consultó a la API.
+
+        Args:
+            name (str): Nombre del Pokémon en minúsculas.
+
+        Returns:
+            str | None: URL de la imagen, o None si el Pokémon no está en la caché.
+        """
+        with self.__lock:
+            entry = self.__entries.get(name)
+            return None if entry is None else entry["url"]
+
+    def is_missing(self, name: str) -> bool:
+        """
+        Indica si la API ya respondió que el Pokémon no tiene imagen.
+
+        Args:
+            name (str): Nombre del Pokémon en minúsculas.
+
+        Returns:
+            bool: True si el Pokémon no tiene imagen.
+        """
+        with self.__lock:
+            entry = self.__entries.get(name)
+            return entry is not None and entry["sha256"] is None
+
+    def get(self, name: str) -> bytes | None:
+        """
+        Obtiene la imagen de un Pokémon. Si el archivo falta o su contenido no coincide con la
+        huella, se descarta.
+
+        Args:
+            name (str): Nombre del Pokémon en minúsculas.
+
+        Returns:
+            bytes | None: Contenido de la imagen, o None si no está en la caché.
+        """
+        with self.__lock:
+            entry = self.__entries.get(name)
+        if entry is None or entry["sha256"] is None:
+            self.misses += 1
+            return None
+
+        try:
+            with open(self.__get_blob_path(entry["sha256"]), "rb") as file:
+                data = file.read()
+        except OSError:
+            data = None
+
+        with self.__lock:
+            if data is None or hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                self.__entries.pop(name, None)
+                self.__changed = True
+                self.misses += 1
+                return None
+
+            entry["used"] = time.time()
+            self.__changed = True
+            self.hits += 1
+            return data
+
+    def put(self, name: str, url: str, data: bytes) -> None:
+        """
+        Guarda la imagen de un Pokémon y, si se supera el tamaño máximo, elimina las imágenes
+        usadas hace más tiempo.
+
+        Args:
+            name (str): Nombre del Pokémon en minúsculas.
+            url (str): URL de la imagen.
+            data (bytes): Contenido de la imagen.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.__get_blob_path(digest)
+        if not os.path.exists(path):
+            # Se escribe en un archivo temporal y se renombra, para no dejar archivos a medio escribir
+            temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(temporary, "wb") as file:
+                    file.write(data)
+                os.replace(temporary, path)
+            except OSError:
+                self.__remove(temporary)
+                return
+
+        with self.__lock:
+            self.__entries[name] = {
+                "url": url,
+                "sha256": digest,
+                "size": len(data),
+                "used": time.time(),
+            }
+            self.__changed = True
+            self.__evict()
+
+    def put_missing(self, name: str) -> None:
+        """
+        Recuerda que el Pokémon no tiene imagen.
+
+        Args:
+            name (str): Nombre del Pokémon en minúsculas.
+        """
+        with self.__lock:
+            self.__entries[name] = {
+                "url": None,
+                "sha256": None,
+                "size": 0,
+                "used": time.time(),
+            }
+            self.__changed = True
+
+    def __evict(self) -> None:
+        """
+        Elimina las imágenes usadas hace más tiempo hasta que el total no supere el tamaño
+        máximo. Un archivo se borra cuando ningún Pokémon lo usa.
+        """
+        sizes = self.__get_sizes()
+        total = sum(sizes.values())
+        if total <= self.max_size:
+            return
+
+        references: dict[str, int] = {}
+        for entry in self.__entries.values():
+            if entry["sha256"] is not None:
+                references[entry["sha256"]] = references.get(entry["sha256"], 0) + 1
+
+        oldest = sorted(self.__entries, key=lambda name: self.__entries[name]["used"])
+        for name in oldest:
+            if total <= self.max_size:
+                break
+
+            digest = self.__entries.pop(name)["sha256"]
+            if digest is None:
+                continue
+            references[digest] -= 1
+            if references[digest] == 0:
+                total -= sizes[digest]
+                try:
+                    os.remove(self.__get_blob_path(digest))
+                except OSError:
+                    pass
+
+    def get_size(self) -> int:
+        """
+        Obtiene el tamaño de las imágenes guardadas.
+
+        Returns:
+            int: Tamaño en bytes (las imágenes repetidas cuentan una vez).
+        """
+        with self.__lock:
+            return sum(self.__get_sizes().values())
+
+    def __get_sizes(self) -> dict[str, int]:
+        """
+        Obtiene el tamaño de cada archivo de imagen guardado.
+
+        Returns:
+            dict[str, int]: Tamaño en bytes por huella.
+        """
+        return {
+            entry["sha256"]: entry["size"]
+            for entry in self.__entries.values()
+            if entry["sha256"] is not None
+        }
+
+    def flush(self) -> None:
+        """
+        Escribe el índice en disco, si cambió. Si no se puede escribir, los cambios se pierden
+        pero las imágenes ya guardadas no se dañan.
+        """
+        with self.__lock:
+            if not self.__changed:
+                return
+            index = {"version": self.VERSION, "entries": dict(self.__entries)}
+            self.__changed = False
+
+        path = self.__get_index_path()
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(index, file)
+            os.replace(temporary, path)
+        except OSError:
+            self.__remove(temporary)
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        """
+        Borra un archivo, si existe.
+
+        Args:
+            path (str): Ruta del archivo.
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,52 @@
+import hashlib
+import json
+import os
+
+# Carpeta donde el juego guarda los datos que se pueden volver a calcular (tablas, imágenes, etc.)
+# Se puede cambiar con la variable de entorno POKEMON_GAME_CACHE_DIR
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pokemon-game")
+
+
+def get_cache_dir(name: str = "", create: bool = True) -> str:
+    """
+    Obtiene la carpeta de caché del juego (o una subcarpeta), creándola si no existe.
+
+    Los archivos de la caché se pueden volver a calcular, así que quien solo la lee (o puede
+    seguir sin escribirla) debe usar `create=False` y crear la carpeta recién al guardar,
+    atrapando `OSError`: así una carpeta que no se puede escribir no impide abrir el juego.
+
+    Args:
+        name (str): Subcarpeta dentro de la caché. Si está vacío, se usa la carpeta principal.
+        create (bool): Si es False, solo se calcula la ruta, sin crear la carpeta.
+
+    Returns:
+        str: Ruta de la carpeta.
+
+    Raises:
+        OSError: Si `create` es True y la carpeta no se puede crear.
+    """
+    path = os.path.join(
+        os.environ.get("POKEMON_GAME_CACHE_DIR", DEFAULT_CACHE_DIR), name
+    )
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def fingerprint(*parts) -> str:
+    """
+    Calcula una huella de los datos de los que depende un archivo de la caché: si alguno
+    cambia, la huella también cambia y el archivo anterior deja de usarse.
+
+    Args:
+        *parts: Datos serializables a JSON (diccionarios, listas, números o textos).
+
+    Returns:
+        str: Huella SHA-256 en hexadecimal.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(
+            json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode()
+        )
+    return digest.hexdigest()
@@ -1,3 +1,5 @@
+import numpy as np
+
 # Diccionario que contiene la efectividad de cada tipo de Pokémon contra otros tipos.
 # Este diccionario se usa para calcular la efectividad de un ataque de un Pokémon contra otro Pokémon.
 # En caso de no estar el tipo de ataque en el diccionario, se asume que la efectividad es 1.0 (efectividad normal).
@@ -160,3 +162,37 @@ effectiveness: dict[str, dict[str, float]] = {
         "Acero": 0.5,
     },
 }
+
+# Tabla de efectividad compilada al importar el módulo: cada tipo recibe un identificador entero
+# y la efectividad queda en un arreglo de NumPy indexado por [tipo del ataque][tipo del defensor].
+# El último identificador (UNKNOWN_TYPE) representa cualquier tipo que no está en el diccionario,
+# con efectividad normal (1.0) en toda su fila y columna, igual que con effectiveness.get(..., 1.0).
+TYPE_IDS: dict[str, int] = {
+    name: i
+    for i, name in enumerate(
+        dict.fromkeys(
+            [
+                *effectiveness,
+                *(defender for row in effectiveness.values() for defender in row),
+            ]
+        )
+    )
+}
+UNKNOWN_TYPE = len(TYPE_IDS)
+TYPE_CHART = np.ones((UNKNOWN_TYPE + 1, UNKNOWN_TYPE + 1))
+for attacker, row in effectiveness.items():
+    for defender, value in row.items():
+        TYPE_CHART[TYPE_IDS[attacker], TYPE_IDS[defender]] = value
+
+
+def get_type_id(name: str) -> int:
+    """
+    Obtiene el identificador entero de un tipo en la tabla compilada.
+
+    Args:
+        name (str): Nombre del tipo.
+
+    Returns:
+        int: Identificador del tipo, o UNKNOWN_TYPE si no está en la tabla de efectividad.
+    """
+    return TYPE_IDS.get(name, UNKNOWN_TYPE)
@@ -1,46 +1,63 @@
-# Diccionario de movimientos que retorna el nombre, el poder para calcular el daño 
+import functools
+import os
+from src.dataset.dataset import DATA_DIR, Dataset
+
+# Diccionario de movimientos que retorna el nombre, el poder para calcular el daño
 # y el tipo del movimiento para el calculo de la efectividad.
+# Los movimientos se leen del archivo 'moves.csv' (junto a la Pokédex, con las columnas Nombre,
+# Tipo y Poder), con la misma caché binaria que el dataset de Pokémon. El archivo se lee la primera
+# vez que se piden los movimientos (con `get_moves`), no al importar el módulo.
+
+MOVES_PATH = os.path.join(DATA_DIR, "moves.csv")
+
+
+def load_moves(path: str | None = None) -> dict[str, dict[str, str | int]]:
+    """
+    Carga los movimientos del archivo CSV.
+
+    Args:
+        path (str | None): Ruta del archivo. Si es None, se usa 'moves.csv' del dataset.
+
+    Returns:
+        dict[str, dict[str, str | int]]: Tipo y poder de cada movimiento, por nombre. Los
+        movimientos sin poder (celda vacía) no tienen la clave "poder", así que no hacen daño.
+    """
+    table = Dataset(path=path or MOVES_PATH)
+    loaded = {}
+    for name, move_type, power in zip(
+        table.columns["Nombre"], table.columns["Tipo"], table.columns["Poder"]
+    ):
+        move = {"tipo": move_type}
+        if isinstance(power, int):
+            move["poder"] = power
+        loaded[name] = move
+    return loaded
+
+
+@functools.lru_cache(maxsize=None)
+def get_moves() -> dict[str, dict[str, str | int]]:
+    """
+    Obtiene los movimientos del juego, cargándolos de 'moves.csv' la primera vez.
+
+    Returns:
+        dict[str, dict[str, str | int]]: Tipo y poder de cada movimiento, por nombre.
+    """
+    return load_moves()
+
+
+def __getattr__(name: str):
+    """
+    Mantiene `from src.utils.moves import moves`, que ahora carga los movimientos al pedirlos.
+
+    Args:
+        name (str): Nombre del atributo del módulo.
 
-moves: dict[str, dict[str, str | int]] = {
-    "Hoja Afilada": {"tipo": "Planta", "poder": 55},
-    "Terremoto": {"tipo": "Tierra", "poder": 100},
-    "Rayo Solar": {"tipo": "Planta", "poder": 120},
-    "Garra Dragón": {"tipo": "Dragón", "poder": 80},
-    "Lanzallamas": {"tipo": "Fuego", "poder": 90},
-    "Llamarada": {"tipo": "Fuego", "poder": 110},
-    "Hidrobomba": {"tipo": "Agua", "poder": 110},
-    "Ice Beam": {"tipo": "Hielo", "poder": 90},
-    "Hidroariete": {"tipo": "Agua", "poder": 120},
-    "Impactrueno": {"tipo": "Eléctrico", "poder": 40},
-    "Trueno": {"tipo": "Eléctrico", "poder": 110},
-    "Voltio Cruel": {"tipo": "Eléctrico", "poder": 90},
-    "Martillazo": {"tipo": "Normal", "poder": 80},
-    "Megacuerno": {"tipo": "Bicho", "poder": 120},
-    "Mega Puño": {"tipo": "Normal", "poder": 80},
-    "Triataque": {"tipo": "Normal", "poder": 80},
-    "Hiperrayo": {"tipo": "Normal", "poder": 150},
-    "Giro Fuego": {"tipo": "Fuego", "poder": 100},
-    "Colmillo Ígneo": {"tipo": "Fuego", "poder": 65},
-    "Psíquico": {"tipo": "Psíquico", "poder": 90},
-    "Confusión": {"tipo": "Psíquico", "poder": 50},
-    "Psicorrayo": {"tipo": "Psíquico", "poder": 100},
-    "Sumisión": {"tipo": "Lucha", "poder": 80},
-    "Doble Patada": {"tipo": "Lucha", "poder": 60},
-    "Lanzarrocas": {"tipo": "Roca", "poder": 50},
-    "Explosión": {"tipo": "Normal", "poder": 250},
-    "Bola Sombra": {"tipo": "Fantasma", "poder": 80},
-    "Lengüetazo": {"tipo": "Fantasma", "poder": 30},
-    "Pulso Umbrío": {"tipo": "Fantasma", "poder": 80},
-    "Semilladora": {"tipo": "Planta", "poder": 80},
-    "Patada Salto Alta": {"tipo": "Lucha", "poder": 85},
-    "Mega Patada": {"tipo": "Lucha", "poder": 120},
-    "Contra": {"tipo": "Lucha", "poder": 80},
-    "Ultrapuño": {"tipo": "Lucha", "poder": 100},
-    "Roca Afilada": {"tipo": "Roca", "poder": 100},
-    "Enfado": {"tipo": "Dragón", "poder": 120},
-    "Placaje": {"tipo": "Normal", "poder": 40},
-    "Destructor": {"tipo": "Normal", "poder": 250},
-    "Mordisco": {"tipo": "Siniestro", "poder": 80},
-    "Ventisca": {"tipo": "Hielo", "poder": 110},
-}
+    Returns:
+        dict[str, dict[str, str | int]]: Movimientos del juego, si se pide `moves`.
 
+    Raises:
+        AttributeError: Si el módulo no tiene el atributo.
+    """
+    if name == "moves":
+        return get_moves()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
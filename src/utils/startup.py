@@ -0,0 +1,140 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+# Prefijo de la línea que escribe el juego (con --first-frame) al dibujar el primer cuadro
+FIRST_FRAME_PREFIX = "first-frame:"
+# Línea de `python -X importtime`: tiempo propio, tiempo acumulado y módulo (con sangría por nivel)
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+# Carpeta raíz del proyecto, desde la que se ejecuta `python -m src.main`
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int, int]]:
+    """
+    Lee la salida de `python -X importtime`.
+
+    Args:
+        output (str): Salida de error del proceso.
+
+    Returns:
+        list[tuple[str, int, int, int]]: Módulo, tiempo propio y tiempo acumulado (en
+        microsegundos) y nivel de anidamiento (0 para los que se importan directamente).
+    """
+    entries = []
+    for line in output.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match is not None:
+            own, cumulative, indent, module = match.groups()
+            entries.append((module, int(own), int(cumulative), (len(indent) - 1) // 2))
+    return entries
+
+
+def summarize_imports(entries: list[tuple[str, int, int, int]], top: int = 10) -> dict:
+    """
+    Resume los tiempos de importación por paquete y por módulo.
+
+    Args:
+        entries (list[tuple[str, int, int, int]]): Resultado de `parse_importtime`.
+        top (int): Cantidad de paquetes y módulos que se reportan.
+
+    Returns:
+        dict: Tiempo total, paquetes con más tiempo propio (sumando todos sus módulos) y
+        módulos del proyecto con más tiempo acumulado, en milisegundos.
+    """
+    packages: dict[str, int] = {}
+    for module, own, _, _ in entries:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + own
+
+    project = sorted(
+        (
+            (module, cumulative)
+            for module, _, cumulative, _ in entries
+            if module.split(".")[0] == "src"
+        ),
+        key=lambda entry: entry[1],
+        reverse=True,
+    )
+
+    return {
+        "total_ms": sum(cumulative for _, _, cumulative, depth in entries if depth == 0)
+        / 1000,
+        "packages": [
+            (package, own / 1000)
+            for package, own in sorted(
+                packages.items(), key=lambda entry: entry[1], reverse=True
+            )[:top]
+        ],
+        "modules": [
+            (module, cumulative / 1000) for module, cumulative in project[:top]
+        ],
+    }
+
+
+def profile_startup(top: int = 10) -> dict:
+    """
+    Abre el juego en un proceso nuevo con `python -X importtime`, lo cierra después del primer
+    cuadro de la pantalla de selección y resume los tiempos.
+
+    Los tiempos del primer cuadro incluyen el costo de medir las importaciones, que es pequeño.
+
+    Args:
+        top (int): Cantidad de paquetes y módulos que se reportan.
+
+    Returns:
+        dict: Resumen de `summarize_imports` más el tiempo hasta el primer cuadro (desde el
+        inicio de `src.main` y desde la creación de la pantalla), en milisegundos.
+
+    Raises:
+        RuntimeError: Si el juego termina sin dibujar el primer cuadro.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.main", "--first-frame"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    frame = None
+    for line in process.stdout.splitlines():
+        if line.startswith(FIRST_FRAME_PREFIX):
+            frame = json.loads(line[len(FIRST_FRAME_PREFIX) :])
+    if frame is None:
+        errors = [
+            line
+            for line in process.stderr.splitlines()
+            if not IMPORT_LINE.match(line) and not line.startswith("import time:")
+        ]
+        raise RuntimeError(
+            "The game exited before drawing the first frame:\n"
+            + "\n".join(errors[-20:])
+        )
+
+    return {**summarize_imports(parse_importtime(process.stderr), top=top), **frame}
+
+
+def format_report(profile: dict) -> str:
+    """
+    Arma el texto del resumen del arranque.
+
+    Args:
+        profile (dict): Resultado de `profile_startup`.
+
+    Returns:
+        str: Resumen para mostrar en la consola.
+    """
+    lines = [
+        f"Primer cuadro de la selección: {profile['first_frame_ms']:.0f} ms desde el inicio "
+        f"(pantalla: {profile['screen_first_frame_ms']:.0f} ms)",
+        f"Importaciones: {profile['total_ms']:.0f} ms",
+        "",
+        "Paquetes (tiempo propio de todos sus módulos):",
+        *(f"  {package:32} {ms:9.1f} ms" for package, ms in profile["packages"]),
+        "",
+        "Módulos del proyecto (tiempo acumulado):",
+        *(f"  {module:32} {ms:9.1f} ms" for module, ms in profile["modules"]),
+    ]
+    return "\n".join(lines)
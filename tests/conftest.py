@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# Las pruebas importan el proyecto como `src.…`, igual que `python -m src.main` desde la raíz
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# pygame sin ventana real, y una carpeta de caché propia para no usar ni modificar la del juego
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ["POKEMON_GAME_CACHE_DIR"] = tempfile.mkdtemp(prefix="pokemon-game-tests-")
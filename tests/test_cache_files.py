@@ -0,0 +1,184 @@
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import pytest
+from src.combat.combat import Combat
+from src.combat.matchups import MatchupMatrix
+from src.dataset.dataset import DATA_DIR, Dataset
+from src.pokemon.pokemon import Pokemon
+from src.trainers.enemy.ia import Enemy
+from src.trainers.enemy.opening_book import OpeningBook
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.enemy.tablebase import Tablebase
+from src.trainers.trainers import Player
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Ruta dentro de un archivo: ninguna carpeta se puede crear ahí
+UNWRITABLE = os.path.join(os.devnull, "cache")
+
+
+def truncate(path: str) -> None:
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[: len(data) // 2])
+
+
+def normalize(rows: list[dict]) -> list[dict]:
+    # NaN no es igual a sí mismo: las celdas vacías se comparan como None
+    return [
+        {
+            key: None if isinstance(value, float) and math.isnan(value) else value
+            for key, value in row.items()
+        }
+        for row in rows
+    ]
+
+
+def get_teams(seed: int, size: int) -> tuple[list[Pokemon], list[Pokemon]]:
+    dataset = Dataset()
+    names = random.Random(seed).sample(dataset.get_all_pokemon_names(), 2 * size)
+    team = [Pokemon(dataset.get_pokemon_by_name(name)) for name in names]
+    return team[:size], team[size:]
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        truncate,
+        lambda path: open(path, "wb").write(os.urandom(256)),
+        lambda path: open(path, "wb").write(b'{"version": 0}\n'),
+        lambda path: open(path, "wb").write(b"[1, 2]\n"),
+    ],
+    ids=["truncated", "random", "old-version", "not-an-object"],
+)
+def test_dataset_recovers_from_damaged_cache(tmp_path, damage):
+    expected = normalize(Dataset(cache_dir=str(tmp_path)).get_all_pokemon())
+    cache = tmp_path / "pokedex.bin"
+    damage(str(cache))
+
+    assert normalize(Dataset(cache_dir=str(tmp_path)).get_all_pokemon()) == expected
+    # La caché se volvió a generar y se puede usar
+    assert normalize(Dataset(cache_dir=str(tmp_path)).get_all_pokemon()) == expected
+
+
+def test_dataset_cache_follows_csv_changes(tmp_path):
+    path = tmp_path / "pokedex.csv"
+    shutil.copy(os.path.join(DATA_DIR, "pokedex.csv"), path)
+    cache_dir = str(tmp_path / "cache")
+    dataset = Dataset(path=str(path), cache_dir=cache_dir)
+    name = dataset.get_all_pokemon_names()[0]
+    hp = dataset.get_pokemon_by_name(name)["HP"]
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    header = lines[0].split(",")
+    row = lines[1].split(",")
+    row[header.index("HP")] = str(hp + 1)
+    lines[1] = ",".join(row)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    dataset = Dataset(path=str(path), cache_dir=cache_dir)
+    assert dataset.get_pokemon_by_name(name)["HP"] == hp + 1
+
+
+def test_dataset_works_without_writable_cache(monkeypatch):
+    expected = normalize(Dataset().get_all_pokemon())
+    monkeypatch.setenv("POKEMON_GAME_CACHE_DIR", UNWRITABLE)
+
+    assert normalize(Dataset().get_all_pokemon()) == expected
+    assert normalize(Dataset(cache_dir=UNWRITABLE).get_all_pokemon()) == expected
+
+
+def test_game_modules_import_without_writable_cache():
+    # Los movimientos se cargan la primera vez que se piden, sin caché si no se puede escribir
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from src.utils.moves import get_moves; import src.pokemon.pokemon; "
+            "print(len(get_moves()))",
+        ],
+        cwd=ROOT,
+        env={**os.environ, "POKEMON_GAME_CACHE_DIR": UNWRITABLE},
+        capture_output=True,
+        text=True,
+    )
+    assert process.returncode == 0, process.stderr
+    assert int(process.stdout) > 0
+
+
+def test_opening_book_ignores_damaged_file(tmp_path):
+    path = str(tmp_path / "book.npz")
+    book = OpeningBook()
+    book.entries = {1: 0, 2: 1}
+    book.save(path)
+    truncate(path)
+
+    assert not OpeningBook().load(path)
+    assert OpeningBook.open(path) is None
+    player, enemy = get_teams(seed=0, size=5)
+    assert Enemy(enemy, opening_book=path).opening_book is None
+
+
+def test_opening_book_without_cache_folder(monkeypatch):
+    monkeypatch.setenv("POKEMON_GAME_CACHE_DIR", UNWRITABLE)
+    player, enemy = get_teams(seed=0, size=5)
+
+    assert (
+        Enemy(enemy, opening_book=OpeningBook.get_default_path()).opening_book is None
+    )
+
+
+def test_matchup_matrix_rebuilds_damaged_cache(tmp_path):
+    roster = [Pokemon(data) for data in Dataset().get_all_pokemon()]
+    level = Combat.DEFAULT_POKEMON_LEVEL
+    matrix = MatchupMatrix.load_or_build(roster, level, cache_dir=str(tmp_path))
+    (path,) = tmp_path.glob("*.npz")
+    truncate(str(path))
+
+    rebuilt = MatchupMatrix.load_or_build(roster, level, cache_dir=str(tmp_path))
+    assert rebuilt.names == matrix.names
+    assert (rebuilt.outcomes == matrix.outcomes).all()
+
+    loaded = MatchupMatrix.__new__(MatchupMatrix)
+    assert loaded.load(str(path))
+
+    unsaved = MatchupMatrix.load_or_build(roster, level, cache_dir=UNWRITABLE)
+    assert (unsaved.outcomes == matrix.outcomes).all()
+
+
+def test_tablebase_rebuilds_damaged_file(tmp_path):
+    player, enemy = get_teams(seed=1, size=2)
+    ai = Enemy(enemy, tablebase_dir=str(tmp_path))
+    state = SearchState(Combat(Player(player), ai))
+    tablebase = Tablebase(state, size=2)
+    tablebase.generate()
+    path = str(tmp_path / f"{tablebase.fingerprint}.npz")
+    tablebase.save(path)
+    truncate(path)
+
+    assert not Tablebase(state, size=2).load(path)
+    # La IA genera la tabla de nuevo en lugar de fallar, y la vuelve a guardar
+    expected = state.get_moves(SearchState.ENEMY)[tablebase.probe(state)[0]]
+    assert ai.search_attack(state=state) == expected
+    assert Tablebase(state, size=2).load(path)
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+
+def test_tablebase_file_depends_on_game_data(tmp_path):
+    player, enemy = get_teams(seed=1, size=2)
+    state = SearchState(Combat(Player(player), Enemy(enemy)))
+    tablebase = Tablebase(state, size=2)
+    tablebase.generate()
+    path = str(tmp_path / "tablebase.npz")
+    tablebase.save(path)
+
+    changed = SearchState(Combat(Player(player), Enemy(enemy)))
+    changed.damage[SearchState.ENEMY][0][0][0] += 1
+    stale = Tablebase(changed, size=2)
+
+    assert stale.fingerprint != tablebase.fingerprint
+    assert not stale.load(path)
@@ -0,0 +1,179 @@
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pygame
+import pytest
+from src.ui.select_pokemon_ui import ImageLoader
+from src.ui.sprite_cache import SpriteCache
+
+NAMES = [f"pokemon{i}" for i in range(16)]
+WORKERS = 4
+
+
+class FakePokeAPI(ThreadingHTTPServer):
+    """
+    Servidor local con la forma de la PokeAPI: `/api/v2/pokemon/<nombre>/` devuelve el JSON con
+    la URL de la imagen (en raw.githubusercontent.com, como la API real) y `/sprites/...` la imagen.
+    Cada pedido tarda `delay` segundos, para que las descargas se superpongan.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, delay: float):
+        super().__init__(("127.0.0.1", 0), FakePokeAPIHandler)
+        self.delay = delay
+        self.png = make_png()
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.active = 0
+        self.max_parallel = 0
+
+    def get_url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+
+class FakePokeAPIHandler(BaseHTTPRequestHandler):
+    # Con HTTP/1.1 las conexiones quedan abiertas y la sesión puede reutilizarlas
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.active += 1
+            self.server.max_parallel = max(
+                self.server.max_parallel, self.server.active
+            )
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.active -= 1
+
+        parts = self.path.strip("/").split("/")
+        if parts[:3] == ["api", "v2", "pokemon"]:
+            sprite = f"{ImageLoader.DEFAULT_SPRITE_URL}sprites/pokemon/{parts[3]}.png"
+            body = json.dumps({"sprites": {"front_default": sprite}}).encode()
+            content_type = "application/json"
+        elif parts[0] == "sprites":
+            body = self.server.png
+            content_type = "image/png"
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_png() -> bytes:
+    """
+    Crea una imagen PNG de 96x96 como las de la PokeAPI.
+    """
+    surface = pygame.Surface((96, 96), pygame.SRCALPHA)
+    surface.fill((200, 20, 20, 255))
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, "sprite.png")
+    return buffer.getvalue()
+
+
+def get_sprite_threads() -> list[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("sprites")
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def display():
+    # Las superficies solo se pueden convertir con una ventana abierta
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def server():
+    server = FakePokeAPI(delay=0.05)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loader(server, tmp_path):
+    loader = ImageLoader(
+        base_url=server.get_url("/api/v2"),
+        sprite_base_url=server.get_url("/sprites"),
+        workers=WORKERS,
+        sprite_cache=SpriteCache(str(tmp_path)),
+        offline=False,
+    )
+    yield loader
+    loader.close()
+
+
+def test_prefetch_downloads_concurrently_with_shared_session(server, loader):
+    loader.prefetch(NAMES)
+    images = [loader.get_image(name, wait=True) for name in NAMES]
+
+    assert all(image is not None for image in images)
+    assert all(image.get_size() == (96, 96) for image in images)
+    # Un pedido a la API y otro a la imagen por Pokémon, varios a la vez
+    assert server.requests == 2 * len(NAMES)
+    assert server.max_parallel > 1
+    # Las conexiones se reutilizan: como mucho una por hilo
+    assert server.connections <= WORKERS
+
+
+def test_get_image_decodes_on_main_thread(loader, monkeypatch):
+    threads = []
+    load = pygame.image.load
+
+    def record_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(pygame.image, "load", record_thread)
+    loader.prefetch(NAMES)
+    for name in NAMES:
+        assert loader.get_image(name, wait=True) is not None
+
+    assert len(threads) == len(NAMES)
+    assert all(thread is threading.main_thread() for thread in threads)
+
+
+def test_close_stops_workers(server, loader):
+    loader.prefetch(NAMES)
+    assert loader.get_image(NAMES[0], wait=True) is not None
+    loader.close()
+
+    # Los hilos terminan la descarga en curso y no toman las pendientes
+    for thread in get_sprite_threads():
+        thread.join(timeout=5)
+    assert not get_sprite_threads()
+
+    requests = server.requests
+    time.sleep(0.2)
+    assert server.requests == requests
+    assert server.requests < 2 * len(NAMES)
+
+    # Una imagen que quedó pendiente se puede volver a pedir después de cerrar
+    pending = [name for name in NAMES if name not in loader.surface_cache][-1]
+    assert loader.get_image(pending, wait=True) is not None
@@ -0,0 +1,105 @@
+import random
+import pytest
+from src.combat.combat import Combat, CombatState
+from src.dataset.dataset import Dataset
+from src.pokemon.pokemon import Pokemon
+from src.trainers.enemy.ia import Enemy
+from src.trainers.enemy.search_state import SearchState
+from src.trainers.trainers import Player
+
+SEEDS = range(6)
+TURNS = 8
+
+
+def plain_minimax(
+    enemy: Enemy, state: SearchState, depth: int, maximizing: bool
+) -> float:
+    """
+    Minimax sin poda, tabla de transposición ni ordenamiento, con la misma heurística: el valor
+    de referencia con el que se compara la búsqueda optimizada.
+    """
+    if depth == 0 or state.winner is not None:
+        return enemy.evaluate_heuristic(state=state, maximizing=maximizing)
+
+    side = SearchState.ENEMY if maximizing else SearchState.PLAYER
+    values = []
+    for slot in range(3):
+        state.make_move(side, slot)
+        values.append(plain_minimax(enemy, state, depth - 1, not maximizing))
+        state.unmake_move()
+    return max(values) if maximizing else min(values)
+
+
+def new_combat(seed: int, **options) -> Combat:
+    dataset = Dataset()
+    names = random.Random(seed).sample(dataset.get_all_pokemon_names(), 10)
+    team = [Pokemon(dataset.get_pokemon_by_name(name)) for name in names]
+    return Combat(Player(team[:5]), Enemy(team[5:], **options))
+
+
+def enemy_positions(seed: int, depth: int):
+    """
+    Recorre un combate fijo y entrega cada posición en la que le toca a la IA. El jugador usa
+    siempre el ataque de mayor daño y la IA, el que elige su búsqueda.
+    """
+    # La tabla de finales da valores exactos en lugar de la heurística: se prueba aparte
+    combat = new_combat(seed, depth=depth, tablebase_size=0)
+    enemy = combat.get_players()[1]
+
+    for _ in range(TURNS):
+        state = combat.get_state()
+        if state == CombatState.WINNER:
+            return
+        if state == CombatState.ENEMY_TURN:
+            attack = yield combat, enemy
+            combat.enemy_set_attack(attack=attack)
+        else:
+            info = combat.get_info_player()
+            pokemon = combat.get_players()[0].get_current_pokemon()
+            moves = [
+                info["pokemon_attack_1"],
+                info["pokemon_attack_2"],
+                info["pokemon_super_attack"],
+            ]
+            combat.set_attack(max(moves, key=lambda move: pokemon.get_damage(move)))
+
+
+@pytest.mark.parametrize("depth", [2, 3, 4])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_default_search_matches_plain_minimax(seed, depth):
+    positions = enemy_positions(seed, depth)
+    checked = 0
+    try:
+        combat, enemy = next(positions)
+        while True:
+            state = SearchState(combat)
+            moves = state.get_moves(SearchState.ENEMY)
+            values = []
+            for slot in range(3):
+                state.make_move(SearchState.ENEMY, slot)
+                values.append(plain_minimax(enemy, state, depth - 1, False))
+                state.unmake_move()
+            best = max(values)
+
+            attack = enemy.choose_attack(combat=combat)
+            _, value = enemy.minmax(
+                state=SearchState(combat),
+                depth=depth,
+                alpha=float("-inf"),
+                beta=float("inf"),
+                maximizing=True,
+            )
+
+            # Con ataques empatados cualquiera de ellos es correcto
+            assert value == pytest.approx(best)
+            assert attack in [
+                moves[slot]
+                for slot in range(3)
+                if values[slot] == pytest.approx(best)
+            ]
+            checked += 1
+            combat, enemy = positions.send(attack)
+    except StopIteration:
+        pass
+
+    assert checked > 0
@@ -0,0 +1,32 @@
+import pytest
+from src.simulation.book import draw_book_teams
+from src.simulation.simulator import BattleSimulator
+
+
+@pytest.mark.parametrize(
+    "player_policy, enemy_policy",
+    [("random", "random"), ("greedy", "greedy"), ("greedy", "random")],
+)
+@pytest.mark.parametrize("seed, team_size", [(0, 5), (7, 3), (11, 1)])
+def test_batch_engine_matches_scalar_engine(
+    player_policy, enemy_policy, seed, team_size
+):
+    simulator = BattleSimulator(
+        player_policy=player_policy,
+        enemy_policy=enemy_policy,
+        team_size=team_size,
+        seed=seed,
+        engine="batch",
+        verify=50,
+    )
+    report = simulator.run(battles=200)
+
+    assert report.verified == 50
+    assert report.mismatches == []
+
+
+def test_team_size_larger_than_roster_is_rejected():
+    with pytest.raises(ValueError, match="Not enough Pokémon"):
+        BattleSimulator(team_size=13)
+    with pytest.raises(ValueError, match="Not enough Pokémon"):
+        draw_book_teams(battles=1, team_size=13, seed=0)